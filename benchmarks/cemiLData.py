@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+
+""" Python KNX framework
+
+CEMILData decoding microbenchmark
+
+Decodes a received group frame and reads its fields the way ETS.processFrame, L_DataService.dataInd and
+N_GroupDataService.dataInd do, with the cached slot based CEMILData, and with the previous implementation, which
+decoded the raw bytes and built a new object on each access. Reports the time per frame, and the number of address
+and priority constructor calls per frame.
+
+Usage: PYTHONPATH=. python benchmarks/cemiLData.py [n]
+"""
+
+import struct
+import sys
+import timeit
+
+from pyknyx.stack.cemi.cemiLData import CEMILData
+from pyknyx.stack.individualAddress import IndividualAddress
+from pyknyx.stack.groupAddress import GroupAddress
+from pyknyx.stack.priority import Priority
+
+
+class UncachedFrame(object):
+    """ Previous CEMILDataFrame: fields read from the raw bytes on each access
+    """
+    def __init__(self, frame):
+        self._raw = bytearray(frame)
+
+    @property
+    def addIL(self):
+        return self._raw[1]
+
+    @property
+    def mc(self):
+        return self._raw[0]
+
+    @property
+    def ctrl1(self):
+        return self._raw[2+self.addIL]
+
+    @property
+    def ctrl2(self):
+        return self._raw[3+self.addIL]
+
+    @property
+    def sa(self):
+        return struct.unpack(">H", self._raw[4+self.addIL:6+self.addIL])[0]
+
+    @property
+    def da(self):
+        return struct.unpack(">H", self._raw[6+self.addIL:8+self.addIL])[0]
+
+    @property
+    def npdu(self):
+        return self._raw[8+self.addIL:]
+
+
+class UncachedCEMILData(object):
+    """ Previous CEMILData: new address/priority objects on each access
+    """
+    def __init__(self, frame):
+        self._frame = UncachedFrame(frame)
+
+    @property
+    def frame(self):
+        return self._frame
+
+    @property
+    def messageCode(self):
+        return self._frame.mc
+
+    @property
+    def priority(self):
+        return Priority((self._frame.ctrl1 >> 2) & 0x03)
+
+    @property
+    def hopCount(self):
+        return (self._frame.ctrl2 >> 4) & 0x07
+
+    @property
+    def sourceAddress(self):
+        return IndividualAddress(self._frame.sa)
+
+    @property
+    def destinationAddress(self):
+        if (self._frame.ctrl2 >> 7) & 0x01 == 0:
+            return IndividualAddress(self._frame.da)
+        else:
+            return GroupAddress(self._frame.da)
+
+    @property
+    def npdu(self):
+        return self._frame.npdu
+
+
+FRAME = b")\x00\xbc\xd0\x11\x0e\x19\x02\x01\x00\x80"
+
+
+def receive(cls):
+    cEMI = cls(FRAME)
+
+    # ETS.putFrame / ETS.processFrame
+    cEMI.priority
+    cEMI.destinationAddress
+    cEMI.frame.sa
+    cEMI.hopCount
+
+    # L_DataService.dataInd
+    cEMI.sourceAddress
+    cEMI.messageCode
+
+    # N_GroupDataService.dataInd (previously read hopCount twice, and messageCode)
+    cEMI.sourceAddress
+    cEMI.destinationAddress
+    cEMI.priority
+    cEMI.npdu[1:]
+    return cEMI
+
+
+def objectsBuilt(cls, n=1000):
+    """ Number of address and priority constructor calls per frame
+
+    Addresses are interned, so their constructor is a dict lookup, but still a Python call.
+    """
+    count = [0]
+
+    def counting(func):
+        def wrapper(*args, **kwargs):
+            count[0] += 1
+            return func(*args, **kwargs)
+        return wrapper
+
+    saved = IndividualAddress.__new__, GroupAddress.__new__, Priority.__init__
+    IndividualAddress.__new__, GroupAddress.__new__, Priority.__init__ = [counting(func) for func in saved]
+    try:
+        for i in range(n):
+            receive(cls)
+    finally:
+        IndividualAddress.__new__, GroupAddress.__new__, Priority.__init__ = saved
+    return float(count[0]) / n
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    for name, cls in (("uncached (previous)", UncachedCEMILData), ("cached slots", CEMILData)):
+        t = min(timeit.repeat(lambda: receive(cls), number=n, repeat=5))
+        print("%-20s %6.2f us/frame  %4.1f calls/frame" % (name, t * 1e6 / n, objectsBuilt(cls)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+
+""" Python KNX framework
+
+DPT lookup tables microbenchmark
+
+Compares the table-backed conversions (lookupValue/lookupData) with the scalar ones (checkData + dataToValue,
+checkValue + valueToData), for some small-domain DPTs, and times the first use of a table (which builds it).
+
+Usage: PYTHONPATH=. python benchmarks/dptTables.py [n]
+"""
+
+import sys
+import time
+import timeit
+
+from pyknyx.core.dptXlator.dptXlatorFactory import DPTXlatorFactory
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    for dptId, data in (("1.001", 1), ("5.001", 0x80), ("9.001", 0x0c1a), ("17.001", 0x81)):
+        xlator = DPTXlatorFactory().create(dptId)
+        start = time.time()
+        xlator.lookupData(xlator.lookupValue(data))
+        print("%-7s tables built in %.1f ms" % (dptId, (time.time() - start) * 1e3))
+        value = xlator.dataToValue(data)
+
+        def scalarDecode():
+            xlator.checkData(data)
+            return xlator.dataToValue(data)
+
+        def scalarEncode():
+            xlator.checkValue(value)
+            return xlator.valueToData(value)
+
+        for name, func in (("decode", scalarDecode), ("decode", lambda: xlator.lookupValue(data)),
+                           ("encode", scalarEncode), ("encode", lambda: xlator.lookupData(value))):
+            impl = "table" if func.__name__ == "<lambda>" else "scalar"
+            t = min(timeit.repeat(func, number=n, repeat=5))
+            print("%-7s %-7s %-7s %6.3f us" % (dptId, name, impl, t * 1e6 / n))
+
+
+if __name__ == "__main__":
+    main()
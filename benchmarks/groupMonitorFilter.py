@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+
+""" Python KNX framework
+
+Group monitor filter benchmark
+
+Sends group write telegrams to random group addresses through ETS.processFrame and an in-process stack, with 10
+group monitor listeners each interested in one main group (about 3% of the traffic), and reports the CPU time per
+telegram:
+
+ - listener filter: each listener gets all telegrams and filters them itself
+ - monitor filter: the listeners are subscribed with a GroupMonitorFilter
+
+Usage: PYTHONPATH=. python benchmarks/groupMonitorFilter.py [n]
+"""
+
+import random
+import sys
+import time
+
+from pyknyx.services.logger import logging
+from pyknyx.core.ets import ETS
+from pyknyx.core.groupMonitorFilter import GroupMonitorFilter
+from pyknyx.stack.cemi.cemiLData import CEMILData
+from pyknyx.stack.stack import Stack
+
+LISTENERS = 10
+
+
+class Source(object):
+    hop = False
+    local = False
+
+
+class Listener(object):
+    count = 0
+
+    def __init__(self, main, filtered):
+        self._main = main
+        self._filtered = filtered
+
+    def onWrite(self, src, gad, priority, data):
+        if self._filtered or gad.main == self._main:
+            Listener.count += 1
+
+
+def run(frames, filtered):
+    ets = ETS("1.2.0", transCls=None)
+    stack = Stack(ets, "1.2.3")
+    for main in range(LISTENERS):
+        listener = Listener(main, filtered)
+        stack.agds.subscribe("0/0/0", listener, GroupMonitorFilter(main=main) if filtered else None)
+    source = Source()
+    Listener.count = 0
+    start = time.process_time()
+    for frame in frames:
+        ets.processFrame(source, CEMILData(frame))
+    return time.process_time() - start, Listener.count
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    logging.getLogger("pyknyx").setLevel(logging.INFO)
+    rand = random.Random(0)
+    frames = [b")\x00\xbc\xd0\x11\x0e" + bytes(divmod(rand.randrange(1, 0x10000), 256)) + b"\x01\x00\x81"
+              for i in range(n)]
+    for name, filtered in (("listener filter", False), ("monitor filter", True)):
+        t, count = min(run(frames, filtered) for i in range(3))
+        print("%-15s %6.2f us/telegram (%d telegrams delivered)" % (name, t * 1e6 / n, count))
+
+
+if __name__ == "__main__":
+    main()
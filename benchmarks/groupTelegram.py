@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+""" Python KNX framework
+
+Fused group telegram decoder benchmark
+
+Sends group write telegrams through ETS.processFrame and an in-process stack up to a group listener, and reports
+the CPU time per telegram:
+
+ - layered: the frame goes through the link, network, transport and application layers
+ - fused: the link layer decodes the telegram in one pass and calls the application layer directly
+
+Usage: PYTHONPATH=. python benchmarks/groupTelegram.py [n]
+"""
+
+import sys
+import time
+
+from pyknyx.services.logger import logging
+from pyknyx.core.ets import ETS
+from pyknyx.stack.cemi.cemiLData import CEMILData
+from pyknyx.stack.stack import Stack
+
+FRAME = b")\x00\xbc\xd0\x11\x0e\x09\x01\x01\x00\x80"  # group write 1/1/1
+
+
+class Source(object):
+    hop = False
+    local = False
+
+
+class Listener(object):
+    count = 0
+
+    def onWrite(self, src, data):
+        Listener.count += 1
+
+
+def run(n, fused):
+    ets = ETS("1.2.0", transCls=None)
+    stack = Stack(ets, "1.2.3")
+    stack.agds.subscribe("1/1/1", Listener())
+    if not fused:
+        stack._lds.setGroupTelegramListener(None)
+    source = Source()
+    start = time.process_time()
+    for i in range(n):
+        ets.processFrame(source, CEMILData(FRAME))
+    return time.process_time() - start
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    logging.getLogger("pyknyx").setLevel(logging.INFO)
+    for name, fused in (("layered", False), ("fused", True)):
+        t = min(run(n, fused) for i in range(3))
+        print("%-8s %6.2f us/telegram" % (name, t * 1e6 / n))
+
+
+if __name__ == "__main__":
+    main()
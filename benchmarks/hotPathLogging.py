@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+
+""" Python KNX framework
+
+Telegram hot path logging benchmark
+
+Sends group write telegrams through ETS.processFrame and an in-process stack up to a group listener, with debug
+logging disabled (INFO level), and reports the CPU time per telegram:
+
+ - previous: each debug call formats its message eagerly ("..." % args) before calling logger.debug, as the
+   stack did before the calls were guarded; emulated by a logger proxy which formats every message
+ - level guard: deferred formatting, calls guarded by HOT_PATH and logger.isEnabledFor()
+ - hot path off: HOT_PATH switched off (config.LOGGER_HOT_PATH, or python -O)
+
+Usage: PYTHONPATH=. python benchmarks/hotPathLogging.py [n]
+"""
+
+import sys
+import time
+
+from pyknyx.services.logger import logging
+from pyknyx.core.ets import ETS
+from pyknyx.stack.cemi.cemiLData import CEMILData
+from pyknyx.stack.stack import Stack
+
+import pyknyx.core.ets
+import pyknyx.core.group
+import pyknyx.stack.layer2.l_dataService
+import pyknyx.stack.layer3.n_groupDataService
+import pyknyx.stack.layer4.t_groupDataService
+import pyknyx.stack.layer7.a_groupDataService
+
+MODULES = (pyknyx.core.ets, pyknyx.core.group, pyknyx.stack.layer2.l_dataService,
+           pyknyx.stack.layer3.n_groupDataService, pyknyx.stack.layer4.t_groupDataService,
+           pyknyx.stack.layer7.a_groupDataService)
+
+FRAME = b")\x00\xbc\xd0\x11\x0e\x09\x01\x01\x00\x80"  # group write 1/1/1
+
+
+class EagerLogger(object):
+    """ Logger formatting all messages before the level check, like the previous '%' calls
+    """
+    def __init__(self, logger):
+        self._logger = logger
+
+    def isEnabledFor(self, level):
+        return True
+
+    def debug(self, msg, *args):
+        self._logger.debug(msg % args)
+
+    trace = debug
+
+    def __getattr__(self, name):
+        return getattr(self._logger, name)
+
+
+class Source(object):
+    hop = False
+    local = False
+
+
+class Listener(object):
+    count = 0
+
+    def onWrite(self, src, data):
+        Listener.count += 1
+
+
+def run(n):
+    ets = ETS("1.2.0", transCls=None)
+    stack = Stack(ets, "1.2.3")
+    stack.agds.subscribe("1/1/1", Listener())
+    source = Source()
+    start = time.process_time()
+    for i in range(n):
+        ets.processFrame(source, CEMILData(FRAME))
+    return time.process_time() - start
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    logging.getLogger("pyknyx").setLevel(logging.INFO)
+    saved = [(module, module.HOT_PATH, module.logger) for module in MODULES]
+    try:
+        for name, hotPath, eager in (("previous", True, True), ("level guard", True, False),
+                                     ("hot path off", False, False)):
+            for module, hotPath_, logger in saved:
+                module.HOT_PATH = hotPath
+                module.logger = EagerLogger(logger) if eager else logger
+            t = min(run(n) for i in range(3))
+            print("%-13s %6.2f us/telegram" % (name, t * 1e6 / n))
+    finally:
+        for module, hotPath, logger in saved:
+            module.HOT_PATH = hotPath
+            module.logger = logger
+
+
+if __name__ == "__main__":
+    main()
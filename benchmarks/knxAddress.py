@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+""" Python KNX framework
+
+Address construction microbenchmark
+
+Compares the interned GroupAddress/IndividualAddress with the previous implementation, which parsed the address and
+built a new object on each construction, and rebuilt the string form on each access to address.
+
+Usage: PYTHONPATH=. python benchmarks/knxAddress.py [n]
+"""
+
+import sys
+import timeit
+
+from pyknyx.stack.groupAddress import GroupAddress
+from pyknyx.stack.individualAddress import IndividualAddress
+
+
+class PreviousGroupAddress(object):
+    """ Previous implementation (level 3 only)
+    """
+    def __init__(self, address="0/0/0"):
+        if isinstance(address, str):
+            address = [int(val) for val in address.strip().split('/')]
+        if not isinstance(address, int):
+            address = address[0] << 11 | address[1] << 8 | address[2]
+        if not 0 <= address <= 0xffff:
+            raise ValueError(address)
+        self._outFormatLevel = 3
+        self._raw = address
+
+    @property
+    def address(self):
+        address = []
+        address.append("%d" % (self._raw >> 11 & 0x1f))
+        address.append("%d" % (self._raw >> 8 & 0x07))
+        address.append("%d" % (self._raw & 0x0ff))
+        return '/'.join(address)
+
+
+class PreviousIndividualAddress(object):
+    """ Previous implementation
+    """
+    def __init__(self, address="0.0.0"):
+        if isinstance(address, str):
+            address = [int(val) for val in address.strip().split('.')]
+        if not isinstance(address, int):
+            address = address[0] << 12 | address[1] << 8 | address[2]
+        if not 0 <= address <= 0xffff:
+            raise ValueError(address)
+        self._raw = address
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    for name, func in (("GroupAddress(int)", lambda cls: cls(0x0a03)),
+                       ("GroupAddress(str)", lambda cls: cls("1/2/3")),
+                       ("GroupAddress(int).address", lambda cls: cls(0x0a03).address)):
+        for impl, cls in (("previous", PreviousGroupAddress), ("interned", GroupAddress)):
+            t = min(timeit.repeat(lambda: func(cls), number=n, repeat=5))
+            print("%-28s %-9s %6.3f us" % (name, impl, t * 1e6 / n))
+    for impl, cls in (("previous", PreviousIndividualAddress), ("interned", IndividualAddress)):
+        t = min(timeit.repeat(lambda: cls(0x110e), number=n, repeat=5))
+        print("%-28s %-9s %6.3f us" % ("IndividualAddress(int)", impl, t * 1e6 / n))
+
+
+if __name__ == "__main__":
+    main()
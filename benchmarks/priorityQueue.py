@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+
+""" Python KNX framework
+
+PriorityQueue microbenchmark
+
+Compares the deque based PriorityQueue with the previous list based implementation, for a backlog of queued
+frames: adding n elements, then removing them one by one, or in batches.
+
+Usage: PYTHONPATH=. python benchmarks/priorityQueue.py [n]
+"""
+
+import sys
+import threading
+import timeit
+
+from pyknyx.stack.priority import Priority
+from pyknyx.stack.priorityQueue import PriorityQueue
+from pyknyx.stack.layer2.l_dataService import PRIORITY_DISTRIBUTION
+
+
+class ListPriorityQueue(object):
+    """ Previous implementation (list per level, shared by mistake, and list.pop(0))
+    """
+    def __init__(self, priorityDistribution):
+        self._priorityDistribution = priorityDistribution
+        self._queue = len(priorityDistribution) * [[]]
+        self._condition = threading.Condition()
+        self._n = priorityDistribution[:]
+
+    def add(self, obj, priority):
+        with self._condition:
+            self._queue[priority.level].append(obj)
+            self._condition.notify()
+
+    def remove(self):
+        with self._condition:
+            while True:
+                seen = True
+                while seen:
+                    seen = False
+                    for i,q in enumerate(zip(self._queue,self._n)):
+                        q,n = q
+                        if not q:
+                            continue
+                        seen = True
+                        if n == 0:
+                            continue
+                        if n >= 0:
+                            self._n[i] = n-1
+                        return q.pop(0)
+                    if seen:
+                        self._n = self._priorityDistribution[:]
+                self._condition.wait()
+
+
+PRIORITIES = [Priority(level) for level in ('low', 'normal', 'low', 'urgent', 'low', 'system')]
+
+
+def fillAndDrain(cls, n):
+    queue = cls(PRIORITY_DISTRIBUTION)
+    for i in range(n):
+        queue.add(i, PRIORITIES[i % len(PRIORITIES)])
+    for i in range(n):
+        queue.remove()
+
+
+def fillAndDrainBatch(n):
+    queue = PriorityQueue(PRIORITY_DISTRIBUTION)
+    for i in range(n):
+        queue.add(i, PRIORITIES[i % len(PRIORITIES)])
+    while queue.removeBatch(64, timeout=0):
+        pass
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    for name, func in (("list (previous)", lambda: fillAndDrain(ListPriorityQueue, n)),
+                       ("deque", lambda: fillAndDrain(PriorityQueue, n)),
+                       ("deque, removeBatch(64)", lambda: fillAndDrainBatch(n))):
+        t = min(timeit.repeat(func, number=1, repeat=5))
+        print("%-24s %8.2f ms  %6.2f us/element" % (name, t * 1e3, t * 1e6 / n))
+
+
+if __name__ == "__main__":
+    main()
@@ -50,3 +50,8 @@ LOGGER_LEVEL = "INFO"
 LOGGER_DIR = "/tmp"
 LOGGER_MAX_BYTES = 4096 * 1024
 LOGGER_BACKUP_COUNT = 4  # set to 0 to disable logging on file
+LOGGER_HOT_PATH = os.environ.get("PKNYX_LOGGER_HOT_PATH", "1") != "0"  # set to False to skip debug logging on telegrams
+
+# Group reads (see pyknyx.stack.layer7.readCoordinator)
+READ_COALESCE_WINDOW = 0.5  # reads of a group address sent less than this time ago (s) are merged
+READ_CACHE_MAX_AGE = 1.  # reads are answered from values seen less than this time ago (s); set to 0 to disable
@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+
+""" Python KNX framework
+
+License
+=======
+
+ - B{pKNyX} (U{http://www.pyknyx.org}) is Copyright:
+  - (C) 2013-2015 Frédéric Mantegazza
+
+This program is free software; you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation; either version 2 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program; if not, write to the Free Software
+Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+or see:
+
+ - U{http://www.gnu.org/licenses/gpl.html}
+
+
+Module purpose
+==============
+
+ETS management, asyncio flavour
+
+Implements
+==========
+
+ - B{AsyncETS}
+
+Documentation
+=============
+
+AsyncETS does the same job as L{ETS<pyknyx.core.ets>}, but runs in an asyncio event loop instead of its own thread.
+Each frame put in the queue schedules a loop callback, which processes the next frame in priority order; the
+transceivers (see L{AsyncUDPTransceiver<pyknyx.stack.transceiver.asyncUdpTransceiver>}) are driven by the same loop,
+so a telegram goes from the socket to the devices without any thread handoff.
+
+AsyncETS must be started and stopped from the loop thread. Frames may still be put from other threads (scheduler
+jobs, for example): they are then passed to the loop with call_soon_threadsafe().
+
+Devices are started in the loop default executor, as L{Stack.start<pyknyx.stack.stack.Stack.start>} blocks.
+
+Usage
+=====
+
+>>> async def main():
+...     ets = AsyncETS("1.2.0")
+...     Actor(ets, "1.2.3")
+...     ets.start()
+...     await asyncio.sleep(3600)
+...     ets.stop()
+>>> asyncio.run(main())
+
+@author: Frédéric Mantegazza
+@copyright: (C) 2013-2015 Frédéric Mantegazza
+@license: GPL
+"""
+
+
+import asyncio
+import threading
+
+from pyknyx.core.ets import ETS
+from pyknyx.services.logger import logging, HOT_PATH; logger = logging.getLogger(__name__)
+from pyknyx.stack.asyncPriorityQueue import AsyncPriorityQueue
+from pyknyx.stack.layer2.l_dataService import PRIORITY_DISTRIBUTION
+from pyknyx.stack.transceiver.asyncUdpTransceiver import AsyncUDPTransceiver
+
+
+class AsyncETS(ETS):
+    """ AsyncETS class
+
+    @ivar _loop: event loop ETS runs in
+    @type _loop: asyncio.AbstractEventLoop
+
+    @ivar _loopThread: identifier of the loop thread
+    @type _loopThread: int
+    """
+    def __init__(self, addr, addrRange=-1,
+                 transCls=AsyncUDPTransceiver,
+                 transParams=dict(mcastAddr="224.0.23.12", mcastPort=3671),
+                 addrTableSize=1024, addrTableAge=300, localDelivery=False, initReadParams=None,
+                 readParams=None, groupStateParams=None):
+        """
+        Set up the ETS stack.
+
+        @param addr: the physical address of this stack (and possibly its sole device)
+
+        See L{ETS.__init__<pyknyx.core.ets.ETS.__init__>} for the other parameters.
+        """
+        super(AsyncETS, self).__init__(addr, addrRange, transCls, transParams, addrTableSize, addrTableAge,
+                                       localDelivery=localDelivery, initReadParams=initReadParams,
+                                       readParams=readParams, groupStateParams=groupStateParams)
+
+        self._loop = None
+        self._loopThread = None
+
+    @property
+    def loop(self):
+        return self._loop
+
+    def _newQueue(self):
+        return AsyncPriorityQueue(PRIORITY_DISTRIBUTION)
+
+    def putFrame(self, l2, cEMI):
+        """
+        Add a frame to be processed.
+        """
+        if HOT_PATH and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("AsyncETS.putFrame(): cEMI=%s", cEMI)
+
+        if self._localDelivery and l2.local:
+            self._deliverLocal(l2, cEMI)
+            if len(self._layer2) == len(self._localLayer2):
+                return
+
+        if self._loopThread is None or self._loopThread == threading.get_ident():
+            self._putFrame(l2, cEMI)
+        else:
+            self._loop.call_soon_threadsafe(self._putFrame, l2, cEMI)
+
+    def putFrames(self, l2, cEMIs):
+        """
+        Add several frames, received together from the same layer2, to be processed.
+        """
+        if self._loopThread is None or self._loopThread == threading.get_ident():
+            self._putFrames(l2, cEMIs)
+        else:
+            self._loop.call_soon_threadsafe(self._putFrames, l2, cEMIs)
+
+    def _putFrame(self, l2, cEMI):
+        self._queue.add((l2,cEMI), cEMI.priority)
+        if self._running:
+            self._loop.call_soon(self._processNext)
+
+    def _putFrames(self, l2, cEMIs):
+        self._queue.addBatch(((l2,cEMI), cEMI.priority) for cEMI in cEMIs)
+        if self._running:
+            for cEMI in cEMIs:
+                self._loop.call_soon(self._processNext)
+
+    def _processNext(self):
+        """ Process the next frame, in priority order
+
+        One such callback is scheduled per queued frame.
+        """
+        try:
+            l2, cEMI = self._queue.removeNoWait()
+        except asyncio.QueueEmpty:
+            return
+        try:
+            if self._running:
+                self.processFrame(l2, cEMI)
+        except Exception:
+            logger.exception("AsyncETS._processNext()")
+        finally:
+            cEMI.release()
+
+    def _startDevice(self, device):
+        return self._loop.run_in_executor(None, device.start)
+
+    def _devicesStarted(self, future):
+        """ Start the initial reads, once all devices are started
+
+        The initial reads are not started if a device failed to start.
+        """
+        if future.cancelled():
+            return
+        failed = False
+        for result in future.result():
+            if isinstance(result, BaseException):
+                logger.error("AsyncETS.start(): device start failed", exc_info=result)
+                failed = True
+        if self._running and not failed:
+            self._initReader.start()
+
+    def start(self):
+        """ Start ETS in the running event loop
+
+        Must be called from the loop thread.
+        """
+        if self._running:
+            return
+        logger.debug("AsyncETS.start(): starting")
+
+        self._loop = asyncio.get_running_loop()
+        self._loopThread = threading.get_ident()
+        self._running = True
+
+        for dev in self._layer2:
+            dev.start()
+        started = [self._startDevice(dev) for dev in self._devices]
+        asyncio.gather(*started, return_exceptions=True).add_done_callback(self._devicesStarted)
+        self._scheduler.start()
+
+        # Frames put before start
+        for i in range(len(self._queue)):
+            self._loop.call_soon(self._processNext)
+
+    def stop(self):
+        self._running = False
+        self._scheduler.stop()
+        self._initReader.stop()
+        for dev in self._devices:
+            dev.stop()
+        for dev in self._layer2:
+            dev.stop()
@@ -115,7 +115,7 @@ class Datapoint(object):
     @todo: add desc. param
     @todo: take 'access' into account when transmit/receive
     """
-    def __init__(self, owner, name, access, dptId=DPTID(), default=None):
+    def __init__(self, owner, name, access, dptId=DPTID("1.xxx"), default=None):
         """
 
         @param owner: owner of the datapoint
@@ -215,19 +215,17 @@ class Datapoint(object):
     def value(self):
         if self._data is None:
             return None
-        return self._dptXlator.dataToValue(self._data)
+        return self._dptXlator.lookupValue(self._data)
 
     def _setValue(self, value):
-        self._dptXlator.checkValue(value)
-        data = self._dptXlator.valueToData(value)
+        data = self._dptXlator.lookupData(value)
         self._setData(data)
         # @todo: check access
 
     @value.setter
     def value(self, value):
         oldValue = self.value
-        self._dptXlator.checkValue(value)
-        data = self._dptXlator.valueToData(value)
+        data = self._dptXlator.lookupData(value)
         self._setData(data)
         # @todo: check access
 
@@ -249,8 +247,9 @@ class Datapoint(object):
     def frame(self, frame):
         oldValue = self.value
         data = self._dptXlator.frameToData(frame)  # @todo: check frame size with _dptXlator.typeSize...
-        self._setData(data)
+        value = self._dptXlator.lookupValue(data)  # also checks data
+        self._data = data
 
         # Notify owner (FunctionalBlock)
-        self._owner.notify(self.name, oldValue, self.value)
+        self._owner.notify(self.name, oldValue, value)
 
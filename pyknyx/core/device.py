@@ -40,6 +40,10 @@ Documentation
 
 The Device is the top-level object. It runs as a process. It mainly encapsulates some initialisations.
 
+Links between functional blocks datapoints and group addresses are given as B{LNK_xxx} class attributes. The gad
+can also be a L{GroupAddressPattern<pyknyx.stack.groupAddressPattern>} (e.g. "4/1/*"): the group object then gets
+the telegrams of all matching GADs, but only sends on a plain GAD it is linked to.
+
 Usage
 =====
 
@@ -78,7 +82,7 @@ class Device(object):
         for cls_ in classes:
             for key, value in cls_.__dict__.items():
                 if key.startswith("FB_"):
-                    logger.debug("Device.__new__(): %s=(%s)" % (key, repr(value)))
+                    logger.debug("Device.__new__(): %s=(%r)", key, value)
                     name = value['name']
 
                     # Check if already registered
@@ -97,7 +101,7 @@ class Device(object):
         for cls_ in classes:
             for key, value in cls_.__dict__.items():
                 if key.startswith("LNK_"):
-                    logger.debug("Device.__new__(): %s=(%s)" % (key, repr(value)))
+                    logger.debug("Device.__new__(): %s=(%r)", key, value)
 
                     link = (value['fb'], value['dp'], value['gad'])  # TODO: add flags
                     if link in links:
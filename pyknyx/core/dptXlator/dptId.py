@@ -48,17 +48,18 @@ ValueError: invalid Datapoint Type ID ('1')
 >>> dptId.id
 '1.001'
 >>> dptId.main
-'1'
+1
 >>> dptId.sub
-'001'
+1
 >>> dptId.generic
 <DPTID("1.xxx")>
 >>> dptId.generic.main
-'1'
+1
 >>> dptId.generic.sub
-'xxx'
 >>> dptId.generic.generic
 <DPTID("1.xxx")>
+>>> DPTID("1.001") is dptId
+True
 
 @author: Frédéric Mantegazza
 @copyright: (C) 2013-2015 Frédéric Mantegazza
@@ -79,23 +80,93 @@ class DPTIDValueError(PKNyXValueError):
 class DPTID(object):
     """ Datapoint Type ID class
 
+    DPTID instances are immutable and interned: DPTID(id) returns the same instance for the same id string, with its
+    parts parsed once. DPTID() returns a new, not shared, "1.xxx" instance, which is how pickles made by older versions
+    (holding the attributes dict) are loaded.
+
     @ivar _id: Datapoint Type ID
     @type _id: str
+
+    @ivar _main: main part of the id
+    @type _main: int
+
+    @ivar _sub: sub part of the id (None if generic)
+    @type _sub: int
+
+    @ivar _key: (main, sub) tuple used for hashing and ordering; the generic sub sorts first
+    @type _key: tuple of int
+
+    @ivar _generic: generic Datapoint Type ID
+    @type _generic: L{DPTID}
     """
-    def __init__(self, dptId="1.xxx"):
+    ID_REGEX = re.compile(r"^(\d{1,3})\.(\d{1,3}|xxx)$")
+
+    __slots__ = ("_id", "_main", "_sub", "_key", "_generic")
+
+    _instances = {}
+
+    def __new__(cls, dptId=None):
         """ Create a new Datapoint Type ID from the given id
 
-        @param dptId: Datapoint Type ID to create
+        @param dptId: Datapoint Type ID to create (None for a new, not shared, "1.xxx" id)
         @type dptId: str
 
         raise DPTIDValueError: invalid id
         """
-        super(DPTID, self).__init__()
+        if dptId is None:
+            self = object.__new__(cls)
+            self._setId("1.xxx")
+            return self
+        try:
+            return DPTID._instances[dptId]
+        except (KeyError, TypeError):
+            pass
+        if isinstance(dptId, DPTID):
+            return dptId
+
+        self = object.__new__(cls)
+        self._setId(dptId)
+        return DPTID._instances.setdefault(dptId, self)
 
-        if not re.match("^\d{1,3}\.\d{1,3}$", dptId) and not re.match("^\d{1,3}\.xxx$", dptId):
+    def _setId(self, dptId):
+        """ Parse the id and set its parts
+
+        raise DPTIDValueError: invalid id
+        """
+        try:
+            match = DPTID.ID_REGEX.match(dptId)
+        except TypeError:
+            match = None
+        if match is None:
             raise DPTIDValueError("invalid Datapoint Type ID (%r)" % repr(dptId))
+        main, sub = match.groups()
 
         self._id = dptId
+        self._main = int(main)
+        if sub == "xxx":
+            self._sub = None
+            self._key = (self._main, -1)
+            self._generic = self
+        else:
+            self._sub = int(sub)
+            self._key = (self._main, self._sub)
+            self._generic = DPTID("%s.xxx" % main)
+
+    def __reduce__(self):
+        return (DPTID, (self._id,))
+
+    def __setstate__(self, state):
+        """ Restore a Datapoint Type ID pickled by an older version
+
+        The state is only set on the new instance built for the pickle, never on a shared one.
+        """
+        self._setId(state['_id'])
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
 
     def __repr__(self):
         return "<DPTID('%s')>" % self._id
@@ -104,41 +175,29 @@ class DPTID(object):
         return self._id
 
     def __lt__(self, other):
-        return self._cmp(other) < 0
+        return self._key < other._key
 
     def __le__(self, other):
-        return self._cmp(other) <= 0
+        return self._key <= other._key
 
     def __eq__(self, other):
-        return self._cmp(other) == 0
+        if isinstance(other, DPTID):
+            return self._key == other._key
+        return NotImplemented
 
     def __ne__(self, other):
-        return self._cmp(other) != 0
+        if isinstance(other, DPTID):
+            return self._key != other._key
+        return NotImplemented
 
     def __gt__(self, other):
-        return self._cmp(other) > 0
+        return self._key > other._key
 
     def __ge__(self, other):
-        return self._cmp(other) >= 0
+        return self._key >= other._key
 
     def __hash__(self):
-        return hash((self.main, self.sub))
-
-    def _cmp(self, other):
-        """ Make comp on id
-
-        @return: -1 if self < other, zero if self == other, +1 if self > other
-        @rtype: int
-        """
-
-        if self.main != other.main:
-            return self.main - other.main
-        elif other.sub is None:
-            return self.sub is not None
-        elif self.sub is None:
-            return -1
-        else:
-            return self.sub - other.sub
+        return hash(self._key)
 
     @property
     def id(self):
@@ -150,23 +209,19 @@ class DPTID(object):
     def main(self):
         """ Return the main part of the Datapoint Type ID
         """
-        return int(self._id.split('.')[0])
+        return self._main
 
     @property
     def sub(self):
         """ Return the sub part of the Datapoint Type ID
         """
-        try:
-            return int(self._id.split('.')[1])
-        except ValueError:
-            return None
+        return self._sub
 
     @property
     def generic(self):
         """ Return the generic Datapoint Type ID
         """
-        genericId = re.sub(r"^(.*)\..*$", r"\1.xxx",  self._id)
-        return DPTID(genericId)
+        return self._generic
 
     def isGeneric(self):
         """ Test if generic ID
@@ -174,6 +229,4 @@ class DPTID(object):
         @return: True if Datapoint Type ID is a generic Datapoint Type ID
         @rtype: bool
         """
-        return self == self.generic
-
-
+        return self._sub is None
@@ -89,9 +89,15 @@ class DPTXlator2ByteFloat(DPTXlatorBase):
     DPT_Value_Temp_F = DPT("9.027", "Temperature (°F)", (-459.6, 670760.), "°F")
     DPT_Value_Wsp_kmh = DPT("9.028", "Wind speed (km/h)", (0., 670760.), "km/h")
 
+    TABLE_SIZE = 0x10000
+
     def __init__(self, dptId):
         super(DPTXlator2ByteFloat, self).__init__(dptId, 2)
 
+    @property
+    def _tableKey(self):
+        return self.DPT_Generic  # all DPTs decode the same way
+
     def checkData(self, data):
         if not 0x0000 <= data <= 0xffff:
             raise DPTXlatorValueError("data %s not in (0x0000, 0xffff)" % hex(data))
@@ -117,9 +123,9 @@ class DPTXlator2ByteFloat(DPTXlatorBase):
         if value < 0:
             sign = 1
         mant = int(value * 100)
-        while not -2048 <= mant <= 2047:
-            mant = mant >> 1
-            exp += 1
+        if not -2048 <= mant <= 2047:
+            exp = (mant if mant >= 0 else ~mant).bit_length() - 11  # number of shifts to bring mant in range
+            mant = mant >> exp
         #logger.debug("DPT2ByteFloat.valueToData(): sign=%d, exp=%d, mant=%r" % (sign, exp, mant))
         data = (sign << 15) | (exp << 11) | (int(mant) & 0x07ff)
         #logger.debug("DPT2ByteFloat.valueToData(): data=%s" % hex(data))
@@ -132,3 +138,27 @@ class DPTXlator2ByteFloat(DPTXlatorBase):
         data = struct.unpack(">H", frame)[0]
         return data
 
+    def dataToValueArray(self, data):
+        np = self._numpy()
+        data = np.asarray(data, dtype=np.int64)
+        sign = (data & 0x8000) >> 15
+        exp = (data & 0x7800) >> 11
+        mant = data & 0x07ff
+        mant = np.where(sign != 0, -(~(mant - 1) & 0x07ff), mant)
+        value = (1 << exp) * 0.01 * mant
+        return value
+
+    def valueToDataArray(self, values):
+        np = self._numpy()
+        values = np.asarray(values, dtype=np.float64)
+        sign = (values < 0).astype(np.int64)
+        exp = np.zeros(len(values), dtype=np.int64)
+        mant = np.trunc(values * 100).astype(np.int64)
+        outOfRange = (mant < -2048) | (mant > 2047)
+        while outOfRange.any():
+            mant[outOfRange] >>= 1
+            exp[outOfRange] += 1
+            outOfRange = (mant < -2048) | (mant > 2047)
+        data = (sign << 15) | (exp << 11) | (mant & 0x07ff)
+        return data
+
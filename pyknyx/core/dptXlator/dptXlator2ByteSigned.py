@@ -123,3 +123,33 @@ class DPTXlator2ByteSigned(DPTXlatorBase):
         data = struct.unpack(">H", frame)[0]
         return data
 
+    def dataToValueArray(self, data):
+        np = self._numpy()
+        data = np.asarray(data, dtype=np.int64)
+        data = np.where(data >= 0x8000, -((data - 1) ^ 0xffff), data)
+        if self._dpt is self.DPT_DeltaTime10Msec:
+            value = data * 10.
+        elif self._dpt is self.DPT_DeltaTime100Msec:
+            value = data * 100.
+        elif self._dpt is self.DPT_Percent_V16:
+            value = data / 100.
+        else:
+            value = data
+        return value
+
+    def valueToDataArray(self, values):
+        np = self._numpy()
+        values = np.array(values)
+        negative = values < 0
+        if negative.any():
+            values[negative] = (abs(values[negative]) ^ 0xffff) + 1
+        if self._dpt is self.DPT_DeltaTime10Msec:
+            data = np.rint(values / 10.)
+        elif self._dpt is self.DPT_DeltaTime100Msec:
+            data = np.rint(values / 100.)
+        elif self._dpt is self.DPT_Percent_V16:
+            data = np.rint(values * 100.)
+        else:
+            data = values
+        return data.astype(np.int64)
+
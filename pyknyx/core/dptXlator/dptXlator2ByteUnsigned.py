@@ -115,3 +115,25 @@ class DPTXlator2ByteUnsigned(DPTXlatorBase):
         data = struct.unpack(">H", frame)[0]
         return data
 
+    def dataToValueArray(self, data):
+        np = self._numpy()
+        data = np.asarray(data, dtype=np.int64)
+        if self._dpt is self.DPT_TimePeriod10Msec:
+            value = data * 10.
+        elif self._dpt is self.DPT_TimePeriod100Msec:
+            value = data * 100.
+        else:
+            value = data
+        return value
+
+    def valueToDataArray(self, values):
+        np = self._numpy()
+        values = np.asarray(values)
+        if self._dpt is self.DPT_TimePeriod10Msec:
+            data = np.rint(values / 10.)
+        elif self._dpt is self.DPT_TimePeriod100Msec:
+            data = np.rint(values / 100.)
+        else:
+            data = values
+        return data.astype(np.int64)
+
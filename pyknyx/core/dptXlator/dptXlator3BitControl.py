@@ -76,6 +76,9 @@ class DPTXlator3BitControl(DPTXlatorBase):
     DPT_Control_Dimming = DPT("3.007", "Dimming", (-7, 7))
     DPT_Control_Blinds = DPT("3.008", "Blinds", (-7, 7))
 
+    TABLE_SIZE = 0x10
+    ENCODE_TABLE = True
+
     def __init__(self, dptId):
         super(DPTXlator3BitControl, self).__init__(dptId, 0)
 
@@ -85,6 +88,10 @@ class DPTXlator3BitControl(DPTXlatorBase):
         dptId_ = '1.'+sub
         self._dpt2 = DPTXlatorBoolean(dptId_)
 
+    @property
+    def _tableKey(self):
+        return self.DPT_Generic  # all DPTs decode the same way
+
     def checkData(self, data):
         if not 0x00 <= data <= 0x0f:
             raise DPTXlatorValueError("data %s not in (0x00, 0x0f)" % hex(data))
@@ -116,6 +123,22 @@ class DPTXlator3BitControl(DPTXlatorBase):
         data = struct.unpack(">B", frame)[0]
         return data
 
+    def dataToValueArray(self, data):
+        np = self._numpy()
+        data = np.asarray(data, dtype=np.int64)
+        ctrl = (data & 0x08) >> 3
+        stepCode = data & 0x07
+        value = np.where(ctrl != 0, stepCode, -stepCode)
+        return value
+
+    def valueToDataArray(self, values):
+        np = self._numpy()
+        values = np.asarray(values, dtype=np.int64)
+        ctrl = (values > 0).astype(np.int64)
+        stepCode = abs(values) & 0x07
+        data = ctrl << 3 | stepCode
+        return data
+
     #def nbIntervalsToStepCode(self, nbIntervals):
         #""" Compute the stepCode for a given number of intervals
 
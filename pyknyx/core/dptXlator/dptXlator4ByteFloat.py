@@ -179,3 +179,15 @@ class DPTXlator4ByteFloat(DPTXlatorBase):
         data = struct.unpack(">L", frame)[0]
         return data
 
+    def dataToValueArray(self, data):
+        np = self._numpy()
+        data = np.asarray(data, dtype=np.int64).astype(np.uint32)
+        value = data.view(np.float32).astype(np.float64)
+        return value
+
+    def valueToDataArray(self, values):
+        np = self._numpy()
+        values = np.asarray(values, dtype=np.float64).astype(np.float32)
+        data = values.view(np.uint32).astype(np.int64)
+        return data
+
@@ -115,3 +115,25 @@ class DPTXlator4ByteSigned(DPTXlatorBase):
         data = struct.unpack(">L", frame)[0]
         return data
 
+    def dataToValueArray(self, data):
+        np = self._numpy()
+        data = np.asarray(data, dtype=np.int64)
+        data = np.where(data >= 0x80000000, -((data - 1) ^ 0xffffffff), data)
+        if self._dpt is self.DPT_Value_FlowRate_m3h:
+            value = data / 10000.
+        else:
+            value = data
+        return value
+
+    def valueToDataArray(self, values):
+        np = self._numpy()
+        values = np.array(values)
+        negative = values < 0
+        if negative.any():
+            values[negative] = (abs(values[negative]) ^ 0xffffffff) + 1
+        if self._dpt is self.DPT_Value_FlowRate_m3h:
+            data = np.rint(values * 10000.)
+        else:
+            data = values
+        return data.astype(np.int64)
+
@@ -95,3 +95,13 @@ class DPTXlator4ByteUnsigned(DPTXlatorBase):
         data = struct.unpack(">L", frame)[0]
         return data
 
+    def dataToValueArray(self, data):
+        np = self._numpy()
+        value = np.asarray(data, dtype=np.int64)
+        return value
+
+    def valueToDataArray(self, values):
+        np = self._numpy()
+        data = np.asarray(values, dtype=np.int64)
+        return data
+
@@ -67,6 +67,9 @@ class DPTXlator8BitEncAbsValue(DPTXlatorBase):
 
     DPT_OccMode = DPT("20.003", "Occupancy mode", ("occupied", "standby", "not occupied"))
 
+    TABLE_SIZE = 0x100
+    ENCODE_TABLE = True
+
     def __init__(self, dptId):
         super(DPTXlator8BitEncAbsValue, self).__init__(dptId, 1)
 
@@ -76,9 +76,16 @@ class DPTXlator8BitSigned(DPTXlatorBase):
     DPT_Value_1_Count = DPT("6.010", "Signed count", (-128, 127), "pulses")
     #DPT_Status_Mode3 = DPT("6.020", "Status mode 3", (, ))
 
+    TABLE_SIZE = 0x100
+    ENCODE_TABLE = True
+
     def __init__(self, dptId):
         super(DPTXlator8BitSigned, self).__init__(dptId, 1)
 
+    @property
+    def _tableKey(self):
+        return self.DPT_Generic  # all DPTs decode the same way
+
     def checkData(self, data):
         if not 0x00 <= data <= 0xff:
             raise DPTXlatorValueError("data %s not in (0x00, 0xff)" % hex(data))
@@ -109,3 +116,15 @@ class DPTXlator8BitSigned(DPTXlatorBase):
         data = struct.unpack(">B", frame)[0]
         return data
 
+    def dataToValueArray(self, data):
+        np = self._numpy()
+        data = np.asarray(data, dtype=np.int64)
+        value = np.where(data >= 0x80, -((data - 1) ^ 0xff), data)
+        return value
+
+    def valueToDataArray(self, values):
+        np = self._numpy()
+        values = np.asarray(values, dtype=np.int64)
+        data = np.where(values < 0, (abs(values) ^ 0xff) + 1, values)
+        return data
+
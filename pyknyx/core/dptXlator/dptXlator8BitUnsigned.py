@@ -72,6 +72,9 @@ class DPTXlator8BitUnsigned(DPTXlatorBase):
     #DPT_Tariff = DPT("5.006", "Tariff", (0, 254), "ratio")
     DPT_Value_1_Ucount = DPT("5.010", "Unsigned count", (0, 255), "pulses")
 
+    TABLE_SIZE = 0x100
+    ENCODE_TABLE = True
+
     def __init__(self, dptId):
         super(DPTXlator8BitUnsigned, self).__init__(dptId, 1)
 
@@ -113,3 +116,27 @@ class DPTXlator8BitUnsigned(DPTXlatorBase):
         data = struct.unpack(">B", frame)[0]
         return data
 
+    def dataToValueArray(self, data):
+        np = self._numpy()
+        value = np.asarray(data, dtype=np.int64)
+        if self._dpt is self.DPT_Scaling:
+            value = value * 100. / 255.
+        elif self._dpt is self.DPT_Angle:
+            value = value * 360. / 255.
+        elif self._dpt is self.DPT_DecimalFactor:
+            value = value / 255.
+        return value
+
+    def valueToDataArray(self, values):
+        np = self._numpy()
+        values = np.asarray(values)
+        if self._dpt is self.DPT_Scaling:
+            data = np.rint(values * 255 / 100.)
+        elif self._dpt is self.DPT_Angle:
+            data = np.rint(values * 255 / 360.)
+        elif self._dpt is self.DPT_DecimalFactor:
+            data = np.rint(values * 255)
+        else:
+            data = values
+        return data.astype(np.int64)
+
@@ -35,13 +35,35 @@ Implements
 
  - B{DPTXlatorValueError}
  - B{DPTXlatorBase}
+ - B{INVALID}
 
 Documentation
 =============
 
+Besides the scalar conversions, each DPTXlator offers a bulk API working on NumPy arrays, for converting captured
+traffic or history: L{frameToDataArray<DPTXlatorBase.frameToDataArray>} reads a contiguous buffer of payloads,
+L{dataToValueArray<DPTXlatorBase.dataToValueArray>} converts an array of KNX encoded data to values, and
+L{valueToDataArray<DPTXlatorBase.valueToDataArray>}/L{dataToFrameArray<DPTXlatorBase.dataToFrameArray>} go the other
+way. Sub-classes override them with vectorized versions, giving exactly the same results as the scalar methods; the
+base class falls back to calling the scalar methods for each element.
+
+NumPy is optional: the bulk API raises L{DPTXlatorValueError} if it is not installed.
+
+DPTs with a small code space (TABLE_SIZE codes) also get lookup tables, built on first use and shared by the whole
+process: a decode table, indexed by the KNX encoded data, and, where the encoding is exact (ENCODE_TABLE), an encode
+table mapping each valid value to its data. L{lookupValue<DPTXlatorBase.lookupValue>} and
+L{lookupData<DPTXlatorBase.lookupData>} use them, and do the range checking at the same time; they fall back to the
+scalar methods for types without tables, and for values not in the tables.
+
 Usage
 =====
 
+>>> xlator = DPTXlator2ByteFloat("9.001")
+>>> xlator.framesToValues(b"\\x00\\x01\\x87\\xff")
+array([ 0.01, -0.01])
+>>> xlator.valuesToFrames([0.01, -0.01])
+b'\\x00\\x01\\x87\\xff'
+
 @author: Frédéric Mantegazza
 @author: B. Malinowsky
 @copyright: (C) 2013-2015 Frédéric Mantegazza
@@ -49,6 +71,11 @@ Usage
 @license: GPL
 """
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 from pyknyx.common.exception import PKNyXValueError
 from pyknyx.common.utils import reprStr
 from pyknyx.services.logger import logging; logger = logging.getLogger(__name__)
@@ -60,6 +87,9 @@ class DPTXlatorValueError(PKNyXValueError):
     """
 
 
+INVALID = object()  # marks the codes which can't be decoded, in decode tables
+
+
 class DPTXlatorBase(object):
     """ Base DPT translator class
 
@@ -78,11 +108,34 @@ class DPTXlatorBase(object):
     @ivar _typeSize: size of the data type. 0 for data size <= 6bits
     @type _typeSize: int
 
+    @ivar _decode: decode table of the current DPT, once looked up (empty if not available)
+    @type _decode: tuple
+
+    @ivar _encode: encode table of the current DPT, once looked up (empty if not available)
+    @type _encode: dict
+
     @ivar _data: KNX encoded data
     @type _data: depends on sub-class
 
+    @cvar TABLE_SIZE: number of codes of the data type, for which lookup tables are built (0 for no tables)
+    @type TABLE_SIZE: int
+
+    @cvar ENCODE_TABLE: True if an encode table can be built (exact, reversible encoding)
+    @type ENCODE_TABLE: bool
+
+    @cvar _decodeTables: decode tables, shared by all DPTXlators, per table key
+    @type _decodeTables: dict
+
+    @cvar _encodeTables: encode tables, shared by all DPTXlators, per table key
+    @type _encodeTables: dict
+
     @todo: remove the strValue stuff
     """
+    TABLE_SIZE = 0
+    ENCODE_TABLE = False
+
+    _decodeTables = {}
+    _encodeTables = {}
     def __new__(cls, *args, **kwargs):
         """ Init the class with all available types for this DPT
 
@@ -118,6 +171,8 @@ class DPTXlatorBase(object):
             logger.exception("DPTXlatorBase.__init__()")
             raise DPTXlatorValueError("unhandled DPT ID (%s)" % dptId)
         self._typeSize = typeSize
+        self._decode = None
+        self._encode = None
 
         self._data = None
 
@@ -150,6 +205,8 @@ class DPTXlatorBase(object):
         except KeyError:
             logger.exception("DPTXlatorBase.dpt")
             raise DPTXlatorValueError("unhandled DPT ID (%s)" % dptId)
+        self._decode = None
+        self._encode = None
 
     @property
     def typeSize(self):
@@ -230,3 +287,211 @@ class DPTXlatorBase(object):
         """
         raise NotImplementedError
 
+    @property
+    def _tableKey(self):
+        """ Key of the lookup tables of the current DPT
+
+        Sub-classes which decode all their DPTs the same way can share a single decode table.
+        """
+        return self._dpt
+
+    @property
+    def decodeTable(self):
+        """ Decode table of the current DPT, indexed by KNX encoded data (None if not available)
+
+        Codes which can't be decoded are set to L{INVALID}.
+        """
+        if not self.TABLE_SIZE:
+            return None
+        key = self._tableKey
+        try:
+            return DPTXlatorBase._decodeTables[key]
+        except KeyError:
+            pass
+        table = []
+        for data in range(self.TABLE_SIZE):
+            try:
+                table.append(self.dataToValue(data))
+            except (DPTXlatorValueError, LookupError):
+                table.append(INVALID)
+        return DPTXlatorBase._decodeTables.setdefault(key, tuple(table))
+
+    @property
+    def encodeTable(self):
+        """ Encode table of the current DPT, mapping valid values to KNX encoded data (None if not available)
+        """
+        if not self.ENCODE_TABLE:
+            return None
+        try:
+            return DPTXlatorBase._encodeTables[self._dpt]
+        except KeyError:
+            pass
+        table = {}
+        for data, value in enumerate(self.decodeTable):
+            if value is INVALID or value in table:
+                continue
+            try:
+                self.checkValue(value)
+                if self.valueToData(value) == data:
+                    table[value] = data
+            except (DPTXlatorValueError, LookupError, TypeError, ValueError):
+                pass
+        return DPTXlatorBase._encodeTables.setdefault(self._dpt, table)
+
+    def lookupValue(self, data):
+        """ Conversion from KNX encoded data to python value, using the decode table
+
+        Same as L{dataToValue}, but also checks the data.
+
+        @param data: KNX encoded data
+        @type data: int
+
+        @return: python value
+        @rtype: depends on the DPT
+
+        @raise DPTXlatorValueError: data can't be handled
+        """
+        table = self._decode
+        if table is None:
+            table = self._decode = self.decodeTable or ()
+        try:
+            if 0 <= data < len(table):
+                value = table[data]
+                if value is not INVALID:
+                    return value
+        except TypeError:
+            pass
+        self.checkData(data)
+        return self.dataToValue(data)
+
+    def lookupData(self, value):
+        """ Conversion from python value to KNX encoded data, using the encode table
+
+        Same as L{valueToData}, but also checks the value.
+
+        @param value: python value
+        @type value: depends on the DPT
+
+        @return: KNX encoded data
+        @rtype: int
+
+        @raise DPTXlatorValueError: value can't be handled
+        """
+        table = self._encode
+        if table is None:
+            table = self._encode = self.encodeTable or {}
+        if table:
+            try:
+                return table[value]
+            except (KeyError, TypeError):
+                pass
+        self.checkValue(value)
+        return self.valueToData(value)
+
+    @property
+    def frameSize(self):
+        """ Size of the frame holding the data (typeSize, or 1 for data size <= 6bits)
+        """
+        return self._typeSize or 1
+
+    @staticmethod
+    def _numpy():
+        """ Return the numpy module
+
+        @raise DPTXlatorValueError: numpy is not installed
+        """
+        if numpy is None:
+            raise DPTXlatorValueError("bulk conversions need numpy")
+        return numpy
+
+    def frameToDataArray(self, frames, stride=None):
+        """ Conversion from a buffer of bus frames to KNX encoded data
+
+        @param frames: contiguous buffer of frames, or array of frames (one row per frame)
+        @type frames: bytes-like or numpy.ndarray of uint8
+
+        @param stride: offset between 2 consecutive frames in the buffer (default to frame size)
+        @type stride: int
+
+        @return: KNX encoded data
+        @rtype: numpy.ndarray of int64 (of object if data does not fit)
+
+        @raise DPTXlatorValueError: the buffer ends with a partial frame
+        """
+        np = self._numpy()
+        size = self.frameSize
+        buf = np.ascontiguousarray(np.frombuffer(frames, dtype=np.uint8) if not isinstance(frames, np.ndarray)
+                                   else frames, dtype=np.uint8).reshape(-1)
+        if stride is None:
+            stride = size
+        if stride < size:
+            raise DPTXlatorValueError("stride (%d) smaller than frame size (%d)" % (stride, size))
+        nb = (len(buf) - size) // stride + 1 if len(buf) >= size else 0
+        trailing = len(buf) - (nb - 1) * stride - size if nb else len(buf)
+        if trailing > stride - size:
+            raise DPTXlatorValueError("buffer ends with a partial frame (%d bytes)" % trailing)
+        rows = np.lib.stride_tricks.as_strided(buf, shape=(nb, size), strides=(stride, 1), writeable=False)
+        if size > 7:
+            return np.array([self.frameToData(bytearray(row.tobytes())) for row in rows], dtype=object)
+        data = np.zeros(nb, dtype=np.int64)
+        for index in range(size):
+            data = (data << 8) | rows[:, index]
+        return data
+
+    def dataToFrameArray(self, data):
+        """ Conversion from KNX encoded data to a buffer of bus frames
+
+        @param data: KNX encoded data
+        @type data: array-like of int
+
+        @return: contiguous buffer of frames
+        @rtype: bytes
+        """
+        np = self._numpy()
+        size = self.frameSize
+        if size > 7:
+            return b"".join(bytes(self.dataToFrame(int(data_))) for data_ in data)
+        data = np.asarray(data, dtype=np.int64)
+        rows = np.empty((len(data), size), dtype=np.uint8)
+        for index in range(size):
+            rows[:, index] = (data >> (8 * (size - 1 - index))) & 0xff
+        return rows.tobytes()
+
+    def dataToValueArray(self, data):
+        """ Conversion from KNX encoded data to python values
+
+        @param data: KNX encoded data
+        @type data: array-like of int
+
+        @return: python values
+        @rtype: numpy.ndarray (one row per value for composite DPTs)
+        """
+        np = self._numpy()
+        return np.array([self.dataToValue(data_) for data_ in np.asarray(data).tolist()])
+
+    def valueToDataArray(self, values):
+        """ Conversion from python values to KNX encoded data
+
+        @param values: python values
+        @type values: array-like (one row per value for composite DPTs)
+
+        @return: KNX encoded data
+        @rtype: numpy.ndarray of int64
+        """
+        np = self._numpy()
+        dtype = np.int64 if self.frameSize <= 7 else object
+        return np.array([self.valueToData(value) for value in np.asarray(values).tolist()], dtype=dtype)
+
+    def framesToValues(self, frames, stride=None):
+        """ Conversion from a buffer of bus frames to python values
+
+        See L{frameToDataArray} and L{dataToValueArray}.
+        """
+        return self.dataToValueArray(self.frameToDataArray(frames, stride))
+
+    def valuesToFrames(self, values):
+        """ Conversion from python values to a buffer of bus frames
+
+        See L{valueToDataArray} and L{dataToFrameArray}.
+        """
+        return self.dataToFrameArray(self.valueToDataArray(values))
@@ -109,6 +109,9 @@ class DPTXlatorBoolean(DPTXlatorBase):
     DPT_Scene_AB = DPT("1.022", "Scene A/B", ("Scene A", "Scene B"))
     DPT_ShutterBlinds_Mode = DPT("1.023", "Shutter/Blinds mode", ("Only move Up/Down", "Move Up/Down + StepStop"))
 
+    TABLE_SIZE = 2
+    ENCODE_TABLE = True
+
     def __init__(self, dptId):
         super(DPTXlatorBoolean, self).__init__(dptId, 0)
 
@@ -145,3 +148,9 @@ class DPTXlatorBoolean(DPTXlatorBase):
         data = struct.unpack(">B", frame)[0]
         return data
 
+    def dataToValueArray(self, data):
+        np = self._numpy()
+        data = np.asarray(data, dtype=np.int64)
+        value = np.array(self._dpt.limits)[data]
+        return value
+
@@ -130,6 +130,26 @@ class DPTXlatorDate(DPTXlatorBase):
         data = data[0] << 16 | data[1] << 8 | data[2]
         return data
 
+    def dataToValueArray(self, data):
+        np = self._numpy()
+        data = np.asarray(data, dtype=np.int64)
+        day = (data >> 16) & 0x1f
+        month = (data >> 8) & 0x0f
+        year = data & 0x7f
+        year = year + np.where(year >= 69, 1900, 2000)
+        value = np.column_stack((day, month, year))
+        return value
+
+    def valueToDataArray(self, values):
+        np = self._numpy()
+        values = np.asarray(values, dtype=np.int64).reshape(-1, 3)
+        day = values[:, 0]
+        month = values[:, 1]
+        year = values[:, 2]
+        year = year - np.where(year >= 2000, 2000, 1900)
+        data = day << 16 | month << 8 | year
+        return data
+
     @property
     def day(self):
         return self.value[0]
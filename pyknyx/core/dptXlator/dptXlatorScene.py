@@ -69,6 +69,9 @@ class DPTXlatorScene(DPTXlatorBase):
 
     DPT_Date = DPT("17.001", "Scene", ((0, 0), (1, 63)))
 
+    TABLE_SIZE = 0x100
+    ENCODE_TABLE = True
+
     def __init__(self, dptId):
         super(DPTXlatorScene, self).__init__(dptId, 1)
 
@@ -102,6 +105,22 @@ class DPTXlatorScene(DPTXlatorBase):
         data = struct.unpack(">B", frame)[0]
         return data
 
+    def dataToValueArray(self, data):
+        np = self._numpy()
+        data = np.asarray(data, dtype=np.int64)
+        ctrl = (data >> 7) & 0x01
+        scene = data & 0x3f
+        value = np.column_stack((ctrl, scene))
+        return value
+
+    def valueToDataArray(self, values):
+        np = self._numpy()
+        values = np.asarray(values, dtype=np.int64).reshape(-1, 2)
+        ctrl = values[:, 0]
+        scene = values[:, 1]
+        data = ctrl << 7 | scene
+        return data
+
     @property
     def ctrl(self):
         return self.value[0]
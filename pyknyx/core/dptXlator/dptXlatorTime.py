@@ -111,6 +111,26 @@ class DPTXlatorTime(DPTXlatorBase):
         data = data[0] << 16 | data[1] << 8 | data[2]
         return data
 
+    def dataToValueArray(self, data):
+        np = self._numpy()
+        data = np.asarray(data, dtype=np.int64)
+        wDay = (data >> 21) & 0x07
+        hour = (data >> 16) & 0x1f
+        min_ = (data >> 8) & 0x3f
+        sec = data & 0x3f
+        value = np.column_stack((wDay, hour, min_, sec))
+        return value
+
+    def valueToDataArray(self, values):
+        np = self._numpy()
+        values = np.asarray(values, dtype=np.int64).reshape(-1, 4)
+        wDay = values[:, 0]
+        hour = values[:, 1]
+        min_ = values[:, 2]
+        sec = values[:, 3]
+        data = wDay << 21 | hour << 16 | min_ << 8 | sec
+        return data
+
     @property
     def weekDay(self):
         wDay = self.value[0]
@@ -47,18 +47,25 @@ Usage
 """
 
 import six
+import collections
+import itertools
 import threading
+import time
 
 from pyknyx.common.exception import PKNyXValueError
 from pyknyx.common.singleton import Singleton
-from pyknyx.services.logger import logging; logger = logging.getLogger(__name__)
+from pyknyx.services.logger import logging, HOT_PATH; logger = logging.getLogger(__name__)
 from pyknyx.stack.flags import Flags
 from pyknyx.stack.priority import Priority
 from pyknyx.stack.individualAddress import IndividualAddress
 from pyknyx.stack.groupAddress import GroupAddress
+from pyknyx.stack.groupAddressPattern import GroupAddressPattern
 from pyknyx.services.scheduler import Scheduler
 from pyknyx.services.notifier import Notifier
 from pyknyx.services.groupAddressTableMapper import GroupAddressTableMapper
+from pyknyx.core.initReader import InitReader
+from pyknyx.core.groupState import GroupState
+from pyknyx.stack.layer7.readCoordinator import ReadCoordinator
 from pyknyx.stack.priorityQueue import PriorityQueue
 from pyknyx.stack.layer2.l_dataService import PRIORITY_DISTRIBUTION
 from pyknyx.stack.transceiver.udpTransceiver import UDPTransceiver
@@ -80,25 +87,116 @@ class ETS(threading.Thread):
     @ivar _running: flag whether ETS has been started
     @type _devices: bool
 
+    @ivar _unindexedLayer2: transports which get group frames according to their wantsGroupFrame()
+    @type _unindexedLayer2: frozenset of L{L_DataServiceBase<pyknyx.stack.layer2.l_dataServiceBase>}
+
+    @ivar _groupIndex: transports subscribed to each group address (raw), GroupMonitor subscribers included
+    @type _groupIndex: dict of frozenset
+
+    @ivar _groupMonitors: transports subscribed to all group addresses
+    @type _groupMonitors: frozenset
+
+    The subscription index is copied on write, so that the ETS thread can read it without locking.
+
+    @ivar _addrTable: transport each source individual address (raw) was last seen on, with the time, oldest first
+    @type _addrTable: OrderedDict of (L{L_DataServiceBase<pyknyx.stack.layer2.l_dataServiceBase>}, float)
+
+    @ivar _addrTableSize: max. number of entries in the address table
+    @type _addrTableSize: int
+
+    @ivar _addrTableAge: time after which an address table entry expires (s)
+    @type _addrTableAge: float
+
+    @ivar _localDelivery: deliver frames between in-process stacks directly from putFrame
+    @type _localDelivery: bool
+
+    @ivar _localLayer2: in-process transports (see L{L_DataServiceBase.local<pyknyx.stack.layer2.l_dataServiceBase>})
+    @type _localLayer2: frozenset of L{L_DataServiceBase<pyknyx.stack.layer2.l_dataServiceBase>}
+
+    @ivar _localPending: frames waiting for local delivery, per thread
+    @type _localPending: threading.local
+
+    @ivar _initReader: reads the initial state of the group addresses
+    @type _initReader: L{InitReader<pyknyx.core.initReader>}
+
+    @ivar _readCoordinator: merges the group reads of all stacks, and answers them from recently seen values
+    @type _readCoordinator: L{ReadCoordinator<pyknyx.stack.layer7.readCoordinator>}
+
+    @ivar _groupState: last value seen on each group address
+    @type _groupState: L{GroupState<pyknyx.core.groupState>}
+
     raise ETSValueError:
     """
     _running = False
+    BATCH_SIZE = 32  # max. number of frames taken from the queue at once
 
     def __init__(self, addr, addrRange=-1,
                  transCls=UDPTransceiver,
-                 transParams=dict(mcastAddr="224.0.23.12", mcastPort=3671)):
+                 transParams=dict(mcastAddr="224.0.23.12", mcastPort=3671),
+                 addrTableSize=1024, addrTableAge=300,
+                 queueCapacity=None, queuePolicy="drop-oldest", queueTimeout=1., localDelivery=False,
+                 initReadParams=None, readParams=None, groupStateParams=None):
         """
         Set up the ETS stack.
 
         @param addr: the physical address of this stack (and possibly its sole device)
+
+        @param addrTableSize: max. number of individual addresses remembered for unicast routing
+        @type addrTableSize: int
+
+        @param addrTableAge: time after which a remembered individual address is forgotten (s)
+        @type addrTableAge: float
+
+        @param queueCapacity: max. number of frames waiting to be processed, for all priorities or per priority level
+                              (None for no limit)
+        @type queueCapacity: int or list/tuple of int
+
+        @param queuePolicy: what to do with a new frame when its priority level is full ("drop-oldest",
+                            "drop-newest" or "block"), for all priorities or per priority level
+        @type queuePolicy: str or list/tuple of str
+
+        @param queueTimeout: max. time a producer waits for room, with the "block" policy (s); the ETS thread itself
+                             (e.g. a local stack answering a read) never waits, its frames are dropped at once
+        @type queueTimeout: float
+
+        @param localDelivery: deliver frames sent by an in-process stack to the other in-process stacks directly, in
+                              the sending thread, instead of through the queue and the ETS thread; the frames are
+                              still queued for the other transports. Stacks then receive frames from several threads.
+        @type localDelivery: bool
+
+        @param initReadParams: parameters of the initial reads (see L{InitReader<pyknyx.core.initReader>})
+        @type initReadParams: dict
+
+        @param readParams: parameters of the reads coordination (see
+                           L{ReadCoordinator<pyknyx.stack.layer7.readCoordinator>})
+        @type readParams: dict
+
+        @param groupStateParams: parameters of the group addresses state (see L{GroupState<pyknyx.core.groupState>})
+        @type groupStateParams: dict
         """
         super(ETS, self).__init__()
+        if addrTableSize < 1:
+            raise ETSValueError("invalid addrTableSize (%d)" % addrTableSize)
         self._devices = set()
         self._layer2 = set()
+        self._unindexedLayer2 = frozenset()
+        self._groupIndex = {}
+        self._groupMonitors = frozenset()
+        self._indexLock = threading.Lock()
+        self._addrTable = collections.OrderedDict()
+        self._addrTableSize = addrTableSize
+        self._addrTableAge = addrTableAge
+        self._queueParams = dict(capacity=queueCapacity, policy=queuePolicy, timeout=queueTimeout)
+        self._localDelivery = localDelivery
+        self._localLayer2 = frozenset()
+        self._localPending = threading.local()
+        self._initReader = InitReader(**(initReadParams or {}))
+        self._readCoordinator = ReadCoordinator(onCacheHit=self._initReader.answerInd, **(readParams or {}))
+        self._groupState = GroupState(**(groupStateParams or {}))
         self._addr = addr
         self._addrNum = addrRange
         self._addrAlloc = addr
-        self._queue = PriorityQueue(PRIORITY_DISTRIBUTION)
+        self._queue = self._newQueue()
 
         self._scheduler = Scheduler()
         self.setDaemon(True)
@@ -128,6 +226,46 @@ class ETS(threading.Thread):
     def addr(self):
         return self._addr
 
+    @property
+    def initReader(self):
+        return self._initReader
+
+    @property
+    def readCoordinator(self):
+        return self._readCoordinator
+
+    @property
+    def groupState(self):
+        return self._groupState
+
+    def initRead(self, group):
+        """ Read the initial state of a group
+
+        The read is sent by the L{InitReader<pyknyx.core.initReader>}, once ETS is started; reads of the same group
+        address by several devices are merged.
+        """
+        self._initReader.add(group)
+
+    @property
+    def queueStats(self):
+        """ Depth metrics of the queue of frames waiting to be processed, per priority level
+
+        See L{PriorityQueue.stats<pyknyx.stack.priorityQueue.PriorityQueue.stats>}.
+        """
+        return self._queue.stats
+
+    def _newQueue(self):
+        return PriorityQueue(PRIORITY_DISTRIBUTION, onDrop=self._dropFrame, **self._queueParams)
+
+    def _dropFrame(self, msg):
+        """ Called by the queue for each frame dropped because the queue is full
+        """
+        if msg is None:
+            return
+        l2, cEMI = msg
+        logger.debug("ETS._dropFrame(): queue full; drop %s from %s", cEMI, l2)
+        cEMI.release()
+
     @property
     def gadMap(self):
         return self._gadMap
@@ -138,9 +276,56 @@ class ETS(threading.Thread):
 
     def addLayer2(self, layer2):
         self._layer2.add(layer2)
+        if not layer2.groupIndexed:
+            self._unindexedLayer2 = self._unindexedLayer2 | {layer2}
+        if layer2.local:
+            self._localLayer2 = self._localLayer2 | {layer2}
         if self._running:
             layer2.start()
 
+    def subscribeGroup(self, layer2, gad):
+        """
+        Deliver the frames sent to a group address to a transport
+
+        Only used for transports with groupIndexed set; see L{A_GroupDataService.subscribe<pyknyx.stack.layer7.a_groupDataService.A_GroupDataService.subscribe>}.
+
+        @param gad: group address; if null, all group frames are delivered
+        @type gad: L{GroupAddress}
+        """
+        with self._indexLock:
+            if gad.isNull:
+                if layer2 not in self._groupMonitors:
+                    self._groupIndex = dict((raw, subscribers | {layer2}) for raw, subscribers in self._groupIndex.items())
+                    self._groupMonitors = self._groupMonitors | {layer2}
+            else:
+                subscribers = self._groupIndex.get(gad.raw, self._groupMonitors)
+                if layer2 not in subscribers:
+                    self._groupIndex[gad.raw] = subscribers | {layer2}
+
+    def _learnAddr(self, raw, layer2, now):
+        """ Remember on which transport an individual address was seen
+        """
+        addrTable = self._addrTable
+        if raw in addrTable:
+            del addrTable[raw]
+        elif len(addrTable) >= self._addrTableSize:
+            addrTable.popitem(last=False)
+        addrTable[raw] = (layer2, now)
+
+    def _lookupAddr(self, raw, now):
+        """ Find the transport an individual address was last seen on
+
+        @return: transport, or None if the address is unknown or its entry expired
+        """
+        try:
+            layer2, seen = self._addrTable[raw]
+        except KeyError:
+            return None
+        if now - seen > self._addrTableAge:
+            del self._addrTable[raw]
+            return None
+        return layer2
+
     def register(self, device, buildingMap='root'):
         """
         Register a device
@@ -174,8 +359,10 @@ class ETS(threading.Thread):
             except KeyError:
                 raise ETSValueError("no Group Object associated with this datapoint (%s)" % dp)
 
-            # Get GroupAddress
-            if not isinstance(gad, GroupAddress):
+            # Get GroupAddress (or GroupAddressPattern)
+            if GroupAddressPattern.isPattern(gad):
+                gad = GroupAddressPattern(gad)
+            elif not isinstance(gad, GroupAddress):
                 gad = GroupAddress(gad)
 
             # Ask the group data service to subscribe this GroupObject to the given gad
@@ -184,12 +371,18 @@ class ETS(threading.Thread):
 
             # If not already done, set the GroupObject group. This group will be used when the GroupObject wants to
             # communicate on the bus. This mimics the S flag of ETS real application.
+            # A wildcard group can't be used to communicate.
             # @todo: find a better way
-            if groupObject.group is None:
+            if groupObject.group is None and isinstance(gad, GroupAddress):
                 groupObject.group = group
 
         if self._running:
-            device.start()
+            self._startDevice(device)
+
+    def _startDevice(self, device):
+        """ Start a device registered while ETS is running
+        """
+        device.start()
 
     def putFrame(self, l2, cEMI):
         """
@@ -198,7 +391,13 @@ class ETS(threading.Thread):
         @param cEMI:
         @type cEMI:
         """
-        logger.debug("ETS.putFrame(): cEMI=%s" % cEMI)
+        if HOT_PATH and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("ETS.putFrame(): cEMI=%s", cEMI)
+
+        if self._localDelivery and l2.local:
+            self._deliverLocal(l2, cEMI)
+            if len(self._layer2) == len(self._localLayer2):
+                return
 
         # Get priority from cEMI
         priority = cEMI.priority
@@ -206,10 +405,63 @@ class ETS(threading.Thread):
         # Add to inQueue and notify inQueue handler
         self._queue.add((l2,cEMI), priority)
 
+    def putFrames(self, l2, cEMIs):
+        """
+        Add several frames, received together from the same layer2, to be processed.
+
+        @param cEMIs: frames to process, in reception order
+        @type cEMIs: list of L{CEMILData<pyknyx.stack.cemi.cemiLData>}
+        """
+        if HOT_PATH and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("ETS.putFrames(): %d frames", len(cEMIs))
+
+        self._queue.addBatch(((l2,cEMI), cEMI.priority) for cEMI in cEMIs)
+
+    def _deliverLocal(self, l2, cEMI):
+        """ Deliver a frame sent by an in-process stack to the other in-process stacks
+
+        Frames sent while delivering (by listeners reacting to the frame) are not delivered recursively, but
+        queued, and delivered in priority order once the current frame has been delivered to all stacks.
+        """
+        pending = getattr(self._localPending, "queue", None)
+        if pending is not None:
+            pending.add((l2, cEMI), cEMI.priority)
+            return
+
+        self._localPending.queue = pending = PriorityQueue(PRIORITY_DISTRIBUTION)
+        try:
+            pending.add((l2, cEMI), cEMI.priority)
+            while len(pending):
+                l2, cEMI = pending.remove()
+                try:
+                    self._processLocal(l2, cEMI)
+                except Exception:
+                    logger.exception("ETS._deliverLocal()")
+        finally:
+            self._localPending.queue = None
+
+    def _processLocal(self, l2, cEMI):
+        """ Forward the frame @cEMI, sent by the in-process stack @l2, to the other in-process stacks
+        """
+        if HOT_PATH and logger.isEnabledFor(logging.TRACE):
+            logger.trace("local: get %s from %s", cEMI, l2)
+        destAddr = cEMI.destinationAddress
+        if isinstance(destAddr, GroupAddress):
+            self._initReader.frameInd(cEMI)
+            self._readCoordinator.frameInd(cEMI)
+            self._groupState.frameInd(cEMI)
+            for dev in itertools.chain(self._unindexedLayer2, self._groupIndex.get(destAddr.raw, self._groupMonitors)):
+                if dev.local and dev is not l2 and dev.wantsGroupFrame(cEMI):
+                    dev.dataInd(cEMI)
+        elif isinstance(destAddr, IndividualAddress):
+            for dev in self._localLayer2:
+                if dev is not l2 and dev.wantsIndividualFrame(cEMI):
+                    dev.dataInd(cEMI)
+
     def start(self):
         if self._running:
             return
-        self._queue = PriorityQueue(PRIORITY_DISTRIBUTION) # clean start
+        self._queue = self._newQueue() # clean start
         super(ETS,self).start()
 
     def run(self):
@@ -221,24 +473,46 @@ class ETS(threading.Thread):
             for dev in self._devices:
                 dev.start()
             self._scheduler.start()
+            self._initReader.start()  # last: reads can be answered (and the initial state complete) right away
             while self._running:
-                logger.trace("ETS.run(): looping")
-                msg = self._queue.remove()
-                if msg is None:
-                    logger.trace("ETS.run(): exit: None")
-                    return
-                l2,cEMI = msg
-                self.processFrame(l2,cEMI)
+                if HOT_PATH and logger.isEnabledFor(logging.TRACE):
+                    logger.trace("ETS.run(): looping")
+                msgs = self._queue.removeBatch(ETS.BATCH_SIZE)
+                for index, msg in enumerate(msgs):
+                    if msg is None:
+                        logger.trace("ETS.run(): exit: None")
+                        self._releaseFrames(msgs[index + 1:])
+                        return
+                    l2,cEMI = msg
+                    try:
+                        self.processFrame(l2,cEMI)
+                    finally:
+                        cEMI.release()
             logger.trace("ETS.run(): exit: !_running")
         except Exception:
             logger.exception("ETS main loop")
         finally:
             self._running = False
 
+            # Frames left in the queue won't be processed (start() uses a new queue)
+            while len(self._queue):
+                msgs = self._queue.removeBatch(ETS.BATCH_SIZE, timeout=0)
+                if not msgs:
+                    break
+                self._releaseFrames(msgs)
+
+    def _releaseFrames(self, msgs):
+        """ Give back the receive buffers of frames which won't be processed
+        """
+        for msg in msgs:
+            if msg is not None:
+                msg[1].release()
+
     def stop(self):
         self._running = False
         self._scheduler.stop()
-        self._queue.add(None,Priority('system'))
+        self._initReader.stop()
+        self._queue.add(None,Priority('system'),force=True)
         for dev in self._devices:
             dev.stop()
         for dev in self._layer2:
@@ -248,10 +522,19 @@ class ETS(threading.Thread):
         """
         Forward the frame @cEMI, received from layer2 device @l2, to all
         other eligible interfaces.
+
+        In-process stacks are skipped if they already got the frame from L{putFrame} (local delivery).
         """
 
-        logger.trace("recv: get %s from %s", cEMI, l2)
+        trace = HOT_PATH and logger.isEnabledFor(logging.TRACE)
+        if trace:
+            logger.trace("recv: get %s from %s", cEMI, l2)
         destAddr = cEMI.destinationAddress
+        now = time.time()
+        srcRaw = cEMI.frame.sa
+        if srcRaw:
+            self._learnAddr(srcRaw, l2, now)
+        skipLocal = self._localDelivery and l2.local
 
         hopCount = cEMI.hopCount
         if hopCount == 7:
@@ -271,44 +554,71 @@ class ETS(threading.Thread):
         else:
             cEMI_b = cEMI
         if isinstance(destAddr, GroupAddress):
+            if not skipLocal:  # already seen by _processLocal()
+                self._initReader.frameInd(cEMI)
+                self._readCoordinator.frameInd(cEMI)
+                self._groupState.frameInd(cEMI)
             r = 'wantsGroupFrame'
             may_force = False
+            layer2 = itertools.chain(self._unindexedLayer2, self._groupIndex.get(destAddr.raw, self._groupMonitors))
         elif isinstance(destAddr, IndividualAddress):
+            dev = self._lookupAddr(destAddr.raw, now)
+            if dev is not None:
+                # Known destination: forward to its transport only (nothing to do if it is where the frame comes from)
+                cEMI_x = cEMI_b if dev.hop else cEMI
+                if dev is l2 or (skipLocal and dev.local):
+                    if trace:
+                        logger.trace("recv: local: %s", l2)
+                elif not cEMI_x:
+                    logger.debug("recv %s: not forwarded (hopcount zero): %s", l2, cEMI)
+                else:
+                    dev.dataInd(cEMI_x)
+                return
             r = 'wantsIndividualFrame'
             may_force = True
+            layer2 = self._layer2
         else:
             logger.warning("recv %s: unsupported destination address type (%s)", l2, repr(destAddr))
             return
         done = skipped = False
-        for dev in self._layer2:
+        for dev in layer2:
             if l2 == dev:
-                logger.trace("recv: same: %s", l2)
+                if trace:
+                    logger.trace("recv: same: %s", l2)
+                continue
+            if skipLocal and dev.local:
+                done = done or getattr(dev,r)(cEMI)
                 continue
             cEMI_x = cEMI_b if dev.hop else cEMI
             if not cEMI_x:
-                logger.trace("recv: skip: %s", l2)
+                if trace:
+                    logger.trace("recv: skip: %s", l2)
                 skipped = True
             elif getattr(dev,r)(cEMI):
-                logger.trace("recv: sent: %s", l2)
-                dev.dataInd(cEMI)
+                if trace:
+                    logger.trace("recv: sent: %s", l2)
+                dev.dataInd(cEMI_x)
                 done = True
             else:
-                logger.trace("recv: notsent: %s", l2)
+                if trace:
+                    logger.trace("recv: notsent: %s", l2)
         if may_force and not done:
             # We never saw this address. Send to every broadcast device.
-            logger.trace("recv: repeat")
+            if trace:
+                logger.trace("recv: repeat")
             for dev in self._layer2:
-                if l2 == dev:
+                if l2 == dev or (skipLocal and dev.local):
                     continue
                 cEMI_x = cEMI_b if dev.hop else cEMI
                 if cEMI_x and getattr(dev,r)(cEMI, force=True):
+                    dev.dataInd(cEMI_x)
                     done = True
             if not done:
-                logger.debug("recv %s: unknown destination address (%s)", repr(destAddr))
+                logger.debug("recv %s: unknown destination address (%s)", l2, repr(destAddr))
         if skipped:
-            logger.debug("recv %s: not forwarded (hopcount zero): %s from %s", l2, cEMI)
+            logger.debug("recv %s: not forwarded (hopcount zero): %s", l2, cEMI)
         elif not done:
-            logger.debug("recv %s: not sendable: %s from %s", l2, cEMI)
+            logger.debug("recv %s: not sendable: %s", l2, cEMI)
 
 
     def getGrOAT(self, device=None, by="gad", outFormatLevel=3):
@@ -52,7 +52,7 @@ Usage
 from pyknyx.common.exception import PKNyXValueError
 from pyknyx.common.utils import reprStr
 from pyknyx.common.frozenDict import FrozenDict
-from pyknyx.services.logger import logging; logger = logging.getLogger(__name__)
+from pyknyx.services.logger import logging, HOT_PATH; logger = logging.getLogger(__name__)
 from pyknyx.services.notifier import Notifier
 from pyknyx.core.datapoint import Datapoint
 from pyknyx.core.groupObject import GroupObject
@@ -99,7 +99,7 @@ class FunctionalBlock(object):
         for cls_ in classes:
             for key, value in cls_.__dict__.items():
                 if key.startswith("DP_"):
-                    logger.debug("FunctionalBlock.__new__(): %s=(%s)" % (key, repr(value)))
+                    logger.debug("FunctionalBlock.__new__(): %s=(%r)", key, value)
                     name = value['name']
                     if name in datapoints:
                         raise FunctionalBlockValueError("duplicated Datapoint (%s)" % name)
@@ -111,7 +111,7 @@ class FunctionalBlock(object):
         for cls_ in classes:
             for key, value in cls_.__dict__.items():
                 if key.startswith("GO_"):
-                    logger.debug("FunctionalBlock.__new__(): %s=(%s)" % (key, repr(value)))
+                    logger.debug("FunctionalBlock.__new__(): %s=(%r)", key, value)
                     try:
                         datapoint = self._datapoints[value['dp']]
                     except KeyError:
@@ -208,7 +208,8 @@ class FunctionalBlock(object):
 
         @todo: use an Event as param
         """
-        logger.debug("FunctionalBlock.notify(): dp=%s, oldValue=%s, newValue=%s" % (dp, oldValue, newValue))
+        if HOT_PATH and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("FunctionalBlock.notify(): dp=%s, oldValue=%s, newValue=%s", dp, oldValue, newValue)
 
         Notifier().datapointNotify(self, dp, oldValue, newValue)
 
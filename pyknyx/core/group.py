@@ -53,7 +53,7 @@ Usage
 """
 
 from pyknyx.common.exception import PKNyXValueError
-from pyknyx.services.logger import logging; logger = logging.getLogger(__name__)
+from pyknyx.services.logger import logging, HOT_PATH; logger = logging.getLogger(__name__)
 from pyknyx.stack.layer7.a_groupDataListener import A_GroupDataListener
 from pyknyx.stack.groupAddress import GroupAddress
 
@@ -103,7 +103,8 @@ class Group(A_GroupDataListener):
         return "<Group('%s')>" % self._gad
 
     def groupValueWriteInd(self, src, priority, data):
-        logger.debug("Group.groupValueWriteInd(): src=%s, priority=%s, data=%s" % (src, priority, repr(data)))
+        if HOT_PATH and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Group.groupValueWriteInd(): src=%s, priority=%s, data=%r", src, priority, data)
         for listener in self._listeners:
             try:
                 listener.onWrite(src, data)
@@ -111,7 +112,8 @@ class Group(A_GroupDataListener):
                 logger.exception("Group.groupValueWriteInd()")
 
     def groupValueReadInd(self, src, priority):
-        logger.debug("Group.groupValueReadInd(): src=%s, priority=%s" % (src, priority))
+        if HOT_PATH and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Group.groupValueReadInd(): src=%s, priority=%s", src, priority)
         for listener in self._listeners:
             try:
                 listener.onRead(src)
@@ -119,7 +121,8 @@ class Group(A_GroupDataListener):
                 logger.exception("Group.groupValueReadInd()")
 
     def groupValueReadCon(self, src, priority, data):
-        logger.debug("Group.groupValueReadCon(): src=%s, priority=%s, data=%s" % (src, priority, repr(data)))
+        if HOT_PATH and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Group.groupValueReadCon(): src=%s, priority=%s, data=%r", src, priority, data)
         for listener in self._listeners:
             try:
                 listener.onResponse(src, data)
@@ -40,6 +40,12 @@ Documentation
 
 This is the base class for L{Group<pyknyx.core.group>} listeners.
 
+The data given to the callbacks may be a memoryview on the received frame. It is only valid during the call; a
+listener which wants to keep it must copy it (bytearray(data)).
+
+Listeners subscribed to a L{GroupAddressPattern<pyknyx.stack.groupAddressPattern>} get the concrete GAD of the
+telegram as the B{gad} keyword argument (see L{WildcardGroup<pyknyx.core.wildcardGroup>}); it is None otherwise.
+
 Usage
 =====
 
@@ -59,17 +65,17 @@ class GroupListener(object):
         """
         super(GroupListener, self).__init__()
 
-    def onWrite(self, src, data):
+    def onWrite(self, src, data, gad=None):
         """
         """
         raise NotImplementedError
 
-    def onRead(self, src):
+    def onRead(self, src, gad=None):
         """
         """
         raise NotImplementedError
 
-    def onResponse(self, src, data):
+    def onResponse(self, src, data, gad=None):
         """
         """
         raise NotImplementedError
@@ -42,6 +42,10 @@ Documentation
 A B{GroupMonitor} is a special L{Group<pyknyx.core.group>} which handles all group addresses. Unlink normal
 L{Group<pyknyx.core.group>}, it can't send anything on the bus.
 
+Listeners can be added with a L{GroupMonitorFilter<pyknyx.core.groupMonitorFilter>}, to only get the telegrams
+they are interested in. The monitor keeps the union of the group addresses bitsets of its listeners, so the
+telegrams no listener wants are skipped with a single bit test.
+
 Usage
 =====
 
@@ -51,8 +55,10 @@ Usage
 """
 
 from pyknyx.common.exception import PKNyXValueError
-from pyknyx.services.logger import logging; logger = logging.getLogger(__name__)
+from pyknyx.services.logger import logging, HOT_PATH; logger = logging.getLogger(__name__)
+from pyknyx.core.groupMonitorFilter import BITSET_SIZE
 from pyknyx.stack.layer7.a_groupDataListener import A_GroupDataListener
+from pyknyx.stack.layer7.apci import APCI
 
 
 class GroupMonitorValueError(PKNyXValueError):
@@ -70,6 +76,15 @@ class GroupMonitor(A_GroupDataListener):
 
     @ivar _listeners: Listeners bound to the group handled GAD
     @type _listeners: set of L{GroupObject<pyknyx.core.groupObject>}
+
+    @ivar _filters: filter of each listener (None for no filter)
+    @type _filters: dict of L{GroupMonitorFilter<pyknyx.core.groupMonitorFilter>}
+
+    @ivar _subscriptions: (listener, filter) tuples, for dispatching
+    @type _subscriptions: tuple
+
+    @ivar _gadBits: union of the group addresses bitsets of the listeners, or None if a listener wants all addresses
+    @type _gadBits: bytearray
     """
     def __init__(self, agds):
         """ Init the GroupMonitor object
@@ -84,34 +99,46 @@ class GroupMonitor(A_GroupDataListener):
         self._agds = agds
 
         self._listeners = set()
+        self._filters = {}
+        self._subscriptions = ()
+        self._gadBits = bytearray(BITSET_SIZE)
 
     def __repr__(self):
-        return "<GroupMonitor()>" % self._gad
+        return "<GroupMonitor()>"
 
     def __str__(self):
-        return "<GroupMonitor()>" % self._gad
+        return "<GroupMonitor()>"
 
     def groupValueWriteInd(self, src, gad, priority, data):
-        logger.debug("GroupMonitor.groupValueWriteInd(): src=%s, gad=%s, priority=%s, data=%s" % \
-                       (src, gad, priority, repr(data)))
-        for listener in self._listeners:
+        if HOT_PATH and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("GroupMonitor.groupValueWriteInd(): src=%s, gad=%s, priority=%s, data=%r",
+                         src, gad, priority, data)
+        for listener, filter_ in self._subscriptions:
+            if filter_ is not None and not filter_.match(src, gad, APCI.GROUPVALUE_WRITE):
+                continue
             try:
                 listener.onWrite(src, gad, priority, data)
             except PKNyXValueError:
                 logger.exception("GroupMonitor.groupValueWriteInd()")
 
     def groupValueReadInd(self, src, gad, priority):
-        logger.debug("GroupMonitor.groupValueReadInd(): src=%s, gad=%s, priority=%s" % (src, gad, priority))
-        for listener in self._listeners:
+        if HOT_PATH and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("GroupMonitor.groupValueReadInd(): src=%s, gad=%s, priority=%s", src, gad, priority)
+        for listener, filter_ in self._subscriptions:
+            if filter_ is not None and not filter_.match(src, gad, APCI.GROUPVALUE_READ):
+                continue
             try:
                 listener.onRead(src, gad, priority)
             except PKNyXValueError:
                 logger.exception("GroupMonitor.groupValueReadInd()")
 
     def groupValueReadCon(self, src, gad, priority, data):
-        logger.debug("GroupMonitor.groupValueReadCon(): src=%s, gad=%s, priority=%s, data=%s" % \
-                       (src, gad, priority, repr(data)))
-        for listener in self._listeners:
+        if HOT_PATH and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("GroupMonitor.groupValueReadCon(): src=%s, gad=%s, priority=%s, data=%r",
+                         src, gad, priority, data)
+        for listener, filter_ in self._subscriptions:
+            if filter_ is not None and not filter_.match(src, gad, APCI.GROUPVALUE_RES):
+                continue
             try:
                 listener.onResponse(src, gad, priority, data)
             except PKNyXValueError:
@@ -121,15 +148,38 @@ class GroupMonitor(A_GroupDataListener):
     def listeners(self):
         return self._listeners
 
-    def addListener(self, listener):
+    @property
+    def gadBits(self):
+        """ Group addresses at least one listener wants, as a bitset, or None for all addresses
+
+        @rtype: bytearray
+        """
+        return self._gadBits
+
+    def addListener(self, listener, monitorFilter=None):
         """ Add a listener to this group
 
-        The given listener is added to the listeners bound with the GAD handled by this group.
+        The given listener is added to the listeners bound with the GAD handled by this group. If the listener is
+        already bound, its filter is replaced.
 
         @param listener: Listener
         @type listener: L{GroupMonitorListener<pyknyx.core.groupMonitorListener>}
 
+        @param monitorFilter: telegrams the listener wants (None for all)
+        @type monitorFilter: L{GroupMonitorFilter<pyknyx.core.groupMonitorFilter>}
+
         @todo: check listener type
         """
         self._listeners.add(listener)
+        self._filters[listener] = monitorFilter
+        self._subscriptions = tuple(self._filters.items())
+
+        union = 0
+        for monitorFilter in self._filters.values():
+            if monitorFilter is None or monitorFilter.gadBits is None:
+                self._gadBits = None
+                break
+            union |= int.from_bytes(monitorFilter.gadBits, "little")
+        else:
+            self._gadBits = bytearray(union.to_bytes(BITSET_SIZE, "little"))
 
@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+
+""" Python KNX framework
+
+License
+=======
+
+ - B{pKNyX} (U{http://www.pyknyx.org}) is Copyright:
+  - (C) 2013-2015 Frédéric Mantegazza
+
+This program is free software; you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation; either version 2 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program; if not, write to the Free Software
+Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+or see:
+
+ - U{http://www.gnu.org/licenses/gpl.html}
+
+Module purpose
+==============
+
+Group data service management
+
+Implements
+==========
+
+ - B{GroupMonitorFilterValueError}
+ - B{GroupMonitorFilter}
+
+Documentation
+=============
+
+A B{GroupMonitorFilter} selects the group telegrams a L{GroupMonitorListener<pyknyx.core.groupMonitorListener>}
+wants to get, by group address (main/middle groups, explicit addresses), source address range and APCI types.
+
+The group addresses are stored as a 65536 bits bitset (one bit per raw address), so the
+L{GroupMonitor<pyknyx.core.groupMonitor>} can test a telegram against a listener, or against the union of all its
+listeners, with a single bit test.
+
+Usage
+=====
+
+>>> from pyknyx.stack.layer7.apci import APCI
+>>> f = GroupMonitorFilter(main=4, middle=1, gads=("5/0/1",), src=("1.1.0", "1.1.255"), apci=(APCI.GROUPVALUE_WRITE,))
+>>> f.match(IndividualAddress("1.1.12"), GroupAddress("4/1/3"), APCI.GROUPVALUE_WRITE)
+True
+>>> f.match(IndividualAddress("1.1.12"), GroupAddress("4/2/3"), APCI.GROUPVALUE_WRITE)
+False
+
+@author: Frédéric Mantegazza
+@copyright: (C) 2013-2015 Frédéric Mantegazza
+@license: GPL
+"""
+
+from pyknyx.common.exception import PKNyXValueError
+from pyknyx.services.logger import logging; logger = logging.getLogger(__name__)
+from pyknyx.stack.groupAddress import GroupAddress, GroupAddressValueError
+from pyknyx.stack.individualAddress import IndividualAddress, IndividualAddressValueError
+from pyknyx.stack.layer7.apci import APCI
+
+BITSET_SIZE = 0x10000 // 8
+
+
+class GroupMonitorFilterValueError(PKNyXValueError):
+    """
+    """
+
+
+class GroupMonitorFilter(object):
+    """ GroupMonitorFilter class
+
+    A telegram matches the filter if its group address is selected (by main/middle group or explicitly; all
+    addresses if none are given), and its source address and APCI are accepted.
+
+    @ivar _gadBits: group addresses bitset (bit raw & 7 of byte raw >> 3), or None for all addresses
+    @type _gadBits: bytearray
+
+    @ivar _src: source addresses range (raw, inclusive), or None for all addresses
+    @type _src: tuple of int
+
+    @ivar _apci: accepted APCI, or None for all
+    @type _apci: frozenset of int
+    """
+    APCIS = (APCI.GROUPVALUE_READ, APCI.GROUPVALUE_RES, APCI.GROUPVALUE_WRITE)
+
+    __slots__ = ("_gadBits", "_src", "_apci")
+
+    def __init__(self, main=None, middle=None, gads=None, src=None, apci=None):
+        """ Create a new filter
+
+        @param main: main group(s) to select, as a single value or a (first, last) range
+        @type main: int or tuple of int
+
+        @param middle: middle group(s) to select in the main group(s), as a single value or a (first, last) range
+        @type middle: int or tuple of int
+
+        @param gads: group addresses to select, in addition to the main/middle groups
+        @type gads: iterable of L{GroupAddress} or str
+
+        @param src: source addresses to accept, as a single address or a (first, last) range
+        @type src: L{IndividualAddress} or str or tuple
+
+        @param apci: APCI to accept (APCI.GROUPVALUE_READ, APCI.GROUPVALUE_RES, APCI.GROUPVALUE_WRITE)
+        @type apci: iterable of int
+
+        raise GroupMonitorFilterValueError:
+        """
+        super(GroupMonitorFilter, self).__init__()
+
+        if main is None and gads is None:
+            if middle is not None:
+                raise GroupMonitorFilterValueError("middle group given without main group")
+            self._gadBits = None
+        else:
+            self._gadBits = bits = bytearray(BITSET_SIZE)
+            if main is not None:
+                firstMain, lastMain = self._range(main, 0x1f)
+                if middle is None:
+                    bits[firstMain << 8:(lastMain + 1) << 8] = b"\xff" * ((lastMain - firstMain + 1) << 8)
+                else:
+                    firstMiddle, lastMiddle = self._range(middle, 0x07)
+                    for main_ in range(firstMain, lastMain + 1):
+                        start = (main_ << 11 | firstMiddle << 8) >> 3
+                        stop = (main_ << 11 | (lastMiddle + 1) << 8) >> 3
+                        bits[start:stop] = b"\xff" * (stop - start)
+            if gads is not None:
+                try:
+                    for gad in gads:
+                        raw = GroupAddress(gad).raw
+                        bits[raw >> 3] |= 1 << (raw & 7)
+                except GroupAddressValueError:
+                    raise GroupMonitorFilterValueError("invalid group address (%r)" % gad)
+
+        if src is None:
+            self._src = None
+        else:
+            if not isinstance(src, tuple):
+                src = (src, src)
+            try:
+                first, last = [IndividualAddress(addr).raw for addr in src]
+            except (ValueError, IndividualAddressValueError):
+                raise GroupMonitorFilterValueError("invalid source address range (%r)" % (src,))
+            if first > last:
+                raise GroupMonitorFilterValueError("invalid source address range (%r)" % (src,))
+            self._src = (first, last)
+
+        if apci is None:
+            self._apci = None
+        else:
+            self._apci = frozenset(apci)
+            if not self._apci or not self._apci.issubset(GroupMonitorFilter.APCIS):
+                raise GroupMonitorFilterValueError("invalid APCI (%r)" % (apci,))
+
+    def __repr__(self):
+        return "<GroupMonitorFilter(gads=%s, src=%r, apci=%r)>" % \
+               ("all" if self._gadBits is None else len(self), self._src,
+                None if self._apci is None else sorted(self._apci))
+
+    def __len__(self):
+        """ Number of group addresses selected
+        """
+        if self._gadBits is None:
+            return 0x10000
+        return sum(bin(byte).count("1") for byte in self._gadBits)
+
+    @staticmethod
+    def _range(value, max_):
+        """ Check a (first, last) range, or a single value
+        """
+        if not isinstance(value, tuple):
+            value = (value, value)
+        try:
+            first, last = value
+        except ValueError:
+            raise GroupMonitorFilterValueError("invalid range (%r)" % (value,))
+        if not 0 <= first <= last <= max_:
+            raise GroupMonitorFilterValueError("invalid range (%r)" % (value,))
+        return first, last
+
+    @property
+    def gadBits(self):
+        """ Group addresses bitset, or None if all addresses are selected
+
+        @rtype: bytearray
+        """
+        return self._gadBits
+
+    def match(self, src, gad, apci):
+        """ Test if a telegram matches the filter
+
+        @param src: source address
+        @type src: L{IndividualAddress}
+
+        @param gad: group address
+        @type gad: L{GroupAddress}
+
+        @param apci: APCI of the telegram
+        @type apci: int
+
+        @rtype: bool
+        """
+        bits = self._gadBits
+        if bits is not None:
+            raw = gad.raw
+            if not bits[raw >> 3] & 1 << (raw & 7):
+                return False
+        if self._src is not None and not self._src[0] <= src.raw <= self._src[1]:
+            return False
+        if self._apci is not None and apci not in self._apci:
+            return False
+        return True
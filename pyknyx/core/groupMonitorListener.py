@@ -40,6 +40,9 @@ Documentation
 
 This is the base class for L{GroupMonitor<pyknyx.core.group>} listeners.
 
+The data given to the callbacks may be a memoryview on the received frame. It is only valid during the call; a
+listener which wants to keep it must copy it (bytearray(data)).
+
 Usage
 =====
 
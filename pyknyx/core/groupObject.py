@@ -49,7 +49,7 @@ Usage
 """
 
 from pyknyx.common.exception import PKNyXValueError
-from pyknyx.services.logger import logging; logger = logging.getLogger(__name__)
+from pyknyx.services.logger import logging, HOT_PATH; logger = logging.getLogger(__name__)
 from pyknyx.core.groupListener import GroupListener
 from pyknyx.stack.flags import Flags
 from pyknyx.stack.priority import Priority
@@ -78,7 +78,7 @@ class GroupObject(GroupListener):
     @todo: take 'access' into account when managing flags
     @todo: add lock for user
     """
-    def __init__(self, datapoint, flags=Flags(), priority=Priority()):
+    def __init__(self, datapoint, flags=Flags("CRT"), priority=Priority('low')):
         """
 
         @param datapoint: associated datapoint
@@ -124,7 +124,9 @@ class GroupObject(GroupListener):
 
         @todo: transmit a more generic object, like SignalEvent? Or a dict?
         """
-        logger.debug("GroupObject._slotChanged(): dp=%s, oldValue=%s, newValue=%s" % (self._datapoint.name, repr(oldValue), repr(newValue)))
+        if HOT_PATH and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("GroupObject._slotChanged(): dp=%s, oldValue=%r, newValue=%r",
+                         self._datapoint.name, oldValue, newValue)
 
         if self._group is not None and self._flags.communicate:
             if (oldValue != newValue and self._flags.transmit) or self._flags.stateless:
@@ -151,7 +153,7 @@ class GroupObject(GroupListener):
         return self._priority
 
     @priority.setter
-    def priority(str, level):
+    def priority(self, priority):
         if not isinstance(priority, Priority):
             priority = Priority(priority)
         self._priority = priority
@@ -175,15 +177,21 @@ class GroupObject(GroupListener):
     def name(self):
         return self._datapoint.name
 
-    def onWrite(self, src, data):
-        logger.debug("GroupObject.onWrite(): src=%s, data=%s" % (src, repr(data)))
+    def onWrite(self, src, data, gad=None):
+        if HOT_PATH and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("GroupObject.onWrite(): src=%s, data=%r, gad=%s", src, data, gad)
 
         # Check if datapoint should be updated
         if self._flags.write:  # and data != self.datapoint.data:
             self.datapoint.frame = data
 
-    def onRead(self, src):
-        logger.debug("GroupObject.onRead(): src=%s" % src)
+    def onRead(self, src, gad=None):
+        if HOT_PATH and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("GroupObject.onRead(): src=%s, gad=%s", src, gad)
+
+        # Read requests received through a pattern are not answered: the GroupObject can only send on its own group
+        if gad is not None:
+            return
 
         # Check if data should be send over the bus
         if self._flags.communicate:
@@ -191,8 +199,9 @@ class GroupObject(GroupListener):
                 frame, size = self._datapoint.frame
                 self._group.response(self._priority, frame, size)
 
-    def onResponse(self, src, data):
-        logger.debug("GroupObject.onResponse(): src=%s, data=%s" % (src, repr(data)))
+    def onResponse(self, src, data, gad=None):
+        if HOT_PATH and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("GroupObject.onResponse(): src=%s, data=%r, gad=%s", src, data, gad)
 
         # Check if datapoint should be updated
         if self._flags.update:  # and data != self.datapoint.data:
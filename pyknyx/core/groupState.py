@@ -0,0 +1,249 @@
+# -*- coding: utf-8 -*-
+
+""" Python KNX framework
+
+License
+=======
+
+ - B{pKNyX} (U{http://www.pyknyx.org}) is Copyright:
+  - (C) 2013-2015 Frédéric Mantegazza
+
+This program is free software; you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation; either version 2 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program; if not, write to the Free Software
+Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+or see:
+
+ - U{http://www.gnu.org/licenses/gpl.html}
+
+Module purpose
+==============
+
+Group addresses state
+
+Implements
+==========
+
+ - B{GroupState}
+ - B{GroupStateValueError}
+
+Documentation
+=============
+
+The B{GroupState} of ETS remembers the last value written or answered on each group address, with its source
+address, the time it was seen and a sequence number, so that UIs, bridges or tools can get the current state of the
+bus without sending reads. ETS gives it all group frames.
+
+The state is stored in compact arrays indexed by raw group address. Updates are serialized by a lock, but reads are
+lock-free: a reader checks the sequence number of the entry did not change while it read it (an entry being
+updated has a negative sequence number).
+
+Each update gets the next sequence number; L{GroupState.changes} gives the group addresses updated since a given
+sequence number, from a ring log of the last updates (falling back to a scan of the whole table when the log
+doesn't go back far enough).
+
+Usage
+=====
+
+>>> state = ets.groupState
+>>> state.get("1/1/1")
+(12, <GroupAddress('1/1/1')>, <IndividualAddress('1.1.14')>, b'\\x01', 1445952000.5)
+>>> seq = state.lastSeq
+>>> ...
+>>> for seq_, gad, src, data, timestamp in state.changes(seq):
+...     print(gad, data)
+
+@author: Frédéric Mantegazza
+@copyright: (C) 2013-2015 Frédéric Mantegazza
+@license: GPL
+"""
+
+
+import array
+import threading
+import time
+
+from pyknyx.common.exception import PKNyXValueError
+from pyknyx.services.logger import logging; logger = logging.getLogger(__name__)
+from pyknyx.stack.groupAddress import GroupAddress
+from pyknyx.stack.individualAddress import IndividualAddress
+from pyknyx.stack.layer7.apci import APCI
+from pyknyx.stack.layer7.apdu import APDU
+
+SIZE = 0x10000  # number of group addresses
+
+
+class GroupStateValueError(PKNyXValueError):
+    """
+    """
+
+
+class GroupState(object):
+    """ GroupState class
+
+    @ivar _seq: sequence number of the last update of each group address (0 if never seen, < 0 while updated)
+    @type _seq: array of int
+
+    @ivar _data: last value of each group address (None if never seen)
+    @type _data: list of bytes
+
+    @ivar _src: source address (raw) of the last value of each group address
+    @type _src: array of int
+
+    @ivar _timestamp: time the last value of each group address was seen
+    @type _timestamp: array of float
+
+    @ivar _log: group address (raw) updated by the last logSize updates, indexed by sequence number % logSize
+    @type _log: array of int
+
+    @ivar _lastSeq: sequence number of the last update
+    @type _lastSeq: int
+    """
+    def __init__(self, logSize=4096, clock=time.time):
+        """
+
+        @param logSize: number of updates remembered for L{changes}
+        @type logSize: int
+
+        @param clock: time source
+        @type clock: callable
+
+        raise GroupStateValueError:
+        """
+        super(GroupState, self).__init__()
+
+        if logSize < 1:
+            raise GroupStateValueError("invalid logSize (%r)" % logSize)
+        self._clock = clock
+
+        self._seq = array.array('q', bytes(8 * SIZE))
+        self._data = SIZE * [None]
+        self._src = array.array('H', bytes(2 * SIZE))
+        self._timestamp = array.array('d', bytes(8 * SIZE))
+        self._log = array.array('H', bytes(2 * logSize))
+        self._logSize = logSize
+        self._lastSeq = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        """ Number of group addresses seen
+        """
+        return SIZE - self._data.count(None)
+
+    @property
+    def lastSeq(self):
+        """ Sequence number of the last update (0 if none)
+        """
+        return self._lastSeq
+
+    def frameInd(self, cEMI):
+        """ Remember the value of a group frame
+
+        Called by ETS for each group frame; only group value writes and responses are used.
+        """
+        nPDU = cEMI.npdu
+        if len(nPDU) < 3 or ((nPDU[1] << 8 | nPDU[2]) & APCI._4) not in (APCI.GROUPVALUE_WRITE, APCI.GROUPVALUE_RES):
+            return
+        frame = cEMI.frame
+        self.update(frame.da, frame.sa, bytes(APDU.getGroupValue(nPDU[1:])))  # the frame may be a view
+
+    def update(self, raw, src, data):
+        """ Set the value of a group address
+
+        @param raw: group address (raw)
+        @type raw: int
+
+        @param src: source address (raw)
+        @type src: int
+
+        @param data: value
+        @type data: bytes
+        """
+        timestamp = self._clock()
+        with self._lock:
+            seq = self._lastSeq + 1
+            self._seq[raw] = -seq  # readers retry until the entry is consistent
+            self._data[raw] = data
+            self._src[raw] = src
+            self._timestamp[raw] = timestamp
+            self._seq[raw] = seq
+            self._log[seq % self._logSize] = raw
+            self._lastSeq = seq
+
+    def _get(self, raw):
+        """ Read the entry of a group address, without lock
+
+        @return: (seq, data, src, timestamp), or None if never seen
+        """
+        seqs = self._seq
+        while True:
+            seq = seqs[raw]
+            if not seq:
+                return None
+            if seq > 0:
+                entry = (seq, self._data[raw], self._src[raw], self._timestamp[raw])
+                if seqs[raw] == seq:
+                    return entry
+            time.sleep(0)  # let the writer finish
+
+    def get(self, gad):
+        """ Get the last value of a group address
+
+        @param gad: group address
+        @type gad: L{GroupAddress} or str or int
+
+        @return: (seq, gad, src, data, timestamp), or None if no value was seen
+        @rtype: tuple
+        """
+        gad = GroupAddress(gad)
+        entry = self._get(gad.raw)
+        if entry is None:
+            return None
+        seq, data, src, timestamp = entry
+        return seq, gad, IndividualAddress(src), data, timestamp
+
+    def changes(self, since=0):
+        """ Iterate over the group addresses updated after a sequence number
+
+        Each group address is given once, with its last value, in update order. Group addresses updated again while
+        the changes are collected are given at the end, so a caller taking L{lastSeq} afterwards doesn't miss them.
+
+        @param since: sequence number (usually a previous L{lastSeq})
+        @type since: int
+
+        @return: (seq, gad, src, data, timestamp) tuples
+        @rtype: iterator
+        """
+        last = self._lastSeq
+        if since < 0:
+            since = 0
+        if last - since <= self._logSize:
+            raws = []
+            later = []
+            log, logSize, seqs = self._log, self._logSize, self._seq
+            for seq in range(since + 1, last + 1):
+                raw = log[seq % logSize]
+                current = abs(seqs[raw])
+                if current == seq:  # not updated again since
+                    raws.append(raw)
+                elif current > last and raw not in later:  # updated after last, out of the scanned range
+                    later.append(raw)
+            raws.extend(later)
+        else:
+            raws = sorted((raw for raw, seq in enumerate(self._seq) if seq > since or seq < -since),
+                          key=lambda raw: abs(self._seq[raw]))
+
+        for raw in raws:
+            entry = self._get(raw)
+            if entry is not None and entry[0] > since:
+                seq, data, src, timestamp = entry
+                yield seq, GroupAddress(raw), IndividualAddress(src), data, timestamp
@@ -0,0 +1,349 @@
+# -*- coding: utf-8 -*-
+
+""" Python KNX framework
+
+License
+=======
+
+ - B{pKNyX} (U{http://www.pyknyx.org}) is Copyright:
+  - (C) 2013-2015 Frédéric Mantegazza
+
+This program is free software; you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation; either version 2 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program; if not, write to the Free Software
+Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+or see:
+
+ - U{http://www.gnu.org/licenses/gpl.html}
+
+
+Module purpose
+==============
+
+Initial state reading
+
+Implements
+==========
+
+ - B{InitReader}
+ - B{InitReaderValueError}
+
+Documentation
+=============
+
+When ETS starts, the Group Objects with the I flag set read the current state of their group address. The reads of
+all devices are handed to the ETS L{InitReader}, which:
+
+ - reads each group address only once, whatever the number of devices/Group Objects bound to it;
+ - paces the reads according to a bus-load budget (reads per second), with up to window reads in flight;
+ - considers a group address answered when a response (or a write, which carries the state as well) is seen on it;
+ - reads the group addresses which did not answer again, up to retries times, waiting longer before each retry;
+ - sets its complete event when all group addresses either answered or failed.
+
+Usage
+=====
+
+>>> reader = InitReader(rate=10, window=4)
+>>> reader.add(group)
+>>> reader.start()
+>>> reader.wait(30)
+True
+>>> reader.failed
+[]
+
+@author: Frédéric Mantegazza
+@copyright: (C) 2013-2015 Frédéric Mantegazza
+@license: GPL
+"""
+
+
+import heapq
+import threading
+import time
+
+from pyknyx.common.exception import PKNyXValueError
+from pyknyx.services.logger import logging; logger = logging.getLogger(__name__)
+from pyknyx.stack.layer7.apci import APCI
+from pyknyx.stack.priority import Priority
+from pyknyx.stack.tokenBucket import TokenBucket
+
+
+class InitReaderValueError(PKNyXValueError):
+    """
+    """
+
+
+class InitReader(threading.Thread):
+    """ InitReader class
+
+    @ivar _groups: group used to read each group address (raw)
+    @type _groups: dict of L{Group<pyknyx.core.group>}
+
+    @ivar _tries: number of reads sent so far for each group address (raw) which did not answer yet
+    @type _tries: dict of int
+
+    @ivar _todo: group addresses (raw) to read, with the time they can be read at
+    @type _todo: heap of (float, int, int) tuples
+
+    @ivar _inFlight: time the read is considered lost, for each group address (raw) being read
+    @type _inFlight: dict of float
+
+    @ivar _answered: group addresses (raw) which answered
+    @type _answered: set of int
+
+    @ivar _failed: group addresses (raw) which never answered
+    @type _failed: set of int
+
+    @ivar _complete: set when all group addresses either answered or failed
+    @type _complete: threading.Event
+
+    @ivar _changed: set when something happened since the last step (group address added or answered, stop)
+    @type _changed: bool
+
+    raise InitReaderValueError:
+    """
+    def __init__(self, rate=10., window=8, timeout=2., retries=2, backoff=1., priority=Priority('low'),
+                 clock=time.monotonic):
+        """
+
+        @param rate: max. number of reads sent per second (bus-load budget)
+        @type rate: float
+
+        @param window: max. number of reads waiting for their response
+        @type window: int
+
+        @param timeout: time after which a read without response is considered lost (s)
+        @type timeout: float
+
+        @param retries: number of times a read without response is repeated
+        @type retries: int
+
+        @param backoff: delay before the first retry; doubled for each following retry (s)
+        @type backoff: float
+
+        @param priority: priority of the reads
+        @type priority: L{Priority<pyknyx.stack.priority>}
+
+        @param clock: time source
+        @type clock: callable
+
+        raise InitReaderValueError:
+        """
+        super(InitReader, self).__init__(name="InitReader")
+
+        if window < 1:
+            raise InitReaderValueError("invalid window (%r)" % window)
+        if timeout <= 0:
+            raise InitReaderValueError("invalid timeout (%r)" % timeout)
+        if retries < 0:
+            raise InitReaderValueError("invalid retries (%r)" % retries)
+        self._bucket = TokenBucket(rate, clock=clock)
+        self._clock = clock
+        self._window = window
+        self._timeout = timeout
+        self._retries = retries
+        self._backoff = backoff
+        self._priority = priority
+
+        self._groups = {}
+        self._tries = {}
+        self._todo = []
+        self._seq = 0
+        self._inFlight = {}
+        self._answered = set()
+        self._failed = set()
+        self._complete = threading.Event()
+        self._changed = False
+        self._condition = threading.Condition()
+        self._running = False
+        self.daemon = True
+
+    @property
+    def complete(self):
+        return self._complete.is_set()
+
+    @property
+    def answered(self):
+        with self._condition:
+            return sorted(self._groups[raw].gad for raw in self._answered)
+
+    @property
+    def failed(self):
+        with self._condition:
+            return sorted(self._groups[raw].gad for raw in self._failed)
+
+    @property
+    def stats(self):
+        """ Progress of the initial reads
+
+         - pending: number of group addresses still waiting for an answer
+         - inFlight: number of reads waiting for their response
+         - answered: number of group addresses which answered
+         - failed: number of group addresses which never answered
+        """
+        with self._condition:
+            return dict(pending=len(self._tries), inFlight=len(self._inFlight), answered=len(self._answered),
+                        failed=len(self._failed))
+
+    def wait(self, timeout=None):
+        """ Wait until all group addresses either answered or failed
+
+        @param timeout: max. time to wait (s); None to wait forever
+        @type timeout: float
+
+        @return: True if the initial state is complete
+        @rtype: bool
+        """
+        return self._complete.wait(timeout)
+
+    def add(self, group):
+        """ Read the state of a group address
+
+        Group addresses already added (by another device) are ignored.
+
+        @param group: group used to send the read
+        @type group: L{Group<pyknyx.core.group>}
+        """
+        raw = group.gad.raw
+        with self._condition:
+            if raw in self._groups:
+                return
+            self._groups[raw] = group
+            self._tries[raw] = 0
+            self._push(0., raw)
+            self._complete.clear()
+            self._changed = True
+            self._condition.notify()
+
+    def _push(self, when, raw):
+        self._seq += 1
+        heapq.heappush(self._todo, (when, self._seq, raw))
+
+    def frameInd(self, cEMI):
+        """ Check if a group frame answers a read
+
+        Called by ETS for each group frame.
+        """
+        raw = cEMI.frame.da
+        if raw not in self._tries:
+            return
+        nPDU = cEMI.npdu
+        if len(nPDU) < 3 or ((nPDU[1] << 8 | nPDU[2]) & APCI._4) == APCI.GROUPVALUE_READ:
+            return
+        self.answerInd(raw)
+
+    def answerInd(self, raw):
+        """ Consider a group address answered
+
+        Called for each group frame answering a read, and for each read answered from the cache (see
+        L{ReadCoordinator<pyknyx.stack.layer7.readCoordinator>}).
+
+        @param raw: group address (raw)
+        @type raw: int
+        """
+        if raw not in self._tries:
+            return
+        with self._condition:
+            if self._tries.pop(raw, None) is not None:
+                self._inFlight.pop(raw, None)
+                self._answered.add(raw)
+                if not self._tries:
+                    self._complete.set()
+                self._changed = True
+                self._condition.notify()
+
+    def _step(self, now):
+        """ Handle lost reads and send the next ones
+
+        The reads are sent without the lock held, as they can be answered (see L{answerInd}) by another thread
+        (ETS) waiting for it.
+
+        @return: time to wait before the next step (s), or None if there is nothing to wait for
+        @rtype: float
+        """
+        with self._condition:
+            delay, groups = self._schedule(now)
+        for group in groups:
+            try:
+                group.read(self._priority)
+            except Exception:
+                logger.exception("InitReader._step()")
+        return delay
+
+    def _schedule(self, now):
+        """ Handle lost reads and pick the next ones
+
+        Must be called with the lock held.
+
+        @return: time to wait before the next step (s), or None if there is nothing to wait for, and groups to read
+        @rtype: tuple of (float, list of L{Group<pyknyx.core.group>})
+        """
+        self._changed = False
+        delays = []
+        groups = []
+
+        for raw, deadline in list(self._inFlight.items()):
+            if now < deadline:
+                delays.append(deadline - now)
+                continue
+            del self._inFlight[raw]
+            tries = self._tries[raw]
+            if tries > self._retries:
+                logger.warning("InitReader._schedule(): no answer from %s" % self._groups[raw].gad)
+                del self._tries[raw]
+                self._failed.add(raw)
+            else:
+                logger.debug("InitReader._schedule(): no answer from %s; retry %d", self._groups[raw].gad, tries)
+                self._push(now + self._backoff * 2 ** (tries - 1), raw)
+
+        todo = self._todo
+        while todo and len(self._inFlight) < self._window:
+            when, seq, raw = todo[0]
+            if raw not in self._tries:
+                heapq.heappop(todo)  # answered while waiting
+                continue
+            if when > now:
+                delays.append(when - now)
+                break
+            delay = self._bucket.take()
+            if delay:
+                delays.append(delay)
+                break
+            heapq.heappop(todo)
+            self._tries[raw] += 1
+            self._inFlight[raw] = now + self._timeout
+            delays.append(self._timeout)
+            groups.append(self._groups[raw])
+
+        if not self._tries:
+            self._complete.set()
+
+        return (min(delays) if delays else None), groups
+
+    def run(self):
+        logger.debug("InitReader.run(): starting")
+        while self._running:
+            delay = self._step(self._clock())
+            with self._condition:
+                if self._running and not self._changed:
+                    self._condition.wait(delay)
+        logger.debug("InitReader.run(): stopped")
+
+    def start(self):
+        self._running = True
+        super(InitReader, self).start()
+
+    def stop(self):
+        with self._condition:
+            self._running = False
+            self._changed = True
+            self._condition.notify()
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+
+""" Python KNX framework
+
+License
+=======
+
+ - B{pKNyX} (U{http://www.pyknyx.org}) is Copyright:
+  - (C) 2013-2015 Frédéric Mantegazza
+
+This program is free software; you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation; either version 2 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program; if not, write to the Free Software
+Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+or see:
+
+ - U{http://www.gnu.org/licenses/gpl.html}
+
+Module purpose
+==============
+
+Group data service management
+
+Implements
+==========
+
+ - B{WildcardGroupValueError}
+ - B{WildcardGroup}
+
+Documentation
+=============
+
+A B{WildcardGroup} is identified by a L{GroupAddressPattern<pyknyx.stack.groupAddressPattern>}. It contains all
+listeners bound to this pattern, and dispatches them the group data events of all matching GADs, with the concrete
+GAD given as the B{gad} keyword argument:
+
+ - onWrite(src, data, gad=gad)
+ - onRead(src, gad=gad)
+ - onResponse(src, data, gad=gad)
+
+As it handles several GADs, a WildcardGroup can't send anything on the bus.
+
+Usage
+=====
+
+@author: Frédéric Mantegazza
+@copyright: (C) 2013-2015 Frédéric Mantegazza
+@license: GPL
+"""
+
+from pyknyx.common.exception import PKNyXValueError
+from pyknyx.services.logger import logging, HOT_PATH; logger = logging.getLogger(__name__)
+from pyknyx.stack.layer7.a_groupDataListener import A_GroupDataListener
+from pyknyx.stack.groupAddressPattern import GroupAddressPattern
+
+
+class WildcardGroupValueError(PKNyXValueError):
+    """
+    """
+
+
+class WildcardGroup(A_GroupDataListener):
+    """ WildcardGroup class
+
+    @ivar _pattern: pattern identifying this group
+    @type _pattern: L{GroupAddressPattern}
+
+    @ivar _agds: Application Group Data Service object
+    @type _agds: L{A_GroupDataService}
+
+    @ivar _listeners: Listeners bound to the group handled pattern
+    @type _listeners: set of L{GroupObject<pyknyx.core.groupObject>}
+    """
+    def __init__(self, pattern, agds):
+        """ Init the WildcardGroup object
+
+        @param pattern: pattern identifying this group
+        @type pattern: L{GroupAddressPattern} or str
+
+        @param agds: Application Group Data Service object
+        @type agds: L{A_GroupDataService}
+
+        raise WildcardGroupValueError:
+        """
+        super(WildcardGroup, self).__init__()
+
+        if not isinstance(pattern, GroupAddressPattern):
+            pattern = GroupAddressPattern(pattern)
+        self._pattern = pattern
+
+        self._agds = agds
+
+        self._listeners = set()
+
+    def __repr__(self):
+        return "<WildcardGroup(pattern='%s')>" % self._pattern
+
+    def __str__(self):
+        return "<WildcardGroup('%s')>" % self._pattern
+
+    def groupValueWriteInd(self, src, gad, priority, data):
+        if HOT_PATH and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("WildcardGroup.groupValueWriteInd(): src=%s, gad=%s, priority=%s, data=%r",
+                         src, gad, priority, data)
+        for listener in self._listeners:
+            try:
+                listener.onWrite(src, data, gad=gad)
+            except PKNyXValueError:
+                logger.exception("WildcardGroup.groupValueWriteInd()")
+
+    def groupValueReadInd(self, src, gad, priority):
+        if HOT_PATH and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("WildcardGroup.groupValueReadInd(): src=%s, gad=%s, priority=%s", src, gad, priority)
+        for listener in self._listeners:
+            try:
+                listener.onRead(src, gad=gad)
+            except PKNyXValueError:
+                logger.exception("WildcardGroup.groupValueReadInd()")
+
+    def groupValueReadCon(self, src, gad, priority, data):
+        if HOT_PATH and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("WildcardGroup.groupValueReadCon(): src=%s, gad=%s, priority=%s, data=%r",
+                         src, gad, priority, data)
+        for listener in self._listeners:
+            try:
+                listener.onResponse(src, data, gad=gad)
+            except PKNyXValueError:
+                logger.exception("WildcardGroup.groupValueReadCon()")
+
+    @property
+    def pattern(self):
+        return self._pattern
+
+    @property
+    def listeners(self):
+        return self._listeners
+
+    def addListener(self, listener):
+        """ Add a listener to this group
+
+        The given listener is added to the listeners bound with the pattern handled by this group.
+
+        @param listener: Listener
+        @type listener: L{GroupListener<pyknyx.core.groupListener>}
+
+        @todo: check listener type
+        """
+        self._listeners.add(listener)
@@ -134,7 +134,7 @@ class SimpleGroupObject(GroupListener):
 
         self._queue.acquire()
         try:
-            self._queue.insert(0, data)
+            self._queue.insert(0, bytearray(data))
             self._queue.notify()
         finally:
             self._queue.release()
@@ -168,7 +168,7 @@ class SimpleGroupMonitorObject(GroupMonitorListener):
         logger.debug("SimpleGroupMonitorObject.onWrite(): src=%s, gad=%s, priority=%s, data=%s" % \
                        (src, gad, priority, repr(data)))
 
-        self._enqueue("GROUPVALUE_WRITE", src, gad, priority, data)
+        self._enqueue("GROUPVALUE_WRITE", src, gad, priority, bytearray(data))
 
     def onRead(self, src, gad, priority):
         logger.debug("SimpleGroupMonitorObject.onRead(): src=%s, gad=%s, priority=%s" % (src, gad, priority))
@@ -179,7 +179,7 @@ class SimpleGroupMonitorObject(GroupMonitorListener):
         logger.debug("SimpleGroupMonitorObject.onResponse(): src=%s, gad=%s, priority=%s, data=%s" % \
                        (src, gad, priority, repr(data)))
 
-        self._enqueue("GROUPVALUE_RESP", src, gad, priority, data)
+        self._enqueue("GROUPVALUE_RESP", src, gad, priority, bytearray(data))
 
     @property
     def queue(self):
@@ -60,6 +60,11 @@ from pyknyx.common.singleton import Singleton
 from pyknyx.services.loggerFormatter import DefaultFormatter, ColorFormatter, \
                                            SpaceFormatter, SpaceColorFormatter
 logging.raiseExceptions = 0
+
+# Debug/trace logging on the telegram hot path: calls there are guarded by 'if HOT_PATH and logger.isEnabledFor(...)'
+# so, when off (config.LOGGER_HOT_PATH, or python -O), they cost a global lookup; set before importing the stack
+HOT_PATH = __debug__ and config.LOGGER_HOT_PATH
+
 logging.TRACE = logging.DEBUG
 logging.EXCEPTION = logging.ERROR + 5
 logging.addLevelName(logging.TRACE, "TRACE")
@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+
+""" Python KNX framework
+
+License
+=======
+
+ - B{pKNyX} (U{http://www.pyknyx.org}) is Copyright:
+  - (C) 2013-2015 Frédéric Mantegazza
+
+This program is free software; you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation; either version 2 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program; if not, write to the Free Software
+Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+or see:
+
+ - U{http://www.gnu.org/licenses/gpl.html}
+
+
+Module purpose
+==============
+
+Queue management, asyncio flavour
+
+Implements
+==========
+
+ - B{AsyncPriorityQueue}
+
+Documentation
+=============
+
+Same priority handling as L{PriorityQueue<pyknyx.stack.priorityQueue>}, but each priority level is an asyncio.Queue,
+and waiting for an element is a coroutine instead of a blocking call. Not thread-safe: use it from the event loop
+thread only (see loop.call_soon_threadsafe()).
+
+Usage
+=====
+
+>>> queue = AsyncPriorityQueue((-1, 3, 2, 1))
+>>> queue.add(obj, Priority('low'))
+>>> obj = await queue.remove()
+
+@author: Frédéric Mantegazza
+@copyright: (C) 2013-2015 Frédéric Mantegazza
+@license: GPL
+"""
+
+
+import asyncio
+
+from pyknyx.services.logger import logging; logger = logging.getLogger(__name__)
+from pyknyx.stack.priorityQueue import PriorityQueueValueError
+
+
+class AsyncPriorityQueue(object):
+    """ AsyncPriorityQueue class
+
+    @ivar _priorityDistribution: determines the handling of the different priorities
+    @type _priorityDistribution: list/tuple of int
+
+    @ivar _queues: one queue per priority level
+    @type _queues: list of asyncio.Queue
+
+    @ivar _event: set when an element is added
+    @type _event: asyncio.Event
+    """
+    def __init__(self, priorityDistribution):
+        """ Create a new AsyncPriorityQueue
+
+        @param priorityDistribution: determines the handling of the different priorities
+        @type priorityDistribution: list/tuple of int
+
+        raise PriorityQueueValueError:
+        """
+        super(AsyncPriorityQueue, self).__init__()
+
+        if len(priorityDistribution) < 2:
+            raise PriorityQueueValueError("there must be a least one priority step")
+        self._priorityDistribution = priorityDistribution
+
+        self._queues = [asyncio.Queue() for i in range(len(priorityDistribution))]
+        self._event = asyncio.Event()
+
+        # number of items we may (still) read before getting to lower prios
+        self._n = list(priorityDistribution)
+        self._highWater = len(priorityDistribution) * [0]
+
+    def __len__(self):
+        return sum(q.qsize() for q in self._queues)
+
+    @property
+    def stats(self):
+        """ Queue depth metrics, per level (see L{PriorityQueue.stats<pyknyx.stack.priorityQueue.PriorityQueue.stats>})
+
+        The queue is not bounded, so nothing is ever dropped.
+        """
+        return dict(depth=[q.qsize() for q in self._queues], highWater=list(self._highWater),
+                    dropped=len(self._queues) * [0])
+
+    def _put(self, obj, level):
+        q = self._queues[level]
+        q.put_nowait(obj)
+        if q.qsize() > self._highWater[level]:
+            self._highWater[level] = q.qsize()
+
+    def add(self, obj, priority):
+        """ Add an element to the queue
+
+        @param obj: element to be inserted into the queue
+        @type obj: any
+
+        @param priority: priority of the object to add
+        @type priority: L{Priority<pyknyx.stack.priority>}
+        """
+        self._put(obj, priority.level)
+        self._event.set()
+
+    def addBatch(self, objs):
+        """ Add several elements to the queue at once
+
+        @param objs: elements to be inserted into the queue
+        @type objs: iterable of (obj, priority) tuples
+        """
+        for obj, priority in objs:
+            self._put(obj, priority.level)
+        self._event.set()
+
+    def removeNoWait(self):
+        """ Removes and returns the next element from this queue
+
+        @return: the next element from this queue
+
+        raise asyncio.QueueEmpty: the queue is empty
+        """
+        seen = True
+        while seen:
+            seen = False
+            for i, q in enumerate(self._queues):
+                if q.empty():
+                    continue
+                seen = True
+                n = self._n[i]
+                if n == 0:
+                    continue
+                if n > 0:
+                    self._n[i] = n - 1
+                return q.get_nowait()
+
+            if seen:
+                self._n = list(self._priorityDistribution)
+
+        raise asyncio.QueueEmpty()
+
+    async def remove(self):
+        """ Removes and returns the next element from this queue
+
+        @return: the next element from this queue (waits if queue is empty)
+        """
+        while True:
+            try:
+                return self.removeNoWait()
+            except asyncio.QueueEmpty:
+                self._event.clear()
+                await self._event.wait()
@@ -113,7 +113,7 @@ class GroupSocketListen(object):
                         s += "%02x" % (self._buffer.buffer[1] & 0x3f)
                     else:
                         s +="%s" % " ".join([hex(val) for val in self._buffer.buffer[2:]])
-                logger.debug("GroupsSocketListen.run(): %s" % s)
+                logger.debug("GroupsSocketListen.run(): %s", s)
                 self._callback(s)
 
 
@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+
+""" Python KNX framework
+
+License
+=======
+
+ - B{pKNyX} (U{http://www.pyknyx.org}) is Copyright:
+  - (C) 2013-2015 Frédéric Mantegazza
+
+This program is free software; you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation; either version 2 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program; if not, write to the Free Software
+Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+or see:
+
+ - U{http://www.gnu.org/licenses/gpl.html}
+
+
+Module purpose
+==============
+
+Preallocated receive buffers
+
+Implements
+==========
+
+ - B{FrameBuffer}
+ - B{BufferRing}
+ - B{BufferRingValueError}
+
+Documentation
+=============
+
+Transceivers receive datagrams directly into the buffers of a ring (socket.recv_into), and the inbound frame
+objects (L{KNXnetIPHeader<pyknyx.stack.knxnetip.knxNetIPHeader>}, L{CEMILData<pyknyx.stack.cemi.cemiLData>}) work
+on memoryview slices of these buffers, so a received telegram is not copied on its way up the stack.
+
+A buffer is busy from the moment it is acquired by the transceiver until the frame it holds has been processed by
+ETS. A consumer which keeps the frame longer must call L{CEMILData.keep<pyknyx.stack.cemi.cemiLData.CEMILData.keep>},
+which copies it and gives the buffer back.
+
+If the next buffer of the ring is still busy (because ETS lags behind), a temporary buffer is allocated instead, so
+a busy buffer is never overwritten.
+
+Usage
+=====
+
+>>> ring = BufferRing(2, 16)
+>>> buf = ring.acquire()
+>>> nbytes, addr = sock.recvfrom_into(buf.data)
+>>> buf.setLength(nbytes)
+>>> buf.frame
+<memory at 0x7f2b0c1e8a00>
+>>> buf.release()
+
+@author: Frédéric Mantegazza
+@copyright: (C) 2013-2015 Frédéric Mantegazza
+@license: GPL
+"""
+
+
+from pyknyx.common.exception import PKNyXValueError
+from pyknyx.services.logger import logging; logger = logging.getLogger(__name__)
+
+
+class BufferRingValueError(PKNyXValueError):
+    """
+    """
+
+
+class FrameBuffer(object):
+    """ FrameBuffer class
+
+    @ivar data: raw buffer, to receive into
+    @type data: bytearray
+
+    @ivar frame: received part of the buffer
+    @type frame: memoryview
+
+    @ivar busy: True while the buffer holds a frame which has not been processed yet
+    @type busy: bool
+    """
+    __slots__ = ("data", "_view", "frame", "busy")
+
+    def __init__(self, size):
+        """
+
+        @param size: size of the buffer
+        @type size: int
+        """
+        super(FrameBuffer, self).__init__()
+
+        self.data = bytearray(size)
+        self._view = memoryview(self.data)
+        self.frame = None
+        self.busy = False
+
+    def setLength(self, length):
+        """ Set the length of the received frame
+        """
+        self.frame = self._view[:length]
+
+    def release(self):
+        """ Give the buffer back to the ring
+        """
+        self.frame = None
+        self.busy = False
+
+
+class BufferRing(object):
+    """ BufferRing class
+
+    @ivar _buffers: preallocated buffers
+    @type _buffers: list of L{FrameBuffer}
+
+    @ivar _next: index of the next buffer to hand out
+    @type _next: int
+
+    @ivar _overflows: number of temporary buffers allocated because the ring was exhausted
+    @type _overflows: int
+    """
+    def __init__(self, size=64, bufSize=1024):
+        """
+
+        @param size: number of buffers in the ring
+        @type size: int
+
+        @param bufSize: size of each buffer
+        @type bufSize: int
+
+        raise BufferRingValueError:
+        """
+        super(BufferRing, self).__init__()
+
+        if size < 1 or bufSize < 1:
+            raise BufferRingValueError("invalid ring size (%d x %d)" % (size, bufSize))
+
+        self._bufSize = bufSize
+        self._buffers = [FrameBuffer(bufSize) for i in range(size)]
+        self._next = 0
+        self._overflows = 0
+
+    def __len__(self):
+        return len(self._buffers)
+
+    @property
+    def overflows(self):
+        return self._overflows
+
+    def acquire(self):
+        """ Return a free buffer
+
+        Only the receiving thread may call this method.
+
+        @return: next free buffer of the ring, or a temporary buffer if it is still busy
+        @rtype: L{FrameBuffer}
+        """
+        buf = self._buffers[self._next]
+        if buf.busy:
+            self._overflows += 1
+            buf = FrameBuffer(self._bufSize)
+        else:
+            self._next = (self._next + 1) % len(self._buffers)
+        buf.busy = True
+        return buf
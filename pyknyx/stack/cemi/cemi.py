@@ -70,6 +70,8 @@ class CEMI(object):
     @ivar payload:
     @type payload: bytearray
     """
+    __slots__ = ()
+
     def __init__(self):  #, payload=None):
         """ Create a new cEMI object
 
@@ -66,6 +66,21 @@ class CEMILData(CEMI):
 
     @ivar _frame: cEMI L_Data raw frame
     @type _frame: L{CEMILDataFrame}
+
+    @ivar _buffer: receive buffer the frame is a view on, if any
+    @type _buffer: L{FrameBuffer<pyknyx.stack.bufferRing>}
+
+    @ivar _priority: decoded priority, or None if not decoded yet
+    @type _priority: L{Priority}
+
+    @ivar _sourceAddress: decoded source address, or None if not decoded yet
+    @type _sourceAddress: L{IndividualAddress}
+
+    @ivar _destinationAddress: decoded destination address, or None if not decoded yet
+    @type _destinationAddress: L{IndividualAddress} or L{GroupAddress}
+
+    The decoded objects are built on first access, and reset by the setters of the fields they depend on; the frame
+    must thus be modified through this class.
     """
     MC_LDATA_REQ = 0x11  # message code for L-Data request
     MC_LDATA_CON = 0x2E  # message code for L-Data confirmation
@@ -98,19 +113,26 @@ class CEMILData(CEMI):
     EFF_STD_FRAME = 0
     EFF_LTE_FRAME_MASK = 0x08
 
-    def __init__(self, frame=None):
+    __slots__ = ("_buffer", "_frame", "_priority", "_sourceAddress", "_destinationAddress")
+
+    def __init__(self, frame=None, buffer=None):
         """ Create a new cEMI L-Data message
 
         @param frame: raw frame
-        @type frame: str or bytearray
+        @type frame: str or bytearray or memoryview
+
+        @param buffer: receive buffer the frame is a memoryview on. It is given back by L{release} or L{keep}
+        @type buffer: L{FrameBuffer<pyknyx.stack.bufferRing>}
         """
         super(CEMILData, self).__init__()
 
+        self._buffer = buffer
         self._frame = CEMILDataFrame(frame)
+        self._priority = self._sourceAddress = self._destinationAddress = None
 
         if frame is not None:
             if self.messageCode not in CEMILData.MESSAGE_CODES:
-                raise CEMIValueError("invalid Message Code (%d)" % mc)
+                raise CEMIValueError("invalid Message Code (%d)" % self.messageCode)
             elif self._frame.addIL:
                 logger.warning("Additional Informations not supported and ignored")
             elif self.frameType == CEMILData.FT_EXT_FRAME:
@@ -119,16 +141,34 @@ class CEMILData(CEMI):
             self.frameType = CEMILData.FT_STD_FRAME
 
     def copy(self):
-        return type(self)(self._frame.copy())
+        return type(self)(self._frame)
+
+    def keep(self):
+        """ Make the frame independent from its receive buffer
+
+        Must be called by consumers which keep the frame after ETS has processed it.
+        """
+        if self._buffer is not None:
+            self._frame.detach()
+            self.release()
+
+    def release(self):
+        """ Give the receive buffer back
+
+        Called by ETS once the frame has been processed.
+        """
+        if self._buffer is not None:
+            self._buffer.release()
+            self._buffer = None
 
     def __repr__(self):
         s= "<CEMILData(mc=%s, priority=%s, src=%s, dest=%s, npdu=%s)>" % \
-            (hex(self.messageCode), repr(self.priority), repr(self.sourceAddress), repr(self.destinationAddress), repr(self.npdu))
+            (hex(self.messageCode), repr(self.priority), repr(self.sourceAddress), repr(self.destinationAddress), repr(bytearray(self.npdu)))
         return s
 
     def __str__(self):
         s= "<CEMILData(mc=%s, priority=%s, src=%s, dest=%s, npdu=%s)>" % \
-            (hex(self.messageCode), self.priority, self.sourceAddress, self.destinationAddress, repr(self.npdu))
+            (hex(self.messageCode), self.priority, self.sourceAddress, self.destinationAddress, repr(bytearray(self.npdu)))
         return s
 
     @property
@@ -201,8 +241,10 @@ class CEMILData(CEMI):
 
     @property
     def priority(self):
-        pr = (self._frame.ctrl1 >> 2) & 0x03
-        return Priority(pr)
+        priority = self._priority
+        if priority is None:
+            priority = self._priority = Priority((self._frame.ctrl1 >> 2) & 0x03)
+        return priority
 
     @priority.setter
     def priority(self, pr):
@@ -211,6 +253,7 @@ class CEMILData(CEMI):
         ctrl1 = self._frame.ctrl1 & 0xf3
         ctrl1 |= (pr & 0x03) << 2
         self._frame.ctrl1 = ctrl1
+        self._priority = None
 
     @property
     def ack(self):
@@ -243,6 +286,7 @@ class CEMILData(CEMI):
         ctrl2 = self._frame.ctrl2 & 0x7f
         ctrl2 |= (at & 0x01) << 7
         self._frame.ctrl2 = ctrl2
+        self._destinationAddress = None
 
     @property
     def hopCount(self):
@@ -266,20 +310,27 @@ class CEMILData(CEMI):
 
     @property
     def sourceAddress(self):
-        return IndividualAddress(self._frame.sa)
+        sa = self._sourceAddress
+        if sa is None:
+            sa = self._sourceAddress = IndividualAddress(self._frame.sa)
+        return sa
 
     @sourceAddress.setter
     def sourceAddress(self, sa):
         if not isinstance(sa, IndividualAddress):
             sa = IndividualAddress(sa)
         self._frame.sa = sa.raw
+        self._sourceAddress = sa
 
     @property
     def destinationAddress(self):
-        if self.addressType == 0:
-            da = IndividualAddress(self._frame.da)
-        else:
-            da = GroupAddress(self._frame.da)
+        da = self._destinationAddress
+        if da is None:
+            if self.addressType == 0:
+                da = IndividualAddress(self._frame.da)
+            else:
+                da = GroupAddress(self._frame.da)
+            self._destinationAddress = da
         return da
 
     @destinationAddress.setter
@@ -302,6 +353,7 @@ class CEMILData(CEMI):
         else:
             raise CEMIValueError("invalid address (%s)" % da)
         self._frame.da = da.raw
+        self._destinationAddress = da
 
     @property
     def npdu(self):
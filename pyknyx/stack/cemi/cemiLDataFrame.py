@@ -81,21 +81,31 @@ import struct
 
 from pyknyx.services.logger import logging; logger = logging.getLogger(__name__)
 from pyknyx.stack.cemi.cemi import CEMIValueError
+from pyknyx.stack.layer4.tpci import TPCI
+from pyknyx.stack.layer7.apci import APCI
 
 
 class CEMILDataFrame(object):
     """ cEMI L_Data Raw Frame container
 
+    The header fields (mc, addIL, ctrl1, ctrl2, sa, da) are decoded once, when the frame is created, and kept in sync
+    by their setters; the raw frame must not be modified directly.
+
     @ivar _raw: raw frame
-    @type _raw: bytearray
+    @type _raw: bytearray or memoryview
     """
     BASIC_LENGTH = 9
 
+    HEADER = struct.Struct(">BBBBHH")  # mc, addIL, ctrl1, ctrl2, sa, da (without additional info)
+    ADDR_HEADER = struct.Struct(">BBHH")  # ctrl1, ctrl2, sa, da (after additional info)
+
+    __slots__ = ("_raw", "_mc", "_addIL", "_ctrl1", "_ctrl2", "_sa", "_da")
+
     def __init__(self, frame=None, addIL=0):
         """ Init frame
 
-        @param frame: raw frame
-        @type frame: str or bytearray
+        @param frame: raw frame. A writable memoryview is used as is, without copy
+        @type frame: str or bytearray or memoryview
 
         @param addIL: additional info length
         @type addIL: int
@@ -105,23 +115,56 @@ class CEMILDataFrame(object):
         if frame is not None:
             if addIL:
                 raise CEMIValueError("can't give both frame and addIL args")
-            if isinstance(frame,CEMILDataFrame):
-                frame = frame._raw
-            if len(frame) < CEMILDataFrame.BASIC_LENGTH:
-                raise CEMIValueError("data too short (%d)" % len(frame))
-            self._raw = bytearray(frame)
+            if isinstance(frame, memoryview) and not frame.readonly:
+                raw = frame
+            elif isinstance(frame,CEMILDataFrame):
+                raw = bytearray(frame._raw)
+            else:
+                raw = bytearray(frame)
+            if len(raw) < CEMILDataFrame.BASIC_LENGTH:
+                raise CEMIValueError("data too short (%d)" % len(raw))
+            self._raw = raw
         else:
             self._raw = bytearray(CEMILDataFrame.BASIC_LENGTH+addIL)
             self._raw[1] = addIL
+        self._decode()
+
+    def _decode(self):
+        """ Decode the header fields
+        """
+        mc, addIL, ctrl1, ctrl2, sa, da = CEMILDataFrame.HEADER.unpack_from(self._raw)
+        if addIL:
+            try:
+                ctrl1, ctrl2, sa, da = CEMILDataFrame.ADDR_HEADER.unpack_from(self._raw, 2+addIL)
+            except struct.error:
+                raise CEMIValueError("data too short for addIL (%d)" % addIL)
+        self._mc = mc
+        self._addIL = addIL
+        self._ctrl1 = ctrl1
+        self._ctrl2 = ctrl2
+        self._sa = sa
+        self._da = da
 
     def __repr__(self):
         return "<CEMILDataFrame(mc=%s, addIL=%d, ctrl1=%s, ctrl2=%s, src=%s, dest=%s)>" % (hex(self.mc), self.addIL, hex(self.ctrl1), hex(self.ctrl2), hex(self.sa), hex(self.da))
 
     def __str__(self):
-        return str(self._raw)
+        return str(bytearray(self._raw))
 
     def copy(self):
-        return type(self)(self._raw)
+        return type(self)(bytearray(self._raw))
+
+    @property
+    def isView(self):
+        """ True if the frame is a view on a buffer it doesn't own
+        """
+        return isinstance(self._raw, memoryview)
+
+    def detach(self):
+        """ Copy the frame into its own storage, if it is a view on a foreign buffer
+        """
+        if isinstance(self._raw, memoryview):
+            self._raw = bytearray(self._raw)
 
     @property
     def raw(self):
@@ -129,15 +172,15 @@ class CEMILDataFrame(object):
 
     @property
     def mc(self):
-        return self._raw[0]
+        return self._mc
 
     @mc.setter
     def mc(self, mc):
-        self._raw[0] = mc & 0xff
+        self._raw[0] = self._mc = mc & 0xff
 
     @property
     def addIL(self):
-        return self._raw[1]
+        return self._addIL
 
     # Must be set at frame creation
     #@addIL.setter
@@ -146,98 +189,127 @@ class CEMILDataFrame(object):
 
     @property
     def addInfo(self):
-        if self.addIL:
-            return self._raw[2:2+self.addIL]
+        if self._addIL:
+            return self._raw[2:2+self._addIL]
         else:
             return None
 
     @addInfo.setter
     def addInfo(self, addInfo):
-        if not self.addIL or self.addIL != len(addInfo):
-            raise CEMIValueError("incompatible addIL value (%d)" % self.addIL)
-        self._raw[2:2+self.addIL] = addInfo
+        if not self._addIL or self._addIL != len(addInfo):
+            raise CEMIValueError("incompatible addIL value (%d)" % self._addIL)
+        self._raw[2:2+self._addIL] = addInfo
 
     @property
     def ctrl1(self):
-        return self._raw[2+self.addIL]
+        return self._ctrl1
 
     @ctrl1.setter
     def ctrl1(self, ctrl1):
-        self._raw[2+self.addIL] = ctrl1
+        self._raw[2+self._addIL] = self._ctrl1 = ctrl1
 
     @property
     def ctrl2(self):
-        return self._raw[3+self.addIL]
+        return self._ctrl2
 
     @ctrl2.setter
     def ctrl2(self, ctrl2):
-        self._raw[3+self.addIL] = ctrl2
+        self._raw[3+self._addIL] = self._ctrl2 = ctrl2
 
     @property
     def sah(self):
-        return self._raw[4+self.addIL]
+        return self._sa >> 8
 
     @sah.setter
     def sah(self, sah):
-        self._raw[4+self.addIL] = sah
+        self.sa = (sah & 0xff) << 8 | self._sa & 0xff
 
     @property
     def sal(self):
-        return self._raw[5+self.addIL]
+        return self._sa & 0xff
 
     @sal.setter
     def sal(self, sal):
-        self._raw[5+self.addIL] = sal
+        self.sa = self._sa & 0xff00 | sal & 0xff
 
     @property
     def sa(self):
-        b = self._raw[4+self.addIL:6+self.addIL]
-        return struct.unpack(">H", b)[0]
+        return self._sa
 
     @sa.setter
     def sa(self, sa):
-        if isinstance(sa, int):
-            self.sah = (sa >> 8) & 0xff  # use struct.pack!!!
-            self.sal = sa & 0xff
-        else:
-            self._raw[4+self.addIL:6+self.addIL] = sa
+        if not isinstance(sa, int):
+            sa = struct.unpack(">H", sa)[0]
+        sa &= 0xffff
+        struct.pack_into(">H", self._raw, 4+self._addIL, sa)
+        self._sa = sa
 
     @property
     def dah(self):
-        return self._raw[6+self.addIL]
+        return self._da >> 8
 
     @dah.setter
     def dah(self, dah):
-        self._raw[6+self.addIL] = dah
+        self.da = (dah & 0xff) << 8 | self._da & 0xff
 
     @property
     def dal(self):
-        return self._raw[7+self.addIL]
+        return self._da & 0xff
 
     @dal.setter
     def dal(self, dal):
-        self._raw[7+self.addIL] = dal
+        self.da = self._da & 0xff00 | dal & 0xff
 
     @property
     def da(self):
-        b = self._raw[6+self.addIL:8+self.addIL]
-        return struct.unpack(">H", b)[0]
+        return self._da
 
     @da.setter
     def da(self, da):
-        if isinstance(da, int):
-            self.dah = (da >> 8) & 0xff  # use struct.pack!!!
-            self.dal = da & 0xff
-        else:
-            self._raw[6+self.addIL:8+self.addIL] = da
+        if not isinstance(da, int):
+            da = struct.unpack(">H", da)[0]
+        da &= 0xffff
+        struct.pack_into(">H", self._raw, 6+self._addIL, da)
+        self._da = da
 
     @property
     def npdu(self):
-        return self._raw[8+self.addIL:]
+        return self._raw[8+self._addIL:]
 
     @npdu.setter
     def npdu(self, npdu):
-        self._raw[8+self.addIL:] = npdu
+        self.detach()  # the frame size may change
+        self._raw[8+self._addIL:] = npdu
+
+    def groupTelegram(self):
+        """ Decode a group telegram in one pass
+
+        Only standard group telegrams (no additional info, non null group destination, unnumbered data TPCI, group
+        value read/response/write APCI) are decoded; all other frames must go through the layers.
+
+        @return: (sa, da, priority level, apci, data) or None. data is None for a read, and is a view on the frame if
+                 the frame is a view
+        @rtype: tuple
+        """
+        raw = self._raw
+        length = len(raw)
+        if self._addIL or not self._ctrl2 & 0x80 or not self._da or length < 11 or raw[9] & 0xc0 != TPCI.UNNUMBERED_DATA:
+            return None
+
+        apci = (raw[9] << 8 | raw[10]) & APCI._4
+        if apci == APCI.GROUPVALUE_READ:
+            if length != 11:
+                return None
+            data = None
+        elif apci == APCI.GROUPVALUE_WRITE or apci == APCI.GROUPVALUE_RES:
+            if length > 11:
+                data = raw[11:]
+            else:
+                data = bytearray((raw[10] & 0x3f,))
+        else:
+            return None
+
+        return self._sa, self._da, (self._ctrl1 >> 2) & 0x03, apci, data
 
     #@property
     #def l(self):
@@ -96,28 +96,92 @@ class FlagsValueError(PKNyXValueError):
 class Flags(object):
     """ Flag class
 
+    Flags are stored as a bitmask. Instances are immutable and shared: Flags(raw) returns the same instance for the
+    same raw string. Flags() returns a new instance (of flags "CRT"), which is how pickles made by older versions
+    (holding the attributes dict) are loaded.
+
     @ivar _raw: raw set of flags
     @type _raw: str
+
+    @ivar _bits: flags bitmask (see L{BITS})
+    @type _bits: int
     """
-    def __init__(self, raw="CRT"):
+    BITS = {'C': 0x01, 'R': 0x02, 'W': 0x04, 'T': 0x08, 'U': 0x10, 'I': 0x20, 'S': 0x40}
+
+    __slots__ = ("_raw", "_bits")
+
+    _instances = {}  # shared instances, by raw set of flags
+    _masks = {}  # bitmask of the flags sets given to test(), None if invalid
+
+    def __new__(cls, raw=None):
         """ Create a new set of flags
 
-        @param raw: raw set of flags
+        @param raw: raw set of flags (None for a new, not shared, "CRT" set)
         @type raw: str
 
         raise FlagsValueError: invalid flags
 
         @todo: allow +xx and -xx usage
         """
-        super(Flags, self).__init__()
+        if raw is None:
+            self = object.__new__(cls)
+            self._setRaw("CRT")
+            return self
+        try:
+            return Flags._instances[raw]
+        except (KeyError, TypeError):
+            pass
+        if isinstance(raw, Flags):
+            return raw
 
         try:
             if not re.match("^C?R?W?T?U?I?S?$", raw):
                 raise FlagsValueError("invalid flags set (%r)" % repr(raw))
         except:
-            logger.exception("Flags.__init__()")
+            logger.exception("Flags.__new__()")
             raise FlagsValueError("invalid flags set (%r)" % repr(raw))
+
+        self = object.__new__(cls)
+        self._setRaw(raw)
+        return Flags._instances.setdefault(raw, self)
+
+    def _setRaw(self, raw):
         self._raw = raw
+        self._bits = Flags._mask(raw)
+
+    @staticmethod
+    def _mask(value):
+        """ Bitmask of a set of flags, or None if it contains unknown flags
+        """
+        try:
+            return Flags._masks[value]
+        except KeyError:
+            pass
+        mask = 0
+        for flag in value:
+            try:
+                mask |= Flags.BITS[flag]
+            except KeyError:
+                mask = None
+                break
+        Flags._masks[value] = mask
+        return mask
+
+    def __reduce__(self):
+        return (Flags, (self._raw,))
+
+    def __setstate__(self, state):
+        """ Restore flags pickled by an older version
+
+        The state is only set on the new instance built for the pickle, never on a shared one.
+        """
+        self._setRaw(state['_raw'])
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
 
     def __repr__(self):
         return "<Flags('%s')>" % self._raw
@@ -125,6 +189,14 @@ class Flags(object):
     def __str__(self):
         return self._raw
 
+    def __eq__(self, other):
+        if isinstance(other, Flags):
+            return self._bits == other._bits
+        return NotImplemented
+
+    def __hash__(self):
+        return self._bits
+
     def __call__(self, value):
         return self.test(value)
 
@@ -137,41 +209,41 @@ class Flags(object):
         @return: True if all value macthing flags are set
         @rtype: bool
         """
-        for flag in value:
-            if flag not in self._raw:
-                return False
-
-        return True
+        mask = Flags._mask(value)
+        return mask is not None and self._bits & mask == mask
 
     @property
     def raw(self):
         return self._raw
 
+    @property
+    def bits(self):
+        return self._bits
+
     @property
     def communicate(self):
-        return 'C' in self._raw
+        return self._bits & 0x01 != 0
 
     @property
     def read(self):
-        return 'R' in self._raw
+        return self._bits & 0x02 != 0
 
     @property
     def write(self):
-        return 'W' in self._raw
+        return self._bits & 0x04 != 0
 
     @property
     def transmit(self):
-        return 'T' in self._raw
+        return self._bits & 0x08 != 0
 
     @property
     def update(self):
-        return 'U' in self._raw
+        return self._bits & 0x10 != 0
 
     @property
     def init(self):
-        return 'I' in self._raw
+        return self._bits & 0x20 != 0
 
     @property
     def stateless(self):
-        return 'S' in self._raw
-
+        return self._bits & 0x40 != 0
@@ -63,17 +63,21 @@ GroupAddressValueError: group address out of range
 2
 >>> groupAddr.sub
 3
->>> groupAddr.outFormatLevel = 2
->>> groupAddr.address
+>>> groupAddr2 = GroupAddress("1/2/3", outFormatLevel=2)
+>>> groupAddr2.address
 '1/515'
->>> groupAddr.main
+>>> groupAddr2.main
 1
->>> groupAddr.middle
+>>> groupAddr2.middle
 0
->>> groupAddr.sub
+>>> groupAddr2.sub
 515
->>> groupAddr.outFormatLevel = 4
-GroupAddressValueError: outFormatLevel 4 must be 2 or 3
+>>> groupAddr2 == groupAddr
+True
+>>> GroupAddress(2563) is groupAddr
+True
+>>> GroupAddress("1/2/3", outFormatLevel=4)
+GroupAddressValueError: outFormatLevel must be 2 or 3
 >>> groupAddr.frame
 '\n\x03'
 
@@ -96,14 +100,22 @@ class GroupAddressValueError(KnxAddressValueError):
 class GroupAddress(KnxAddress):
     """ Group address hanlding class
 
+    Instances with outFormatLevel 2 are interned separately from the (default) level 3 ones; both compare and hash
+    the same.
+
     @ivar _outFormatLevel: output format level representation, in (2, 3).
     @type _outFormatLevel: int
     """
-    def __init__(self, address="0/0/0", outFormatLevel=3):
+    __slots__ = ("_outFormatLevel",)
+
+    _instances = {}  # level 3 instances, by raw value and string form
+    _instances2 = {}  # level 2 instances, by raw value
+
+    def __new__(cls, address=None, outFormatLevel=3):
         """ Create a group address
 
-        @param address: group address
-        @type address: str or tuple of int
+        @param address: group address (None for a new, not shared, "0/0/0" address)
+        @type address: str or tuple of int or int
 
         @param outFormatLevel: output format level representation, in (2, 3)
                                Note that the format is only used for output; the address can always be entered as
@@ -111,17 +123,27 @@ class GroupAddress(KnxAddress):
         @type outFormatLevel: int
 
         @raise GroupAddressValueError:
-
-        @todo: add constructor with simple int
         """
-        #logger.debug("GroupAddress.__init__(): address=%s" % repr(address))
+        #logger.debug("GroupAddress.__new__(): address=%s" % repr(address))
+
+        if address is None:
+            return cls._new(0x0000)
+        if outFormatLevel == 3:
+            try:
+                return cls._instances[address]
+            except (KeyError, TypeError):
+                pass
+        elif outFormatLevel != 2:
+            raise GroupAddressValueError("outFormatLevel must be 2 or 3", outFormatLevel)
+        if isinstance(address, GroupAddress):
+            address = address.raw
 
         if isinstance(address, str):
             address = address.strip().split('/')
             try:
                 address = [int(val) for val in address]
             except ValueError:
-                logger.exception("GroupAddress.__init__()")
+                logger.exception("GroupAddress.__new__()")
                 raise GroupAddressValueError("invalid group address")
         try:
             if len(address) == 2:
@@ -136,30 +158,55 @@ class GroupAddress(KnxAddress):
                 raise GroupAddressValueError("invalid group address")
         except TypeError:
             if not isinstance(address, int):
-                logger.exception("GroupAddress.__init__()")
+                logger.exception("GroupAddress.__new__()")
                 raise GroupAddressValueError("invalid group address",address)
 
-        if outFormatLevel not in (2, 3):
-            raise GroupAddressValueError("outFormatLevel must be 2 or 3", outFormatLevel)
+        return cls._intern(address, outFormatLevel)
+
+    @classmethod
+    def _intern(cls, raw, outFormatLevel=3):
+        instances = cls._instances if outFormatLevel == 3 else cls._instances2
+        try:
+            return instances[raw]
+        except KeyError:
+            pass
+        if not 0 <= raw <= 0xffff:
+            raise GroupAddressValueError("address %s not in range(0, 0xffff)" % hex(raw))
+        self = instances.setdefault(raw, cls._new(raw, outFormatLevel))
+        if outFormatLevel == 3:
+            cls._instances.setdefault(self._address, self)
+        return self
+
+    @classmethod
+    def _new(cls, raw, outFormatLevel=3):
+        self = object.__new__(cls)
+        self._raw = raw
         self._outFormatLevel = outFormatLevel
+        self._address = self._format()
+        return self
+
+    def _format(self):
+        if self._outFormatLevel == 3:
+            return "%d/%d/%d" % (self._raw >> 11 & 0x1f, self._raw >> 8 & 0x07, self._raw & 0x0ff)
+        else:
+            return "%d/%d" % (self._raw >> 11 & 0x1f, self._raw & 0x07ff)
 
-        super(GroupAddress, self).__init__(address)
+    def __reduce__(self):
+        return (type(self), (self._raw, self._outFormatLevel))
+
+    def __setstate__(self, state):
+        self._outFormatLevel = state['_outFormatLevel']
+        super(GroupAddress, self).__setstate__(state)
 
     def __repr__(self):
-        return "<GroupAddress('%s')>" % self.address
+        return "<GroupAddress('%s')>" % self._address
 
     def __str__(self):
-        return self.address
+        return self._address
 
     @property
     def address(self):
-        address = []
-        address.append("%d" % self.main)
-        if self._outFormatLevel == 3:
-            address.append("%d" % self.middle)
-        address.append("%d" % self.sub)
-
-        return '/'.join(address)
+        return self._address
 
     @property
     def main(self):
@@ -182,10 +229,3 @@ class GroupAddress(KnxAddress):
     @property
     def outFormatLevel(self):
         return self._outFormatLevel
-
-    @outFormatLevel.setter
-    def outFormatLevel(self, level):
-        if level not in (2, 3):
-            raise GroupAddressValueError("outFormatLevel must be 2 or 3", level)
-        self._outFormatLevel = level
-
@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+
+""" Python KNX framework
+
+License
+=======
+
+ - B{pKNyX} (U{http://www.pyknyx.org}) is Copyright:
+  - (C) 2013-2015 Frédéric Mantegazza
+
+This program is free software; you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation; either version 2 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program; if not, write to the Free Software
+Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+or see:
+
+ - U{http://www.gnu.org/licenses/gpl.html}
+
+Module purpose
+==============
+
+Group data service management
+
+Implements
+==========
+
+ - B{GroupAddressPatternValueError}
+ - B{GroupAddressPattern}
+
+Documentation
+=============
+
+A B{GroupAddressPattern} selects a set of group addresses, given as:
+
+ - a 3 levels pattern, each level being a value, a range or '*': "4/1/*", "4/*/*", "4/0-3/10-19"
+ - a 2 levels pattern, the same way: "4/*", "4/100-199"
+ - an explicit range of group addresses: "4/1/0..4/2/127", or a (first, last) tuple of group addresses
+
+The addresses are stored as a 65536 bits bitset (one bit per raw address), so testing an address is a single bit
+test.
+
+Usage
+=====
+
+>>> from groupAddressPattern import GroupAddressPattern
+>>> pattern = GroupAddressPattern("4/1/*")
+>>> pattern
+<GroupAddressPattern('4/1/*')>
+>>> len(pattern)
+256
+>>> GroupAddress("4/1/12") in pattern
+True
+>>> GroupAddress("4/2/12") in pattern
+False
+>>> GroupAddressPattern("4/1/0-255") == pattern
+True
+>>> GroupAddressPattern.isPattern("4/1/*")
+True
+>>> GroupAddressPattern.isPattern("4/1/1")
+False
+
+@author: Frédéric Mantegazza
+@copyright: (C) 2013-2015 Frédéric Mantegazza
+@license: GPL
+"""
+
+
+from pyknyx.common.exception import PKNyXValueError
+from pyknyx.services.logger import logging; logger = logging.getLogger(__name__)
+from pyknyx.stack.groupAddress import GroupAddress, GroupAddressValueError
+
+BITSET_SIZE = 0x10000 // 8
+
+
+class GroupAddressPatternValueError(PKNyXValueError):
+    """
+    """
+
+
+class GroupAddressPattern(object):
+    """ Group address pattern class
+
+    Patterns are immutable; they compare and hash by the addresses they select.
+
+    @ivar _pattern: pattern, as given
+    @type _pattern: str
+
+    @ivar _ranges: raw group addresses selected, as sorted (first, last) ranges
+    @type _ranges: tuple of tuple of int
+
+    @ivar _bits: group addresses bitset (bit raw & 7 of byte raw >> 3)
+    @type _bits: bytearray
+    """
+    __slots__ = ("_pattern", "_ranges", "_bits")
+
+    def __init__(self, pattern):
+        """ Create a group address pattern
+
+        @param pattern: pattern
+        @type pattern: str or tuple of L{GroupAddress} or L{GroupAddressPattern}
+
+        raise GroupAddressPatternValueError:
+        """
+        super(GroupAddressPattern, self).__init__()
+
+        if isinstance(pattern, GroupAddressPattern):
+            ranges = pattern._ranges
+            pattern = pattern._pattern
+        elif isinstance(pattern, tuple):
+            ranges = self._parseRange(pattern)
+            pattern = "%s..%s" % (GroupAddress(ranges[0][0]), GroupAddress(ranges[0][1]))
+        elif isinstance(pattern, str):
+            pattern = pattern.strip()
+            if ".." in pattern:
+                ranges = self._parseRange(pattern.split(".."))
+            else:
+                ranges = self._parseLevels(pattern)
+        else:
+            raise GroupAddressPatternValueError("invalid group address pattern (%r)" % (pattern,))
+
+        self._pattern = pattern
+        self._ranges = ranges
+        self._bits = bits = bytearray(BITSET_SIZE)
+        for first, last in ranges:
+            for raw in range(first, last + 1):
+                bits[raw >> 3] |= 1 << (raw & 7)
+
+    @staticmethod
+    def _parseRange(range_):
+        """ Parse a (first, last) range of group addresses
+        """
+        try:
+            first, last = [GroupAddress(gad).raw for gad in range_]
+        except (ValueError, GroupAddressValueError):
+            raise GroupAddressPatternValueError("invalid group address range (%r)" % (range_,))
+        if first > last:
+            raise GroupAddressPatternValueError("invalid group address range (%r)" % (range_,))
+        return ((first, last),)
+
+    @staticmethod
+    def _parseLevels(pattern):
+        """ Parse a 2 or 3 levels pattern
+        """
+        levels = pattern.split('/')
+        if len(levels) == 3:
+            maxs = (0x1f, 0x07, 0xff)
+        elif len(levels) == 2:
+            maxs = (0x1f, 0x7ff)
+        else:
+            raise GroupAddressPatternValueError("invalid group address pattern (%r)" % pattern)
+
+        bounds = []
+        for level, max_ in zip(levels, maxs):
+            level = level.strip()
+            try:
+                if level == '*':
+                    first, last = 0, max_
+                elif '-' in level:
+                    first, last = [int(value) for value in level.split('-')]
+                else:
+                    first = last = int(level)
+            except ValueError:
+                raise GroupAddressPatternValueError("invalid group address pattern (%r)" % pattern)
+            if not 0 <= first <= last <= max_:
+                raise GroupAddressPatternValueError("group address pattern out of range (%r)" % pattern)
+            bounds.append((first, last))
+
+        ranges = []
+        if len(bounds) == 3:
+            (firstMain, lastMain), (firstMiddle, lastMiddle), (firstSub, lastSub) = bounds
+            for main in range(firstMain, lastMain + 1):
+                for middle in range(firstMiddle, lastMiddle + 1):
+                    ranges.append((main << 11 | middle << 8 | firstSub, main << 11 | middle << 8 | lastSub))
+        else:
+            (firstMain, lastMain), (firstSub, lastSub) = bounds
+            for main in range(firstMain, lastMain + 1):
+                ranges.append((main << 11 | firstSub, main << 11 | lastSub))
+
+        # Merge contiguous ranges
+        merged = [ranges[0]]
+        for first, last in ranges[1:]:
+            if first == merged[-1][1] + 1:
+                merged[-1] = (merged[-1][0], last)
+            else:
+                merged.append((first, last))
+
+        return tuple(merged)
+
+    @staticmethod
+    def isPattern(pattern):
+        """ Test if a subscription target is a pattern, rather than a single group address
+
+        @param pattern: subscription target
+        @type pattern: str or tuple or L{GroupAddress} or L{GroupAddressPattern}
+
+        @rtype: bool
+        """
+        if isinstance(pattern, GroupAddressPattern):
+            return True
+        if isinstance(pattern, str):
+            return '*' in pattern or '-' in pattern or ".." in pattern
+        return False
+
+    def __repr__(self):
+        return "<GroupAddressPattern('%s')>" % self._pattern
+
+    def __str__(self):
+        return self._pattern
+
+    def __eq__(self, other):
+        if not isinstance(other, GroupAddressPattern):
+            return NotImplemented
+        return self._ranges == other._ranges
+
+    def __ne__(self, other):
+        if not isinstance(other, GroupAddressPattern):
+            return NotImplemented
+        return self._ranges != other._ranges
+
+    def __hash__(self):
+        return hash(self._ranges)
+
+    def __contains__(self, gad):
+        if not isinstance(gad, int):
+            gad = GroupAddress(gad).raw
+        return 0 <= gad <= 0xffff and bool(self._bits[gad >> 3] & 1 << (gad & 7))
+
+    def __len__(self):
+        return sum(last - first + 1 for first, last in self._ranges)
+
+    def __iter__(self):
+        """ Iterate over the raw group addresses selected
+        """
+        for first, last in self._ranges:
+            for raw in range(first, last + 1):
+                yield raw
+
+    @property
+    def pattern(self):
+        return self._pattern
+
+    @property
+    def ranges(self):
+        return self._ranges
+
+    @property
+    def bits(self):
+        """ Group addresses bitset
+
+        @rtype: bytearray
+        """
+        return self._bits
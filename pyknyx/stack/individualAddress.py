@@ -83,24 +83,36 @@ class IndividualAddressValueError(KnxAddressValueError):
 class IndividualAddress(KnxAddress):
     """ Individual address hanlding class
     """
-    def __init__(self, address="0.0.0"):
+    __slots__ = ()
+
+    _instances = {}
+
+    def __new__(cls, address=None):
         """ Create an individual address
 
-        @param address: individual address
-        @type address: str or tuple of int
+        @param address: individual address (None for a new, not shared, "0.0.0" address)
+        @type address: str or tuple of int or int
 
         raise IndividualAddressValueError: invalid address
-
-        @todo: add constructor with simple int
         """
-        #logger.debug("IndividualAddress.__init__(): address=%s" % repr(address))
+        #logger.debug("IndividualAddress.__new__(): address=%s" % repr(address))
+
+        if address is None:
+            return cls._new(0x0000)
+
+        try:
+            return cls._instances[address]
+        except (KeyError, TypeError):
+            pass
+        if isinstance(address, IndividualAddress):
+            return address
 
         if isinstance(address, str):
             address = address.strip().split('.')
             try:
                 address = [int(val) for val in address]
             except ValueError:
-                logger.exception("IndividualAddress.__init__()")
+                logger.exception("IndividualAddress.__new__()")
                 raise IndividualAddressValueError("invalid individual address")
         try:
             if len(address) == 3:
@@ -111,25 +123,29 @@ class IndividualAddress(KnxAddress):
                 raise IndividualAddressValueError("invalid individual address")
         except TypeError:
             if not isinstance(address, int):
-                logger.exception("IndividualAddress.__init__()")
+                logger.exception("IndividualAddress.__new__()")
                 raise IndividualAddressValueError("invalid individual address")
 
-        super(IndividualAddress, self).__init__(address)
+        return cls._intern(address)
+
+    @classmethod
+    def _intern(cls, raw):
+        self = super(IndividualAddress, cls)._intern(raw)
+        cls._instances.setdefault(self._address, self)
+        return self
+
+    def _format(self):
+        return "%d.%d.%d" % (self._raw >> 12 & 0xf, self._raw >> 8 & 0xf, self._raw & 0x0ff)
 
     def __repr__(self):
-        return "<IndividualAddress('%s')>" % self.address
+        return "<IndividualAddress('%s')>" % self._address
 
     def __str__(self):
-        return self.address
+        return self._address
 
     @property
     def address(self):
-        address = []
-        address.append("%d" % self.area)
-        address.append("%d" % self.line)
-        address.append("%d" % self.device)
-
-        return '.'.join(address)
+        return self._address
 
     @property
     def area(self):
@@ -142,4 +158,3 @@ class IndividualAddress(KnxAddress):
     @property
     def device(self):
         return self._raw & 0x0ff
-
@@ -77,30 +77,86 @@ class KnxAddressValueError(PKNyXValueError):
 class KnxAddress(object):
     """ KNX address hanlding class
 
+    Addresses are immutable, and interned: there is only one instance per raw value (see L{_intern}), so that
+    building an address from a raw value (or from its string form) is a dict lookup. Calling the class without
+    address returns a new, not shared, null address, which is how pickles made by older versions (holding the
+    attributes dict) are loaded.
+
     @ivar _raw: knx raw address
     @type _raw: int
-    @todo: use buffer protocole (bytearray)?
+
+    @ivar _address: string form of the address
+    @type _address: str
     """
-    def __init__(self, raw=0x0000):
+    __slots__ = ("_raw", "_address")
+
+    _instances = {}  # interned instances, by raw value (and string form); one dict per subclass
+
+    def __new__(cls, raw=None):
         """ Create a generic address
 
-        @param raw: knx raw address
+        @param raw: knx raw address (None for a new, not shared, null address)
         @type raw: int or str (frame) -> switch to bytearray
 
         @raise KnxAddressValueError:
         """
-        super(KnxAddress, self).__init__()
-
-        #logger.debug("KnxAddress.__init__(): raw=%r" % raw)
+        if raw is None:
+            return cls._new(0x0000)
+        try:
+            return cls._instances[raw]
+        except (KeyError, TypeError):
+            pass
 
         if isinstance(raw, bytes) and len(raw) == 2:
             raw = struct.unpack(">H", raw)[0]
-        if isinstance(raw, int):
-            if not 0 <= raw <= 0xffff:
-                raise KnxAddressValueError("address %s not in range(0, 0xffff)" % hex(raw))
-        else:
+        if not isinstance(raw, int):
             raise KnxAddressValueError("invalid address (%r)" % repr(raw))
+        return cls._intern(raw)
+
+    @classmethod
+    def _intern(cls, raw):
+        """ Return the shared instance for this raw value, creating it if needed
+
+        @raise KnxAddressValueError: raw value out of range
+        """
+        try:
+            return cls._instances[raw]
+        except KeyError:
+            pass
+        if not 0 <= raw <= 0xffff:
+            raise KnxAddressValueError("address %s not in range(0, 0xffff)" % hex(raw))
+        return cls._instances.setdefault(raw, cls._new(raw))
+
+    @classmethod
+    def _new(cls, raw):
+        """ Build a new, not shared, instance
+        """
+        self = object.__new__(cls)
         self._raw = raw
+        self._address = self._format()
+        return self
+
+    def _format(self):
+        """ Build the string form of the address
+        """
+        return hex(self._raw)
+
+    def __reduce__(self):
+        return (type(self), (self._raw,))
+
+    def __setstate__(self, state):
+        """ Restore an address pickled by an older version
+
+        The state is only set on the new instance built for the pickle, never on a shared one.
+        """
+        self._raw = state['_raw']
+        self._address = self._format()
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
 
     def __repr__(self):
         return "<KnxAddress('%s')>" % hex(self._raw)
@@ -109,15 +165,18 @@ class KnxAddress(object):
         return cmp(self.raw, other.raw)
 
     def __eq__(self, other):
-        return self.raw == other.raw
+        if self is other:
+            return True
+        try:
+            return self._raw == other.raw
+        except AttributeError:
+            return NotImplemented
 
     def __lt__(self, other):
-        return self.raw < other.raw
+        return self._raw < other.raw
 
     def __add__(self, incr):
-        obj = KnxAddress.__new__(type(self))
-        KnxAddress.__init__(obj, self._raw + incr)
-        return obj
+        return type(self)(self._raw + incr)
 
     def __hash__(self):
         return self._raw
@@ -147,4 +206,3 @@ class KnxAddress(object):
     @property
     def isNull(self):
         return self._raw == 0x0000
-
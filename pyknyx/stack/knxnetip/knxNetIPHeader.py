@@ -113,6 +113,7 @@ class KNXnetIPHeader(object):
     TUNNELING_ACK = 0x0421
     ROUTING_IND = 0x0530
     ROUTING_LOST_MSG = 0x0531
+    ROUTING_BUSY = 0x0532
 
     SERVICE = (CONNECT_REQ, CONNECT_RES,
                CONNECTIONSTATE_REQ, CONNECTIONSTATE_RES,
@@ -121,7 +122,7 @@ class KNXnetIPHeader(object):
                SEARCH_REQ, SEARCH_RES,
                DEVICE_CONFIGURATION_REQ, DEVICE_CONFIGURATION_ACK,
                TUNNELING_REQ, TUNNELING_ACK,
-               ROUTING_IND, ROUTING_LOST_MSG
+               ROUTING_IND, ROUTING_LOST_MSG, ROUTING_BUSY
               )
 
     HEADER_SIZE = 0x06
@@ -132,7 +133,7 @@ class KNXnetIPHeader(object):
 
         Header can be loaded either from frame or from sratch
 
-        @param frame: byte array with contained KNXnet/IP frame
+        @param frame: byte array with contained KNXnet/IP frame; bytearray and memoryview are used without copy
         @type frame: sequence
 
         @param service: service identifier
@@ -149,7 +150,8 @@ class KNXnetIPHeader(object):
             raise KNXnetIPHeaderValueError("can't give both frame and service type")
 
         if frame is not None:
-            frame = bytearray(frame)
+            if not isinstance(frame, (bytearray, memoryview)):
+                frame = bytearray(frame)
             if len(frame) < KNXnetIPHeader.HEADER_SIZE:
                     raise KNXnetIPHeaderValueError("frame too short for KNXnet/IP header (%d)" % len(frame))
 
@@ -235,6 +237,8 @@ class KNXnetIPHeader(object):
             return "routing.ind"
         elif self._service == KNXnetIPHeader.ROUTING_LOST_MSG:
             return "routing-lost.msg"
+        elif self._service == KNXnetIPHeader.ROUTING_BUSY:
+            return "routing-busy.msg"
         else:
             return "unknown/unsupported service"
 
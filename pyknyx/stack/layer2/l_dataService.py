@@ -52,7 +52,7 @@ import time
 import threading
 
 from pyknyx.common.exception import PKNyXValueError
-from pyknyx.services.logger import logging; logger = logging.getLogger(__name__)
+from pyknyx.services.logger import logging, HOT_PATH; logger = logging.getLogger(__name__)
 from pyknyx.stack.individualAddress import IndividualAddress
 from pyknyx.stack.priorityQueue import PriorityQueue
 from pyknyx.stack.layer3.n_groupDataListener import N_GroupDataListener
@@ -81,9 +81,14 @@ class L_DataService(L_DataServiceUnicast):
     @ivar _ldl: link data listener
     @type _ldl: L{L_DataListener<pyknyx.core.layer2.l_dataListener>}
 
+    @ivar _gtl: group telegram listener, which gets the standard group telegrams decoded in one pass
+    @type _gtl: L{A_GroupDataService<pyknyx.stack.layer7.a_groupDataService>}
     """
 
     _ldl = None
+    _gtl = None
+    groupIndexed = True
+    local = True
 
     def setListener(self, ldl):
         """
@@ -93,11 +98,21 @@ class L_DataService(L_DataServiceUnicast):
         """
         self._ldl = ldl
 
+    def setGroupTelegramListener(self, gtl):
+        """
+
+        @param gtl: listener to use to receive standard group telegrams, bypassing the upper layers (None to use
+                    the upper layers for all frames)
+        @type gtl: L{A_GroupDataService<pyknyx.stack.layer7.a_groupDataService>}
+        """
+        self._gtl = gtl
+
     def dataReq(self, cEMI):
         """
         Transmit a frame, i.e. forward to ETS.
         """
-        logger.debug("L_DataService.dataReq(): cEMI=%s" % cEMI)
+        if HOT_PATH and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("L_DataService.dataReq(): cEMI=%s", cEMI)
 
         # Add source address to cEMI
         if self.physAddr is NOT_REQUIRED:
@@ -114,11 +129,17 @@ class L_DataService(L_DataServiceUnicast):
 
         Common code for individually- and group-addressed frames.
         Distinguishing between individual and group receivers is done at
-        higher levels.
+        higher levels, except for standard group telegrams, which are decoded
+        in one pass and given to the group telegram listener, if any.
         """
         srcAddr = cEMI.sourceAddress
         if self.physAddr is not NOT_REQUIRED and srcAddr != self.physAddr:  # Avoid loop
             if cEMI.messageCode == CEMILData.MC_LDATA_IND:  #in (CEMILData.MC_LDATA_CON, CEMILData.MC_LDATA_IND):
+                if self._gtl is not None:
+                    telegram = cEMI.frame.groupTelegram()
+                    if telegram is not None:
+                        self._gtl.groupTelegramInd(*telegram)
+                        return True
                 if self._ldl is None:
                     logger.warning("L_GroupDataService.run(): not listener defined")
                 else:
@@ -69,6 +69,8 @@ class L_DataServiceBase(object):
     """
     _physAddr = None
     hop = False # instead of isinstance()
+    groupIndexed = False # group frames are delivered according to subscribeGroup(), not wantsGroupFrame()
+    local = False # in-process stack, which may get frames directly from putFrame (see ETS localDelivery)
 
     def __init__(self, ets, individualAddress=None):
         """
@@ -126,6 +128,19 @@ class L_DataServiceBase(object):
         """
         self._ets.putFrame(self, cEMI)
 
+    def subscribeGroup(self, gad):
+        """
+        Called by upper layers to receive the group frames sent to gad (all group frames if gad is null)
+        """
+        self._ets.subscribeGroup(self, gad)
+
+    def dataReqBatch(self, cEMIs):
+        """
+        Called by transceivers to forward several packets received at once
+        """
+        if cEMIs:
+            self._ets.putFrames(self, cEMIs)
+
     def cleanup(self):
         raise NotImplementedError
 
@@ -147,7 +162,7 @@ class L_DataServiceBroadcast(L_DataServiceBase):
         return True
 
     def addAddr(self, addr):
-        self._physAddrs.add(self)
+        self._physAddrs.add(addr)
 
 class L_DataServiceUnicast(L_DataServiceBase):
     """
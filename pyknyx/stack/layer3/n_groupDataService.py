@@ -48,7 +48,7 @@ Usage
 
 
 from pyknyx.common.exception import PKNyXValueError
-from pyknyx.services.logger import logging; logger = logging.getLogger(__name__)
+from pyknyx.services.logger import logging, HOT_PATH; logger = logging.getLogger(__name__)
 from pyknyx.stack.groupAddress import GroupAddress
 from pyknyx.stack.individualAddress import IndividualAddress
 from pyknyx.stack.layer2.l_dataListener import L_DataListener
@@ -89,19 +89,17 @@ class N_GroupDataService(L_DataListener):
         lds.setListener(self)
 
     def dataInd(self, cEMI):
-        logger.debug("N_GroupDataService.dataInd(): cEMI=%s" % repr(cEMI))
+        if HOT_PATH and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("N_GroupDataService.dataInd(): cEMI=%r", cEMI)
 
         if self._ngdl is None:
             logger.warning("N_GroupDataService.dataInd(): not listener defined")
             return
 
-        hopCount = cEMI.hopCount
-        mc = cEMI.messageCode
         src = cEMI.sourceAddress
         dest = cEMI.destinationAddress
         priority = cEMI.priority
-        hopCount = cEMI.hopCount
-        nSDU = cEMI.npdu[1:]
+        nSDU = cEMI.npdu[1:]  # view on the received frame, if any
 
         if isinstance(dest, GroupAddress):
             if not dest.isNull:
@@ -126,8 +124,8 @@ class N_GroupDataService(L_DataListener):
     def groupDataReq(self, gad, priority, nSDU):
         """
         """
-        logger.debug("N_GroupDataService.groupDataReq(): gad=%s, priority=%s, nSDU=%s" % \
-                       (gad, priority, repr(nSDU)))
+        if HOT_PATH and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("N_GroupDataService.groupDataReq(): gad=%s, priority=%s, nSDU=%r", gad, priority, nSDU)
 
         if gad.isNull:
             raise N_GDSValueError("invalid Group Address")
@@ -145,3 +143,8 @@ class N_GroupDataService(L_DataListener):
 
         return self._lds.dataReq(cEMI)
 
+    def subscribeGroup(self, gad):
+        """ Ask to receive the telegrams sent to this group address
+        """
+        self._lds.subscribeGroup(gad)
+
@@ -48,7 +48,7 @@ Usage
 
 
 from pyknyx.common.exception import PKNyXValueError
-from pyknyx.services.logger import logging; logger = logging.getLogger(__name__)
+from pyknyx.services.logger import logging, HOT_PATH; logger = logging.getLogger(__name__)
 from pyknyx.stack.layer4.tpci import TPCI
 from pyknyx.stack.layer3.n_groupDataListener import N_GroupDataListener
 
@@ -116,8 +116,9 @@ class T_GroupDataService(N_GroupDataListener):
         #return packetType
 
     def groupDataInd(self, src, gad, priority, tPDU):
-        logger.debug("T_GroupDataService.groupDataInd(): src=%s, gad=%s, priority=%s, tPDU=%s" % \
-                       (src, gad, priority, repr(tPDU)))
+        if HOT_PATH and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("T_GroupDataService.groupDataInd(): src=%s, gad=%s, priority=%s, tPDU=%r",
+                         src, gad, priority, tPDU)
 
         if self._tgdl is None:
             logger.warning("T_GroupDataService.groupDataInd(): not listener defined")
@@ -126,8 +127,9 @@ class T_GroupDataService(N_GroupDataListener):
         #if self._getPacketType(tPDU) == TPCI.UNNUMBERED_DATA:
         tPCI = tPDU[0] & 0xc0
         if tPCI == TPCI.UNNUMBERED_DATA:
+            # The TPCI bits are 0 here, so the tPDU can be used as tSDU as is. Don't modify it: it may be a view on
+            # the received frame, shared with other stacks.
             tSDU = tPDU
-            tSDU[0] &= 0x3f
             self._tgdl.groupDataInd(src, gad, priority, tSDU)
 
     def setListener(self, tgdl):
@@ -141,11 +143,16 @@ class T_GroupDataService(N_GroupDataListener):
     def groupDataReq(self, gad, priority, tSDU):
         """
         """
-        logger.debug("T_GroupDataService.groupDataReq(): gad=%s, priority=%s, tSDU=%s" % \
-                       (gad, priority, repr(tSDU)))
+        if HOT_PATH and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("T_GroupDataService.groupDataReq(): gad=%s, priority=%s, tSDU=%r", gad, priority, tSDU)
 
         #self._setTPCI(tSDU, TPCI.UNNUMBERED_DATA, 0)
         tPDU = tSDU
         tPDU[0] |= TPCI.UNNUMBERED_DATA
         return self._ngds.groupDataReq(gad, priority, tPDU)
 
+    def subscribeGroup(self, gad):
+        """ Ask to receive the telegrams sent to this group address
+        """
+        self._ngds.subscribeGroup(gad)
+
@@ -34,10 +34,23 @@ Implements
 ==========
 
  - B{A_GroupDataService}
+ - B{GroupTable}
 
 Documentation
 =============
 
+Groups are stored by raw group address, so the group of a received telegram is found without building the
+address string. The group monitor (subscription to the null address) is kept apart.
+
+Listeners can also subscribe to a L{GroupAddressPattern<pyknyx.stack.groupAddressPattern>} ("4/1/*", "4/*/*",
+"4/1/0..4/2/127"), handled by a L{WildcardGroup<pyknyx.core.wildcardGroup>}. The union of all patterns is kept as a
+bitset, so telegrams on other GADs cost a single bit test; the wildcard groups matching a GAD are looked up once, then
+indexed by raw address.
+
+Group value reads go through the L{ReadCoordinator<pyknyx.stack.layer7.readCoordinator>} given at creation, if any,
+which merges concurrent reads of a group address, and answers from recently seen values. A read answered this way is
+only given to the group which sent it.
+
 Usage
 =====
 
@@ -47,13 +60,20 @@ Usage
 """
 
 
+import collections.abc
+
 from pyknyx.common.exception import PKNyXValueError
-from pyknyx.services.logger import logging; logger = logging.getLogger(__name__)
+from pyknyx.services.logger import logging, HOT_PATH; logger = logging.getLogger(__name__)
 from pyknyx.core.group import Group
 from pyknyx.core.groupMonitor import GroupMonitor
-from pyknyx.stack.groupAddress import GroupAddress
+from pyknyx.core.wildcardGroup import WildcardGroup
+from pyknyx.stack.groupAddress import GroupAddress, GroupAddressValueError
+from pyknyx.stack.groupAddressPattern import GroupAddressPattern, BITSET_SIZE
+from pyknyx.stack.individualAddress import IndividualAddress
+from pyknyx.stack.priority import Priority
 from pyknyx.stack.layer7.apci import APCI
 from pyknyx.stack.layer7.apdu import APDU
+from pyknyx.stack.layer7.readCoordinator import ReadCoordinator
 from pyknyx.stack.layer4.t_groupDataListener import T_GroupDataListener
 
 
@@ -62,21 +82,83 @@ class A_GDSValueError(PKNyXValueError):
     """
 
 
+class GroupTable(collections.abc.Mapping):
+    """ GroupTable class
+
+    Read-only view on the groups of a L{A_GroupDataService}, keyed by group address string ("1/2/3"); any form
+    accepted by L{GroupAddress} can be used for lookups.
+
+    @ivar _groups: groups, by raw group address
+    @type _groups: dict of L{Group}
+    """
+    __slots__ = ("_groups",)
+
+    def __init__(self, groups):
+        """
+
+        @param groups: groups, by raw group address
+        @type groups: dict of L{Group}
+        """
+        super(GroupTable, self).__init__()
+
+        self._groups = groups
+
+    def __getitem__(self, gad):
+        try:
+            return self._groups[GroupAddress(gad).raw]
+        except GroupAddressValueError:
+            raise KeyError(gad)
+
+    def __contains__(self, gad):
+        try:
+            return GroupAddress(gad).raw in self._groups
+        except GroupAddressValueError:
+            return False
+
+    def __iter__(self):
+        for group in list(self._groups.values()):
+            yield group.gad.address
+
+    def __len__(self):
+        return len(self._groups)
+
+    def __repr__(self):
+        return "<GroupTable(%s)>" % ", ".join(self)
+
+
 class A_GroupDataService(T_GroupDataListener):
     """ A_GroupDataService class
 
     @ivar _tgds: transport group data service object
     @type _tgds: L{T_GroupDataService<pyknyx.core.layer4.t_groupDataService>}
 
-    @ivar _groups: Groups managed
-    @type _groups: set of L{Group}
+    @ivar _groups: Groups managed, by raw group address
+    @type _groups: dict of L{Group}
+
+    @ivar _groupMonitor: group monitor, which gets all group telegrams (None if no one subscribed to "0/0/0")
+    @type _groupMonitor: L{GroupMonitor}
+
+    @ivar _wildcardGroups: wildcard groups managed, by pattern
+    @type _wildcardGroups: dict of L{WildcardGroup}
+
+    @ivar _patternBits: union of the patterns bitsets
+    @type _patternBits: bytearray
+
+    @ivar _patternIndex: wildcard groups matching each raw group address (built on first telegram)
+    @type _patternIndex: dict of tuple of L{WildcardGroup}
+
+    @ivar _readCoordinator: coordinator of the group value reads (None to send all reads)
+    @type _readCoordinator: L{ReadCoordinator<pyknyx.stack.layer7.readCoordinator>}
     """
-    def __init__(self, tgds):
+    def __init__(self, tgds, readCoordinator=None):
         """
 
         @param tgds: Transport group data service object
         @type tgds: L{T_GroupDataService<pyknyx.core.layer4.t_groupDataService>}
 
+        @param readCoordinator: coordinator of the group value reads, usually shared by all the stacks of an ETS
+        @type readCoordinator: L{ReadCoordinator<pyknyx.stack.layer7.readCoordinator>}
+
         raise A_GDSValueError:
         """
         super(A_GroupDataService, self).__init__()
@@ -84,96 +166,195 @@ class A_GroupDataService(T_GroupDataListener):
         self._tgds = tgds
 
         self._groups = {}
+        self._groupMonitor = None
+        self._wildcardGroups = {}
+        self._patternBits = bytearray(BITSET_SIZE)
+        self._patternIndex = {}
+        self._readCoordinator = readCoordinator
 
         tgds.setListener(self)
 
     def groupDataInd(self, src, gad, priority, aPDU):  # aPDU -> tSDU
-        logger.debug("A_GroupDataService.groupDataInd(): src=%s, gad=%s, priority=%s, aPDU=%s" % \
-                       (src, gad, priority, repr(aPDU)))
+        if HOT_PATH and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("A_GroupDataService.groupDataInd(): src=%s, gad=%s, priority=%s, aPDU=%r",
+                         src, gad, priority, aPDU)
 
         length = len(aPDU) - 2
         if length >= 0:
-            apci = aPDU[0] << 8 | aPDU[1]
-
-            if gad.address in self._groups.keys():
-                group = self._groups[gad.address]
-            else:
-                logger.debug("A_GroupDataService.groupDataInd(): no registered group for that GAD (%s)" % repr(gad))
-                group = None
-
-            if "0/0/0" in self._groups.keys():
-                groupMonitor = self._groups["0/0/0"]
-            else:
-                groupMonitor = None
-
-            if (apci & APCI._4) == APCI.GROUPVALUE_WRITE:
-                data = APDU.getGroupValue(aPDU)
-                if group is not None:
-                    group.groupValueWriteInd(src, priority, data)
-                if groupMonitor is not None:
-                    groupMonitor.groupValueWriteInd(src, gad, priority, data)
-
-            elif (apci & APCI._4) == APCI.GROUPVALUE_READ:
+            apci = (aPDU[0] << 8 | aPDU[1]) & APCI._4
+            if apci == APCI.GROUPVALUE_READ:
                 if length == 0:
-                    if group is not None:
-                        group.groupValueReadInd(src, priority)
-                    if groupMonitor is not None:
-                        groupMonitor.groupValueReadInd(src, gad, priority)
+                    self._groupValueInd(src, gad, priority, apci, None)
                 else:
                     logger.warning("A_GroupDataService.groupDataInd(): invalid aPDU length")
-
-            elif (apci & APCI._4) == APCI.GROUPVALUE_RES:
-                data = APDU.getGroupValue(aPDU)
-                if group is not None:
-                    group.groupValueReadCon(src, priority, data)
-                if groupMonitor is not None:
-                    groupMonitor.groupValueReadCon(src, gad, priority, data)
+            elif apci in (APCI.GROUPVALUE_WRITE, APCI.GROUPVALUE_RES):
+                self._groupValueInd(src, gad, priority, apci, APDU.getGroupValue(aPDU))
 
         else:
             logger.warning("A_GroupDataService.groupDataInd(): invalid aPDU length")
 
+    def groupTelegramInd(self, srcRaw, gadRaw, priorityLevel, apci, data):
+        """ Receive a group telegram decoded in one pass by the link layer
+
+        See L{CEMILDataFrame.groupTelegram<pyknyx.stack.cemi.cemiLDataFrame.CEMILDataFrame.groupTelegram>}; the
+        network and transport layers are bypassed.
+        """
+        src = IndividualAddress(srcRaw)
+        gad = GroupAddress(gadRaw)
+        priority = Priority(priorityLevel)
+        if HOT_PATH and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("A_GroupDataService.groupTelegramInd(): src=%s, gad=%s, priority=%s, apci=%s, data=%r",
+                         src, gad, priority, hex(apci), data)
+
+        self._groupValueInd(src, gad, priority, apci, data)
+
+    def _groupValueInd(self, src, gad, priority, apci, data):
+        """ Dispatch a group value telegram to the group, the wildcard groups and the group monitor
+        """
+        raw = gad.raw
+        group = self._groups.get(raw)
+        if group is None and HOT_PATH and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("A_GroupDataService._groupValueInd(): no registered group for that GAD (%r)", gad)
+
+        if self._patternBits[raw >> 3] & 1 << (raw & 7):
+            try:
+                wildcardGroups = self._patternIndex[raw]
+            except KeyError:
+                wildcardGroups = self._patternIndex[raw] = tuple(wildcardGroup for pattern, wildcardGroup in
+                                                                 self._wildcardGroups.items() if raw in pattern)
+        else:
+            wildcardGroups = ()
+
+        groupMonitor = self._groupMonitor
+        if groupMonitor is not None:
+            bits = groupMonitor.gadBits
+            if bits is not None and not bits[raw >> 3] & 1 << (raw & 7):
+                groupMonitor = None
+
+        if apci == APCI.GROUPVALUE_WRITE:
+            if group is not None:
+                group.groupValueWriteInd(src, priority, data)
+            for wildcardGroup in wildcardGroups:
+                wildcardGroup.groupValueWriteInd(src, gad, priority, data)
+            if groupMonitor is not None:
+                groupMonitor.groupValueWriteInd(src, gad, priority, data)
+
+        elif apci == APCI.GROUPVALUE_READ:
+            if group is not None:
+                group.groupValueReadInd(src, priority)
+            for wildcardGroup in wildcardGroups:
+                wildcardGroup.groupValueReadInd(src, gad, priority)
+            if groupMonitor is not None:
+                groupMonitor.groupValueReadInd(src, gad, priority)
+
+        elif apci == APCI.GROUPVALUE_RES:
+            if group is not None:
+                group.groupValueReadCon(src, priority, data)
+            for wildcardGroup in wildcardGroups:
+                wildcardGroup.groupValueReadCon(src, gad, priority, data)
+            if groupMonitor is not None:
+                groupMonitor.groupValueReadCon(src, gad, priority, data)
+
     @property
     def groups(self):
-        return self._groups
+        """ Groups managed, by group address string (read-only; the group monitor is not included)
+
+        @rtype: L{GroupTable}
+        """
+        return GroupTable(self._groups)
 
-    def subscribe(self, gad, listener):
+    @property
+    def groupMonitor(self):
+        return self._groupMonitor
+
+    @property
+    def wildcardGroups(self):
+        """ Wildcard groups managed, by pattern string (read-only)
+        """
+        return dict((str(pattern), wildcardGroup) for pattern, wildcardGroup in self._wildcardGroups.items())
+
+    def subscribe(self, gad, listener, monitorFilter=None):
         """ Subscribe listener to specified group address
 
         If a Group handling this group address already exists, it is used. If not, it is created.
         The listener is added as a listener to this group.
 
-        If gad is null ("0/0/0"), a special group will be created, and the listener will receive all group telegrams.
+        If gad is null ("0/0/0"), a special group will be created, and the listener will receive all group telegrams,
+        or only those matching the given filter.
 
-        @param gad: Group address the listener wants to subscribe to
-        @type gad : L{GroupAddress}
+        If gad is a pattern ("4/1/*", see L{GroupAddressPattern}), a L{WildcardGroup} handling it is used (or created);
+        the listener will receive the telegrams of all matching GADs, with the concrete GAD.
+
+        @param gad: Group address (or pattern) the listener wants to subscribe to
+        @type gad : L{GroupAddress} or L{GroupAddressPattern}
 
         @param listener: object to link to the GAD
         @type listener: L{GroupListener<pyknyx.core.groupListener>} or L{GroupMonitorListener<pyknyx.core.groupMonitorListener>}
 
+        @param monitorFilter: telegrams a group monitor listener wants (null gad only)
+        @type monitorFilter: L{GroupMonitorFilter<pyknyx.core.groupMonitorFilter>}
+
         @return: group handling the group address
-        @rtype: L{Group}
+        @rtype: L{Group} or L{GroupMonitor} or L{WildcardGroup}
+
+        raise A_GDSValueError:
         """
-        logger.debug("A_GroupDataService.subscribe(): gad=%s, listener=%s" % (gad, repr(listener)))
+        logger.debug("A_GroupDataService.subscribe(): gad=%s, listener=%r, monitorFilter=%r", gad, listener, monitorFilter)
+        if GroupAddressPattern.isPattern(gad):
+            if monitorFilter is not None:
+                raise A_GDSValueError("a filter can only be given for the null group address")
+            return self._subscribePattern(GroupAddressPattern(gad), listener)
+
         if not isinstance(gad, GroupAddress):
             gad = GroupAddress(gad)
 
+        if gad.isNull:
+            group = self._groupMonitor
+            if group is None:
+                group = self._groupMonitor = GroupMonitor(self)
+                self._tgds.subscribeGroup(gad)
+            group.addListener(listener, monitorFilter)
+        else:
+            if monitorFilter is not None:
+                raise A_GDSValueError("a filter can only be given for the null group address")
+            try:
+                group = self._groups[gad.raw]
+            except KeyError:
+                group = self._groups[gad.raw] = Group(gad, self)
+                self._tgds.subscribeGroup(gad)
+            group.addListener(listener)
+
+        return group
+
+    def _subscribePattern(self, pattern, listener):
+        """ Subscribe listener to specified group address pattern
+        """
         try:
-            group = self._groups[gad.address]
+            wildcardGroup = self._wildcardGroups[pattern]
         except KeyError:
-            if gad.isNull:
-                group = self._groups[gad.address] = GroupMonitor(self)
+            wildcardGroup = self._wildcardGroups[pattern] = WildcardGroup(pattern, self)
+            self._patternBits = bytearray((int.from_bytes(self._patternBits, "little") |
+                                           int.from_bytes(pattern.bits, "little")).to_bytes(BITSET_SIZE, "little"))
+            self._patternIndex = {}
+
+            # Ask the lower layers for the telegrams of all matching GADs (or all telegrams for a catch-all pattern)
+            if len(pattern) == 0x10000:
+                self._tgds.subscribeGroup(GroupAddress(0))
             else:
-                group = self._groups[gad.address] = Group(gad, self)
+                for raw in pattern:
+                    if raw:
+                        self._tgds.subscribeGroup(GroupAddress(raw))
 
-        group.addListener(listener)
+        wildcardGroup.addListener(listener)
 
-        return group
+        return wildcardGroup
 
     def groupValueWriteReq(self, gad, priority, data, size):
         """
         """
-        logger.debug("A_GroupDataService.groupValueWriteReq(): gad=%s, priority=%s, data=%s, size=%d" % \
-                       (gad, priority, repr(data), size))
+        if HOT_PATH and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("A_GroupDataService.groupValueWriteReq(): gad=%s, priority=%s, data=%r, size=%d",
+                         gad, priority, data, size)
 
         aPDU = APDU.makeGroupValue(APCI.GROUPVALUE_WRITE, data, size)
         return self._tgds.groupDataReq(gad, priority, aPDU)
@@ -181,8 +362,18 @@ class A_GroupDataService(T_GroupDataListener):
     def groupValueReadReq(self, gad, priority):
         """
         """
-        logger.debug("A_GroupDataService.groupValueReadReq(): gad=%s, priority=%s" % \
-                       (gad, priority))
+        if HOT_PATH and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("A_GroupDataService.groupValueReadReq(): gad=%s, priority=%s", gad, priority)
+
+        if self._readCoordinator is not None:
+            status, src, data = self._readCoordinator.request(gad.raw)
+            if status == ReadCoordinator.COALESCED:
+                logger.debug("A_GroupDataService.groupValueReadReq(): read of %s merged with a pending one", gad)
+                return
+            elif status == ReadCoordinator.CACHED:
+                logger.debug("A_GroupDataService.groupValueReadReq(): read of %s answered from the cache", gad)
+                self._groupValueInd(IndividualAddress(src), gad, priority, APCI.GROUPVALUE_RES, bytearray(data))
+                return
 
         aPDU = APDU.makeGroupValue(APCI.GROUPVALUE_READ)
         return self._tgds.groupDataReq(gad, priority, aPDU)
@@ -190,8 +381,9 @@ class A_GroupDataService(T_GroupDataListener):
     def groupValueReadRes(self, gad, priority, data, size):
         """
         """
-        logger.debug("A_GroupDataService.groupValueReadRes(): gad=%s, priority=%s, data=%s, size=%d" % \
-                       (gad, priority, repr(data), size))
+        if HOT_PATH and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("A_GroupDataService.groupValueReadRes(): gad=%s, priority=%s, data=%r, size=%d",
+                         gad, priority, data, size)
 
         aPDU = APDU.makeGroupValue(APCI.GROUPVALUE_RES, data, size)
         return self._tgds.groupDataReq(gad, priority, aPDU)
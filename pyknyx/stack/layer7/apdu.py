@@ -93,6 +93,8 @@ class APDU(object):
     @classmethod
     def getGroupValue(cls, aPDU):
         """ Extract data from given APDU
+
+        If aPDU is a memoryview, so is the returned data; it is only valid until the frame has been processed.
         """
         if len(aPDU) > 2:
             data = aPDU[2:]
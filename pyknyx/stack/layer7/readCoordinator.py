@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+
+""" Python KNX framework
+
+License
+=======
+
+ - B{pKNyX} (U{http://www.pyknyx.org}) is Copyright:
+  - (C) 2013-2015 Frédéric Mantegazza
+
+This program is free software; you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation; either version 2 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program; if not, write to the Free Software
+Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+or see:
+
+ - U{http://www.gnu.org/licenses/gpl.html}
+
+Module purpose
+==============
+
+Group reads coordination
+
+Implements
+==========
+
+ - B{ReadCoordinator}
+ - B{ReadCoordinatorValueError}
+
+Documentation
+=============
+
+The L{A_GroupDataService<pyknyx.stack.layer7.a_groupDataService>} of all the stacks of an ETS ask its
+B{ReadCoordinator} before sending a group value read:
+
+ - if a response (or a write, which carries the state as well) was seen on the group address less than maxAge ago,
+   the read is answered locally with this value, and nothing is sent;
+ - if a read of the group address was sent (by any device, local or not) less than window ago, and not answered
+   yet, the read is merged with it: nothing is sent, and the response will reach all the stacks subscribed to the
+   group address;
+ - otherwise, the read is sent.
+
+ETS gives all group frames to the coordinator, which keeps track of the pending reads and of the last values.
+
+Usage
+=====
+
+>>> coordinator = ReadCoordinator(window=0.5, maxAge=1.)
+>>> coordinator.request(GroupAddress("1/1/1").raw)
+(0, None, None)
+>>> coordinator.request(GroupAddress("1/1/1").raw)
+(1, None, None)
+>>> coordinator.stats
+{'sent': 1, 'coalesced': 1, 'cached': 0}
+
+@author: Frédéric Mantegazza
+@copyright: (C) 2013-2015 Frédéric Mantegazza
+@license: GPL
+"""
+
+
+import threading
+import time
+
+from pyknyx.common import config
+from pyknyx.common.exception import PKNyXValueError
+from pyknyx.services.logger import logging; logger = logging.getLogger(__name__)
+from pyknyx.stack.layer7.apci import APCI
+from pyknyx.stack.layer7.apdu import APDU
+
+
+class ReadCoordinatorValueError(PKNyXValueError):
+    """
+    """
+
+
+class ReadCoordinator(object):
+    """ ReadCoordinator class
+
+    @ivar _window: time during which the reads of a group address are merged (s)
+    @type _window: float
+
+    @ivar _maxAge: max. age of the values used to answer reads (s); 0 to disable the cache
+    @type _maxAge: float
+
+    @ivar _pending: time the pending read of each group address (raw) expires at
+    @type _pending: dict of float
+
+    @ivar _cache: last value seen on each group address (raw), as (time, source address (raw), data) tuples
+    @type _cache: dict of tuple
+
+    @ivar _onCacheHit: called with the group address (raw) of each read answered from the cache
+    @type _onCacheHit: callable
+    """
+    SEND = 0
+    COALESCED = 1
+    CACHED = 2
+
+    def __init__(self, window=config.READ_COALESCE_WINDOW, maxAge=config.READ_CACHE_MAX_AGE, onCacheHit=None,
+                 clock=time.monotonic):
+        """
+
+        @param window: time during which the reads of a group address are merged (s); 0 to disable
+        @type window: float
+
+        @param maxAge: max. age of the values used to answer reads (s); 0 to disable the cache
+        @type maxAge: float
+
+        @param onCacheHit: called with the group address (raw) of each read answered from the cache
+        @type onCacheHit: callable
+
+        @param clock: time source
+        @type clock: callable
+
+        raise ReadCoordinatorValueError:
+        """
+        super(ReadCoordinator, self).__init__()
+
+        if window < 0:
+            raise ReadCoordinatorValueError("invalid window (%r)" % window)
+        if maxAge < 0:
+            raise ReadCoordinatorValueError("invalid maxAge (%r)" % maxAge)
+        self._window = window
+        self._maxAge = maxAge
+        self._onCacheHit = onCacheHit
+        self._clock = clock
+
+        self._pending = {}
+        self._cache = {}
+        self._stats = dict(sent=0, coalesced=0, cached=0)
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self):
+        """ Number of reads sent, merged with a pending read, and answered from the cache
+        """
+        with self._lock:
+            return dict(self._stats)
+
+    def request(self, raw):
+        """ Check if a read of a group address must be sent
+
+        @param raw: group address (raw)
+        @type raw: int
+
+        @return: (status, src, data), where status is SEND, COALESCED or CACHED; src (raw) and data are those of
+                 the cached value, for CACHED
+        @rtype: tuple
+        """
+        now = self._clock()
+        with self._lock:
+            entry = self._cache.get(raw)
+            if entry is not None and now - entry[0] > self._maxAge:
+                del self._cache[raw]
+                entry = None
+            if entry is not None:
+                self._stats['cached'] += 1
+            elif now < self._pending.get(raw, now):
+                self._stats['coalesced'] += 1
+                return ReadCoordinator.COALESCED, None, None
+            else:
+                if self._window:
+                    self._pending[raw] = now + self._window
+                self._stats['sent'] += 1
+                return ReadCoordinator.SEND, None, None
+
+        # Called without the lock held, as the callback may take other locks
+        if self._onCacheHit is not None:
+            self._onCacheHit(raw)
+        seen, src, data = entry
+        return ReadCoordinator.CACHED, src, data
+
+    def frameInd(self, cEMI):
+        """ Track the reads and values of a group frame
+
+        Called by ETS for each group frame.
+        """
+        nPDU = cEMI.npdu
+        if len(nPDU) < 3:
+            return
+        raw = cEMI.frame.da
+        apci = (nPDU[1] << 8 | nPDU[2]) & APCI._4
+        if apci == APCI.GROUPVALUE_READ:
+            if self._window:
+                now = self._clock()
+                with self._lock:
+                    if now >= self._pending.get(raw, now):
+                        self._pending[raw] = now + self._window
+        elif apci in (APCI.GROUPVALUE_RES, APCI.GROUPVALUE_WRITE):
+            if self._maxAge:
+                data = bytes(APDU.getGroupValue(nPDU[1:]))  # the frame may be a view on a receive buffer
+                entry = (self._clock(), cEMI.frame.sa, data)
+                with self._lock:
+                    self._pending.pop(raw, None)
+                    self._cache[raw] = entry
+            elif raw in self._pending:
+                with self._lock:
+                    self._pending.pop(raw, None)
@@ -54,6 +54,8 @@ Usage
 """
 
 
+import errno
+import select
 import socket
 import struct
 import six
@@ -116,11 +118,23 @@ class MulticastSocketBase(socket.socket):
         return self._localPort
 
 
+# Linux socket option reporting the number of datagrams dropped by the kernel
+SO_RXQ_OVFL = getattr(socket, "SO_RXQ_OVFL", 40)
+
+
 class MulticastSocketReceive(MulticastSocketBase):
     """
     """
-    def __init__(self, localAddr, localPort, mcastAddr, mcastPort, timeout=1, ttl=32, loop=1):
+    MAX_FRAME_SIZE = 1024
+
+    def __init__(self, localAddr, localPort, mcastAddr, mcastPort, timeout=1, ttl=32, loop=1, rcvBuf=None, batch=False):
         """
+
+        @param rcvBuf: size of the kernel receive buffer (SO_RCVBUF); system default if None
+        @type rcvBuf: int
+
+        @param batch: if True, the socket is non-blocking and must be read with L{receiveBatch}
+        @type batch: bool
         """
 
         multicast = six.byte2int(socket.inet_aton(mcastAddr)) in range(224, 240)
@@ -134,7 +148,22 @@ class MulticastSocketReceive(MulticastSocketBase):
         self.setsockopt(socket.SOL_IP, socket.IP_MULTICAST_IF, socket.inet_aton(self._localAddr))
         value = struct.pack("=4sl", socket.inet_aton(mcastAddr), socket.INADDR_ANY)
         self.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, value)
-        self.settimeout(timeout)
+
+        if rcvBuf is not None:
+            self.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, rcvBuf)
+
+        self._timeout = timeout
+        self._dropped = 0
+        self._ancBufSize = 0
+        if batch:
+            self.setblocking(False)
+            try:
+                self.setsockopt(socket.SOL_SOCKET, SO_RXQ_OVFL, 1)
+                self._ancBufSize = socket.CMSG_SPACE(4)
+            except (socket.error, AttributeError):
+                logger.debug("MulticastSocketReceive.__init__(): system doesn't report dropped datagrams")
+        else:
+            self.settimeout(timeout)
 
     def _bind(self):
         """
@@ -149,10 +178,93 @@ class MulticastSocketReceive(MulticastSocketBase):
 
         self.bind(("", self._localPort))
 
+    @property
+    def rcvBuf(self):
+        return self.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)
+
+    @property
+    def dropped(self):
+        """ Number of datagrams the kernel dropped because the receive buffer was full
+
+        Only available in batch mode, on systems supporting SO_RXQ_OVFL.
+        """
+        return self._dropped
+
     def receive(self):
         """
         """
-        return self.recvfrom(1024)
+        return self.recvfrom(MulticastSocketReceive.MAX_FRAME_SIZE)
+
+    def receiveInto(self, buf):
+        """ Receive a datagram into a preallocated buffer
+
+        @param buf: buffer to receive into
+        @type buf: L{FrameBuffer<pyknyx.stack.bufferRing>}
+
+        @return: source of the datagram; buf.frame is set to the received data
+        @rtype: tuple (addr, port)
+        """
+        nbytes, fromAddr = self.recvfrom_into(buf.data)
+        buf.setLength(nbytes)
+        return fromAddr
+
+    def _receiveNoWait(self, buf=None):
+        """ Read one pending datagram, without blocking
+
+        @raise socket.error: EAGAIN/EWOULDBLOCK if no datagram is pending
+        """
+        if self._ancBufSize:
+            if buf is None:
+                data, ancData, _, fromAddr = self.recvmsg(MulticastSocketReceive.MAX_FRAME_SIZE, self._ancBufSize)
+            else:
+                nbytes, ancData, _, fromAddr = self.recvmsg_into([buf.data], self._ancBufSize)
+                buf.setLength(nbytes)
+                data = buf
+            for level, type_, value in ancData:
+                if level == socket.SOL_SOCKET and type_ == SO_RXQ_OVFL and len(value) >= 4:
+                    self._dropped = struct.unpack("=I", value[:4])[0]
+        elif buf is None:
+            data, fromAddr = self.recvfrom(MulticastSocketReceive.MAX_FRAME_SIZE)
+        else:
+            data = buf
+            fromAddr = self.receiveInto(buf)
+        return data, fromAddr
+
+    def receiveBatch(self, maxFrames=64, ring=None):
+        """ Wait for the socket to become readable, then drain all pending datagrams
+
+        Only the first wait may block (up to the socket timeout); the pending datagrams are then read without
+        blocking, until the kernel queue is empty or maxFrames datagrams have been read.
+
+        @param maxFrames: maximum number of datagrams to return
+        @type maxFrames: int
+
+        @param ring: if given, datagrams are received into buffers of this ring, which are returned instead of data
+        @type ring: L{BufferRing<pyknyx.stack.bufferRing>}
+
+        @return: received datagrams (empty on timeout)
+        @rtype: list of (data, (addr, port)) or (L{FrameBuffer<pyknyx.stack.bufferRing>}, (addr, port)) tuples
+        """
+        readable, _, _ = select.select([self], [], [], self._timeout)
+        if not readable:
+            return []
+
+        frames = []
+        buf = None
+        while len(frames) < maxFrames:
+            if ring is not None and buf is None:
+                buf = ring.acquire()
+            try:
+                frames.append(self._receiveNoWait(buf))
+                buf = None
+            except socket.error as e:
+                if buf is not None:
+                    buf.release()
+                if e.errno in (errno.EAGAIN, errno.EWOULDBLOCK):
+                    break
+                raise
+
+        return frames
 
 
 class MulticastSocketTransmit(MulticastSocketBase):
@@ -54,8 +54,10 @@ PriorityValueError: priority level 15 not in (0x00, 0x01, 0x02, 0x03)
 <Priority('normal')>
 >>> p.level
 1
->>> p.strLevel
+>>> p.name
 'normal'
+>>> p is Priority(1)
+True
 
 @author: Frédéric Mantegazza
 @copyright: (C) 2013-2015 Frédéric Mantegazza
@@ -74,42 +76,84 @@ class PriorityValueError(PKNyXValueError):
 
 class Priority(object):
     """ Priority handling class
+
+    There are only four priorities, built once: Priority(level) returns the shared instance for that level.
+    Priority() returns a new instance (of level 'low'), which is how pickles made by older versions (holding the
+    attributes dict) are loaded.
+
+    @ivar _level: level of the priority
+    @type _level: int
+
+    @ivar _name: name of the priority
+    @type _name: str
     """
     CONV_TABLE = {'system': 0x00, 'normal': 0x01, 'urgent': 0x02, 'low': 0x03,
                   0x00: 'system', 0x01: 'normal', 0x02: 'urgent', 0x03: 'low'
                  }
 
-    def __init__(self, level='low'):
+    __slots__ = ("_level", "_name")
+
+    _instances = {}  # shared instances, by level and by name
+
+    def __new__(cls, level=None):
         """ Create a priority object
 
-        @param level: level of the priority
+        @param level: level of the priority (None for a new, not shared, 'low' priority)
         @type level: str or int
 
         raise PriorityValueError:
         """
-        super(Priority, self).__init__()
-
-        if isinstance(level, str):
-            try:
-                level = Priority.CONV_TABLE[level]
-            except KeyError:
-                logger.exception("Priority.__init__()")
-                raise PriorityValueError("level %r not in ('system', 'normal', 'urgent', 'low')" % repr(level))
+        if level is None:
+            self = object.__new__(cls)
+            self._setLevel(0x03)
+            return self
+        try:
+            return Priority._instances[level]
+        except (KeyError, TypeError):
+            pass
+
+        if isinstance(level, Priority):
+            return level
+        elif isinstance(level, str):
+            raise PriorityValueError("level %r not in ('system', 'normal', 'urgent', 'low')" % repr(level))
         elif isinstance(level, int):
-            if not 0x00 <= level <= 0x03:
-                raise PriorityValueError("level %d not in (0x00, 0x01, 0x02, 0x03)" % level)
+            raise PriorityValueError("level %d not in (0x00, 0x01, 0x02, 0x03)" % level)
         else:
             raise PriorityValueError("invalid priority level (%s)" % repr(level))
 
+    def _setLevel(self, level):
         self._level = level
+        self._name = Priority.CONV_TABLE[level]
+
+    def __reduce__(self):
+        return (Priority, (self._level,))
+
+    def __setstate__(self, state):
+        """ Restore a priority pickled by an older version
+
+        The state is only set on the new instance built for the pickle, never on a shared one.
+        """
+        self._setLevel(state['_level'])
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
 
     def __repr__(self):
-        return "<Priority('%s')>" % self.name
+        return "<Priority('%s')>" % self._name
 
     def __str__(self):
-        return self.name
+        return self._name
 
-    #def __cmp__(self, other):
+    def __eq__(self, other):
+        if isinstance(other, Priority):
+            return self._level == other._level
+        return NotImplemented
+
+    def __hash__(self):
+        return self._level
 
     @property
     def level(self):
@@ -117,5 +161,11 @@ class Priority(object):
 
     @property
     def name(self):
-        return Priority.CONV_TABLE[self._level]
+        return self._name
+
 
+for level_ in range(4):
+    priority_ = object.__new__(Priority)
+    priority_._setLevel(level_)
+    Priority._instances[level_] = Priority._instances[priority_._name] = priority_
+del level_, priority_
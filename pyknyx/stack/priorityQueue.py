@@ -56,9 +56,10 @@ remaining 2 objects with pr. 1 and at last the remaining with pr. 2.
 
 The size of this array must be smaller by one than the number of priority steps.
 
-The array is used internally (it is not cloned)
-
-A queue inherits threading.Condition object, so can block/notify calling threads
+Each priority level is a deque, so adding and removing an element is O(1). Levels can be bounded, with a policy
+telling what to do when adding to a full level (see L{PriorityQueue.__init__}). A queue uses a threading.Condition
+object, so can block/notify calling threads; L{removeBatch} takes several elements at once, for consumers which
+want to lock the queue only once per wakeup.
 
 Usage
 =====
@@ -66,12 +67,10 @@ Usage
 @author: Frédéric Mantegazza
 @copyright: (C) 2013-2015 Frédéric Mantegazza
 @license: GPL
-
-@todo: use Queue.PriorityQueue?
 """
 
 
-import copy
+import collections
 import threading
 
 from pyknyx.common.exception import PKNyXValueError
@@ -88,13 +87,55 @@ class PriorityQueue(object):
 
     @ivar _priorityDistribution: determines the handling of the different priorities
     @type _priorityDistribution: list/tuple of int
+
+    @ivar _queue: one queue per priority level
+    @type _queue: list of deque
+
+    @ivar _n: number of elements which may (still) be read from each level before getting to lower levels
+    @type _n: list of int
+
+    @ivar _len: number of elements in the queue
+    @type _len: int
+
+    @ivar _capacity: max. number of elements per level (None for no limit)
+    @type _capacity: list of int
+
+    @ivar _policy: what to do when adding to a full level ("drop-oldest", "drop-newest" or "block")
+    @type _policy: list of str
+
+    @ivar _highWater: max. number of elements seen in each level
+    @type _highWater: list of int
+
+    @ivar _dropped: number of elements dropped from each level
+    @type _dropped: list of int
+
+    @ivar _consumer: identifier of the last thread which removed elements
+    @type _consumer: int
     """
-    def __init__(self, priorityDistribution):
+    POLICIES = ("drop-oldest", "drop-newest", "block")
+
+    def __init__(self, priorityDistribution, capacity=None, policy="drop-oldest", timeout=1., onDrop=None):
         """ Create a new PriorityQueue
 
         @param priorityDistribution: determines the handling of the different priorities
         @type priorityDistribution: list/tuple of int
 
+        @param capacity: max. number of elements, for all levels or per level (None for no limit)
+        @type capacity: int or list/tuple of int
+
+        @param policy: what to do when adding to a full level, for all levels or per level:
+                        - "drop-oldest": the oldest element of the level is dropped
+                        - "drop-newest": the new element is dropped
+                        - "block": wait for room, up to timeout, then drop the new element; the consumer thread
+                          never waits for itself, the new element is dropped at once
+        @type policy: str or list/tuple of str
+
+        @param timeout: max. time to wait for room, with the "block" policy (s)
+        @type timeout: float
+
+        @param onDrop: called with each dropped element
+        @type onDrop: callable
+
         raise PriorityQueueValueError:
         """
         super(PriorityQueue, self).__init__()
@@ -102,17 +143,84 @@ class PriorityQueue(object):
         if len(priorityDistribution) < 2:
             raise PriorityQueueValueError("there must be a least one priority step")
         self._priorityDistribution = priorityDistribution
+        levels = len(priorityDistribution)
+
+        if capacity is None or isinstance(capacity, int):
+            capacity = levels * [capacity]
+        if isinstance(policy, str):
+            policy = levels * [policy]
+        if len(capacity) != levels or len(policy) != levels:
+            raise PriorityQueueValueError("capacity and policy must be given for each of the %d levels" % levels)
+        for capacity_ in capacity:
+            if capacity_ is not None and capacity_ < 1:
+                raise PriorityQueueValueError("invalid capacity (%r)" % capacity_)
+        for policy_ in policy:
+            if policy_ not in PriorityQueue.POLICIES:
+                raise PriorityQueueValueError("invalid policy (%r)" % policy_)
+        self._capacity = list(capacity)
+        self._policy = list(policy)
+        self._timeout = timeout
+        self._onDrop = onDrop
+
+        self._queue = [collections.deque() for i in range(levels)]
+        self._len = 0
+        self._highWater = levels * [0]
+        self._dropped = levels * [0]
+        self._consumer = None
+
+        lock = threading.Lock()
+        self._condition = threading.Condition(lock)
+        self._notFull = threading.Condition(lock)
+
+        self._n = list(priorityDistribution)
+
+    def __len__(self):
+        return self._len
+
+    @property
+    def stats(self):
+        """ Queue depth metrics, per level
+
+         - depth: number of elements
+         - highWater: max. number of elements seen
+         - dropped: number of elements dropped
+        """
+        with self._condition:
+            return dict(depth=[len(q) for q in self._queue], highWater=list(self._highWater),
+                        dropped=list(self._dropped))
 
-        self._queue = len(priorityDistribution) * [[]]
-
-        self._condition = threading.Condition()
+    def _put(self, obj, level, force=False):
+        """ Add an element to a level, applying its capacity policy
 
-        # queue priority we found the last element at
-        self._pos = 0
-        # number of items we may (still) read before getting to lower prios
-        self._n = priorityDistribution[:]
+        Must be called with the lock held.
 
-    def add(self, obj, priority):
+        @return: True if the element was added
+        @rtype: bool
+        """
+        q = self._queue[level]
+        capacity = self._capacity[level]
+        if capacity is not None and len(q) >= capacity and not force:
+            policy = self._policy[level]
+            if policy == "block" and threading.get_ident() != self._consumer:
+                self._notFull.wait_for(lambda: len(q) < capacity, self._timeout)
+            if len(q) >= capacity:
+                self._dropped[level] += 1
+                if policy == "drop-oldest":
+                    dropped = q.popleft()
+                    self._len -= 1
+                else:
+                    dropped = obj
+                if self._onDrop is not None:
+                    self._onDrop(dropped)
+                if dropped is obj:
+                    return False
+        q.append(obj)
+        self._len += 1
+        if len(q) > self._highWater[level]:
+            self._highWater[level] = len(q)
+        return True
+
+    def add(self, obj, priority, force=False):
         """ Add an element to the queue
 
         Add the given element to the queue according to the given priority, behind the last element with the same
@@ -121,45 +229,96 @@ class PriorityQueue(object):
         @param obj: element to be inserted into the queue
         @type obj: any
 
-        @param priority: priority value of the object to add
-        @type priority: int
-        """
-        #logger.debug("PriorityQueue.add(): _queue=%s" % repr(self._queue))
+        @param priority: priority of the object to add
+        @type priority: L{Priority<pyknyx.stack.priority>}
+
+        @param force: add the element even if its level is full
+        @type force: bool
 
+        @return: False if the element was dropped
+        @rtype: bool
+        """
         with self._condition:
-            self._queue[priority.level].append(obj)
+            if not self._put(obj, priority.level, force):
+                return False
             self._condition.notify()
+            return True
+
+    def addBatch(self, objs):
+        """ Add several elements to the queue at once
+
+        The lock is only taken once for the whole batch; ordering within each priority is preserved.
+
+        @param objs: elements to be inserted into the queue
+        @type objs: iterable of (obj, priority) tuples
+        """
+        with self._condition:
+            n = 0
+            for obj, priority in objs:
+                if self._put(obj, priority.level):
+                    n += 1
+            if n:
+                self._condition.notify(n)
+
+    def _pop(self):
+        """ Pop the next element, according to the priority distribution
 
+        Must be called with the lock held, and the queue not empty.
+
+        @raise IndexError: no element can be read (all non-empty levels are blocked)
+        """
+        for reset in (False, True):
+            if reset:
+                self._n = list(self._priorityDistribution)
+            n = self._n
+            for i, q in enumerate(self._queue):
+                if q and n[i]:
+                    if n[i] > 0:
+                        n[i] -= 1
+                    self._len -= 1
+                    if self._capacity[i] is not None:
+                        self._notFull.notify_all()  # producers of all levels wait on the same condition
+                    return q.popleft()
+        raise IndexError("all non-empty priority levels are blocked")
 
     def remove(self):
         """ Removes and returns the next element from this queue
 
         @return: the next element from this queue (blocks if queue is empty)
         """
-        #logger.debug("PriorityQueue.remove(): _queue=%s" % repr(self._queue))
-
         with self._condition:
-            while True: # Loop until we transmit something.
-                seen = True
-                while seen: # Loop until the array of queues is empty.
-                    seen = False
-                    for i,q in enumerate(zip(self._queue,self._n)):
-                        # scan all queues. Return the first element with
-                        # lowest-prio queue that's not exhausted its
-                        # quorum.
-                        q,n = q
-                        if not q:
-                            continue
-                        seen = True
-                        if n == 0:
-                            continue
-                        if n >= 0:
-                            self._n[i] = n-1
-                        return q.pop(0) # takes absolute precendece
-
-                    if seen:
-                        self._n = self._priorityDistribution[:]
-
-                # no element found. Wait.
+            self._consumer = threading.get_ident()
+            while True:
+                if self._len:
+                    try:
+                        return self._pop()
+                    except IndexError:
+                        pass
                 self._condition.wait()
 
+    def removeBatch(self, maxN=64, timeout=None):
+        """ Removes and returns the next elements from this queue
+
+        Waits until at least one element is available (or the timeout expires), then returns up to maxN elements,
+        in the order L{remove} would have returned them.
+
+        @param maxN: max. number of elements to return
+        @type maxN: int
+
+        @param timeout: max. time to wait for an element (s); None to wait forever
+        @type timeout: float
+
+        @return: next elements from this queue; empty if the timeout expired
+        @rtype: list
+        """
+        with self._condition:
+            self._consumer = threading.get_ident()
+            if not self._len:
+                self._condition.wait_for(lambda: self._len, timeout)
+            objs = []
+            try:
+                while self._len and len(objs) < maxN:
+                    objs.append(self._pop())
+            except IndexError:
+                pass
+            return objs
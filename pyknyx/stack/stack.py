@@ -48,8 +48,6 @@ Usage
 """
 
 
-import time
-
 from pyknyx.common.exception import PKNyXValueError
 from pyknyx.services.logger import logging; logger = logging.getLogger(__name__)
 from pyknyx.stack.individualAddress import IndividualAddress
@@ -57,7 +55,6 @@ from pyknyx.stack.layer7.a_groupDataService import A_GroupDataService
 from pyknyx.stack.layer4.t_groupDataService import T_GroupDataService
 from pyknyx.stack.layer3.n_groupDataService import N_GroupDataService
 from pyknyx.stack.layer2.l_dataService import L_DataService
-from pyknyx.stack.priority import Priority
 
 
 class StackValueError(PKNyXValueError):
@@ -93,7 +90,8 @@ class Stack(object):
         self._lds = L_DataService(ets, individualAddress=individualAddress)
         self._ngds = N_GroupDataService(self._lds)
         self._tgds = T_GroupDataService(self._ngds)
-        self._agds = A_GroupDataService(self._tgds)
+        self._agds = A_GroupDataService(self._tgds, ets.readCoordinator)
+        self._lds.setGroupTelegramListener(self._agds)
 
     @property
     def agds(self):
@@ -106,20 +104,20 @@ class Stack(object):
     def start(self):
         """
         Start the stack. All we need to do is to read initial state from the bus.
+
+        The reads are paced and tracked by ETS (see L{ETS.initRead<pyknyx.core.ets.ETS.initRead>}).
         """
         logger.trace("Stack.start()")
 
-        time.sleep(0.25)
-
         # Iterate over Group to find those which need to send a initial read request
         # (depending on GroupObject init flag)
         logger.debug("Stack.start(): initiate a read request for Group having at least one GroupObject with 'init' flag on")
+        ets = self._lds.ets
         for group in self._agds.groups.values():
             for listener in group.listeners:
                 try:
                     if listener.flags.init:
-                        group.read(priority=Priority())
-                        time.sleep(0.1)  # avoid bus saturation
+                        ets.initRead(group)
                         break
                 except AttributeError:
                     logger.exception("Stack.start(): listener does not seem to be a GroupObject")
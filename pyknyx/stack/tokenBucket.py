@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+
+""" Python KNX framework
+
+License
+=======
+
+ - B{pKNyX} (U{http://www.pyknyx.org}) is Copyright:
+  - (C) 2013-2015 Frédéric Mantegazza
+
+This program is free software; you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation; either version 2 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program; if not, write to the Free Software
+Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+or see:
+
+ - U{http://www.gnu.org/licenses/gpl.html}
+
+
+Module purpose
+==============
+
+Transmission rate limiting
+
+Implements
+==========
+
+ - B{TokenBucket}
+ - B{TokenBucketValueError}
+
+Documentation
+=============
+
+The bucket holds up to burst tokens, and is refilled at rate tokens per second. Sending a telegram takes one token;
+when the bucket is empty, the sender must wait for the next token.
+
+Usage
+=====
+
+>>> bucket = TokenBucket(50)
+>>> bucket.take()
+0.0
+>>> bucket.take()
+0.02
+
+@author: Frédéric Mantegazza
+@copyright: (C) 2013-2015 Frédéric Mantegazza
+@license: GPL
+"""
+
+
+import time
+
+from pyknyx.common.exception import PKNyXValueError
+from pyknyx.services.logger import logging; logger = logging.getLogger(__name__)
+
+
+class TokenBucketValueError(PKNyXValueError):
+    """
+    """
+
+
+class TokenBucket(object):
+    """ TokenBucket class
+
+    @ivar _rate: number of tokens added per second
+    @type _rate: float
+
+    @ivar _burst: max. number of tokens
+    @type _burst: float
+
+    @ivar _tokens: available tokens
+    @type _tokens: float
+
+    @ivar _last: time of the last refill
+    @type _last: float
+    """
+    def __init__(self, rate, burst=1, clock=time.monotonic):
+        """
+
+        @param rate: number of tokens added per second
+        @type rate: float
+
+        @param burst: max. number of tokens, i.e. of telegrams which can be sent back to back
+        @type burst: int
+
+        @param clock: time source
+        @type clock: callable
+
+        raise TokenBucketValueError:
+        """
+        super(TokenBucket, self).__init__()
+
+        if rate <= 0:
+            raise TokenBucketValueError("invalid rate (%r)" % rate)
+        if burst < 1:
+            raise TokenBucketValueError("invalid burst (%r)" % burst)
+
+        self._rate = float(rate)
+        self._burst = float(burst)
+        self._clock = clock
+        self._tokens = self._burst
+        self._last = clock()
+
+    @property
+    def rate(self):
+        return self._rate
+
+    def _refill(self):
+        now = self._clock()
+        self._tokens = min(self._burst, self._tokens + (now - self._last) * self._rate)
+        self._last = now
+
+    def take(self):
+        """ Take a token
+
+        @return: 0. if a token was taken, else the time to wait before trying again (s)
+        @rtype: float
+        """
+        self._refill()
+        if self._tokens >= 1.:
+            self._tokens -= 1.
+            return 0.
+        return (1. - self._tokens) / self._rate
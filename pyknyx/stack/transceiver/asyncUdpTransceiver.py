@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+
+""" Python KNX framework
+
+License
+=======
+
+ - B{pKNyX} (U{http://www.pyknyx.org}) is Copyright:
+  - (C) 2013-2015 Frédéric Mantegazza
+
+This program is free software; you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation; either version 2 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program; if not, write to the Free Software
+Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+or see:
+
+ - U{http://www.gnu.org/licenses/gpl.html}
+
+
+Module purpose
+==============
+
+UDP multicast transceiver, running in an asyncio event loop
+
+Implements
+==========
+
+ - B{AsyncUDPTransceiver}
+
+Documentation
+=============
+
+Same as L{UDPTransceiver<pyknyx.stack.transceiver.udpTransceiver>}, without the receiver and transmitter threads:
+the sockets are driven by the event loop of L{AsyncETS<pyknyx.core.asyncEts>}, received datagrams are decoded in
+datagram_received(), and frames are sent as ETS hands them over (ETS already orders them by priority), as fast as
+the routing flow control allows.
+
+Usage
+=====
+
+>>> ets = AsyncETS("1.2.0", transCls=AsyncUDPTransceiver)
+
+@author: Frédéric Mantegazza
+@copyright: (C) 2013-2015 Frédéric Mantegazza
+@license: GPL
+"""
+
+
+import asyncio
+import collections
+
+from pyknyx.services.logger import logging, HOT_PATH; logger = logging.getLogger(__name__)
+from pyknyx.stack.transceiver.udpTransceiver import UDPTransceiver
+
+
+class AsyncUDPTransceiver(UDPTransceiver, asyncio.DatagramProtocol):
+    """ AsyncUDPTransceiver class
+
+    @ivar _rxTransport: receiver transport
+    @type _rxTransport: asyncio.DatagramTransport
+
+    @ivar _txTransport: transmitter transport
+    @type _txTransport: asyncio.DatagramTransport
+
+    @ivar _txQueue: datagrams waiting to be sent
+    @type _txQueue: deque of bytearray
+
+    @ivar _flushHandle: pending call to L{_flush}, if transmission is delayed
+    @type _flushHandle: asyncio.TimerHandle
+    """
+    def __init__(self, ets, mcastAddr="224.0.23.12", mcastPort=3671, rcvBuf=None, rate=50):
+        """
+
+        @param mcastAddr: multicast address to bind to
+        @type mcastAddr: str
+
+        @param mcastPort: multicast port to bind to
+        @type mcastPort: str
+
+        @param rcvBuf: size of the kernel receive buffer (SO_RCVBUF); system default if None
+        @type rcvBuf: int
+
+        @param rate: max. number of telegrams sent per second; 0 for no limit
+        @type rate: float
+        """
+        super(AsyncUDPTransceiver, self).__init__(ets, mcastAddr, mcastPort, rcvBuf=rcvBuf, rate=rate)
+
+        self._rxTransport = None
+        self._txTransport = None
+        self._txQueue = collections.deque()
+        self._flushHandle = None
+
+    async def _open(self):
+        """ Hand the sockets over to the event loop
+        """
+        if not self._running:
+            return
+        loop = asyncio.get_running_loop()
+        self._txTransport, _ = await loop.create_datagram_endpoint(asyncio.DatagramProtocol,
+                                                                   sock=self._transmitterSock)
+        self._rxTransport, _ = await loop.create_datagram_endpoint(lambda: self, sock=self._receiverSock)
+
+        self._flush()
+
+    def datagram_received(self, data, addr):
+        fromAddr, fromPort = addr[:2]
+        cEMI = self._decodeFrame(data, fromAddr, fromPort)
+        if cEMI is not None:
+            self._stats['frames'] += 1
+            self.dataReq(cEMI)
+
+    def error_received(self, exc):
+        logger.warning("AsyncUDPTransceiver.error_received(): %s", exc)
+
+    def dataInd(self, cEMI):
+        frame = self._encodeFrame(cEMI)
+        if HOT_PATH and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("AsyncUDPTransceiver.dataInd(): frame=%r", frame)
+        self._txQueue.append(frame)
+        if self._flushHandle is None:
+            self._flush()
+
+    def _flush(self):
+        """ Send the queued datagrams, as fast as the flow control allows
+        """
+        self._flushHandle = None
+        while self._txQueue and self._txTransport is not None:
+            delay = self._transmitDelay()
+            if delay:
+                self._flushHandle = asyncio.get_running_loop().call_later(delay, self._flush)
+                return
+            self._txTransport.sendto(self._txQueue.popleft(), (self._mcastAddr, self._mcastPort))
+            self._stats['sent'] += 1
+
+    def start(self):
+        """ Open the transports
+
+        Must be called from the event loop thread.
+        """
+        logger.trace("AsyncUDPTransceiver.start()")
+
+        self._running = True
+        asyncio.get_running_loop().create_task(self._open())
+
+    def stop(self):
+        """
+        """
+        logger.trace("AsyncUDPTransceiver.stop()")
+
+        self._running = False
+        if self._flushHandle is not None:
+            self._flushHandle.cancel()
+            self._flushHandle = None
+        if self._txTransport is None:
+            self._transmitterSock.close()
+        else:
+            self._txTransport.close()  # also closes the socket
+        if self._rxTransport is None:
+            self._receiverSock.close()
+        else:
+            self._rxTransport.close()
+        self._rxTransport = self._txTransport = None
@@ -0,0 +1,378 @@
+# -*- coding: utf-8 -*-
+
+""" Python KNX framework
+
+License
+=======
+
+ - B{pKNyX} (U{http://www.pyknyx.org}) is Copyright:
+  - (C) 2013-2015 Frédéric Mantegazza
+
+This program is free software; you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation; either version 2 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program; if not, write to the Free Software
+Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+or see:
+
+ - U{http://www.gnu.org/licenses/gpl.html}
+
+
+Module purpose
+==============
+
+knxd/eibd transceiver
+
+Implements
+==========
+
+ - B{KnxdTransceiver}
+ - B{KnxdTransceiverValueError}
+
+Documentation
+=============
+
+Talks to a knxd (or eibd) daemon through its client protocol, using a group socket connection
+(EIB_OPEN_GROUPCON): all group telegrams seen by the daemon are received, and group telegrams can be sent to any
+group address. Individually-addressed frames can't go through such a connection, and are not forwarded.
+
+Each message is prefixed with its length (16 bits, big endian), followed by the message type (16 bits):
+
+ - EIB_OPEN_GROUPCON: type, 0x0000, write-only flag (0x00/0xff); the daemon answers with the same type
+ - EIB_GROUP_PACKET received: type, source address, destination address, TPDU
+ - EIB_GROUP_PACKET sent: type, destination address, TPDU
+
+A single thread drives the non-blocking socket with a selector. Incoming messages are read into a reusable buffer
+and decoded in place with struct; outgoing messages are appended to an output buffer and written as soon as the
+socket accepts them, so any number of requests can be outstanding (the daemon doesn't acknowledge group packets).
+The connection is re-opened if it is lost.
+
+Usage
+=====
+
+>>> ets = ETS("1.2.0", transCls=KnxdTransceiver, transParams=dict(url="ip:localhost:6720"))
+
+@author: Frédéric Mantegazza
+@copyright: (C) 2013-2015 Frédéric Mantegazza
+@license: GPL
+"""
+
+
+import errno
+import time
+import threading
+import socket
+import selectors
+import struct
+
+from pyknyx.common.exception import PKNyXValueError
+from pyknyx.services.logger import logging; logger = logging.getLogger(__name__)
+from pyknyx.stack.groupAddress import GroupAddress
+from pyknyx.stack.layer2.l_dataServiceBase import L_DataServiceBroadcast
+from pyknyx.stack.cemi.cemiLData import CEMILData, CEMIValueError
+
+EIB_OPEN_GROUPCON = 0x0026
+EIB_GROUP_PACKET = 0x0027
+
+
+class KnxdTransceiverValueError(PKNyXValueError):
+    """
+    """
+
+
+class KnxdTransceiver(L_DataServiceBroadcast):
+    """ KnxdTransceiver class
+
+    @ivar _url: daemon address ("ip:host[:port]" or "local:path")
+    @type _url: str
+
+    @ivar _sock: connection to the daemon, if opened
+    @type _sock: L{socket<socket>}
+
+    @ivar _inBuf: input buffer, reused for all messages
+    @type _inBuf: bytearray
+
+    @ivar _inLen: number of bytes in the input buffer
+    @type _inLen: int
+
+    @ivar _outBuf: messages waiting to be written
+    @type _outBuf: bytearray
+
+    @ivar _lock: protects the output buffer
+    @type _lock: L{Lock<threading>}
+
+    @ivar _ioThread: socket I/O loop
+    @type _ioThread: L{Thread<threading>}
+
+    @ivar _stats: counters
+    @type _stats: dict
+    """
+    RECONNECT_DELAY = 5
+    IN_BUFFER_SIZE = 4096
+
+    # Control fields of the received frames: standard frame, not repeated, low priority, hop count 6
+    CTRL1 = 0xbc
+    CTRL2 = 0xe0
+
+    def __init__(self, ets, url="ip:localhost:6720"):
+        """
+
+        @param url: daemon address ("ip:host[:port]" or "local:path")
+        @type url: str
+
+        raise KnxdTransceiverValueError:
+        """
+        super(KnxdTransceiver, self).__init__(ets)
+
+        if url.startswith("local:"):
+            self._family, self._address = socket.AF_UNIX, url[6:]
+        elif url.startswith("ip:"):
+            parts = url.split(':')
+            try:
+                port = int(parts[2]) if len(parts) > 2 else 6720
+            except ValueError:
+                raise KnxdTransceiverValueError("invalid url (%s)" % url)
+            self._family, self._address = socket.AF_INET, (parts[1], port)
+        else:
+            raise KnxdTransceiverValueError("invalid url (%s)" % url)
+        self._url = url
+
+        self._sock = None
+        self._opened = False
+        self._inBuf = bytearray(KnxdTransceiver.IN_BUFFER_SIZE)
+        self._inView = memoryview(self._inBuf)
+        self._inLen = 0
+        self._outBuf = bytearray()
+        self._lock = threading.Lock()
+        self._selector = selectors.DefaultSelector()
+        self._wakeupRecv, self._wakeupSend = socket.socketpair()
+        self._wakeupRecv.setblocking(False)
+        self._wakeupSend.setblocking(False)
+        self._selector.register(self._wakeupRecv, selectors.EVENT_READ)
+        self._stats = dict(connects=0, sent=0, received=0)
+        self._ioThread = None
+        self._running = False
+
+    @property
+    def url(self):
+        return self._url
+
+    @property
+    def connected(self):
+        return self._opened
+
+    @property
+    def stats(self):
+        """ Counters
+
+         - connects: number of group connections opened
+         - sent: number of group packets sent
+         - received: number of group packets received
+        """
+        return dict(self._stats)
+
+    def wantsIndividualFrame(self, cEMI, force=False):
+        return False
+
+    def _wakeup(self):
+        try:
+            self._wakeupSend.send(b"\x00")
+        except socket.error:
+            pass  # already pending
+
+    def _connect(self):
+        """ Open the connection and request a group socket
+        """
+        sock = socket.socket(self._family, socket.SOCK_STREAM)
+        try:
+            sock.connect(self._address)
+        except socket.error:
+            sock.close()
+            raise
+        sock.setblocking(False)
+        if self._family == socket.AF_INET:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._sock = sock
+        self._inLen = 0
+        with self._lock:
+            # The open request must go first; group packets queued while disconnected follow
+            self._outBuf[:0] = struct.pack(">HHHB", 5, EIB_OPEN_GROUPCON, 0, 0)
+        self._selector.register(sock, selectors.EVENT_READ | selectors.EVENT_WRITE)
+        logger.debug("KnxdTransceiver._connect(): connected to %s", self._url)
+
+    def _disconnect(self):
+        if self._sock is not None:
+            self._selector.unregister(self._sock)
+            self._sock.close()
+            self._sock = None
+        self._opened = False
+        with self._lock:
+            self._outBuf = bytearray()
+
+    def _read(self):
+        """ Read available data, and handle complete messages
+
+        @return: False if the connection was closed by the daemon
+        @rtype: bool
+        """
+        inBuf = self._inBuf
+        if self._inLen == len(inBuf):
+            raise KnxdTransceiverValueError("message too long")
+        try:
+            nbytes = self._sock.recv_into(self._inView[self._inLen:])
+        except socket.error as e:
+            if e.errno in (errno.EAGAIN, errno.EWOULDBLOCK):
+                return True
+            raise
+        if not nbytes:
+            return False
+        self._inLen += nbytes
+
+        pos = 0
+        end = self._inLen
+        cEMIs = []
+        while end - pos >= 4:
+            length, type_ = struct.unpack_from(">HH", inBuf, pos)
+            if end - pos < length + 2:
+                break
+            if type_ == EIB_GROUP_PACKET and length >= 7:
+                cEMI = self._decodePacket(pos + 4, pos + 2 + length)
+                if cEMI is not None:
+                    cEMIs.append(cEMI)
+            elif type_ == EIB_OPEN_GROUPCON:
+                logger.info("KnxdTransceiver._read(): group connection opened")
+                self._opened = True
+                self._stats['connects'] += 1
+            else:
+                logger.warning("KnxdTransceiver._read(): unexpected message (type=%d, length=%d)" % (type_, length))
+            pos += length + 2
+
+        if pos:
+            inBuf[:end - pos] = inBuf[pos:end]
+            self._inLen = end - pos
+        if cEMIs:
+            self._stats['received'] += len(cEMIs)
+            self.dataReqBatch(cEMIs)
+        return True
+
+    def _decodePacket(self, start, end):
+        """ Build a cEMI L_Data.ind from a received group packet
+
+        @param start: position of the source address in the input buffer
+        @param end: end of the packet in the input buffer
+        """
+        src, dest = struct.unpack_from(">HH", self._inBuf, start)
+        tpduLength = end - start - 4
+        frame = bytearray(9 + tpduLength)
+        struct.pack_into(">BBBBHHB", frame, 0, CEMILData.MC_LDATA_IND, 0, KnxdTransceiver.CTRL1,
+                         KnxdTransceiver.CTRL2, src, dest, tpduLength - 1)
+        frame[9:] = self._inView[start+4:end]
+        try:
+            return CEMILData(frame)
+        except CEMIValueError:
+            logger.exception("KnxdTransceiver._decodePacket()")
+            return None
+
+    def _write(self):
+        with self._lock:
+            if not self._outBuf:
+                return
+            try:
+                nbytes = self._sock.send(self._outBuf)
+            except socket.error as e:
+                if e.errno in (errno.EAGAIN, errno.EWOULDBLOCK):
+                    return
+                raise
+            del self._outBuf[:nbytes]
+
+    def _ioLoop(self):
+        """
+        """
+        logger.trace("KnxdTransceiver._ioLoop()")
+
+        while self._running:
+            try:
+                if self._sock is None:
+                    try:
+                        self._connect()
+                    except socket.error as e:
+                        logger.warning("KnxdTransceiver._ioLoop(): can't connect to %s (%s)" % (self._url, e))
+                        self._wait(self.RECONNECT_DELAY)
+                        continue
+
+                with self._lock:
+                    events = selectors.EVENT_READ
+                    if self._outBuf:
+                        events |= selectors.EVENT_WRITE
+                self._selector.modify(self._sock, events)
+
+                for key, mask in self._selector.select(1):
+                    if key.fileobj is self._wakeupRecv:
+                        try:
+                            while self._wakeupRecv.recv(64):
+                                pass
+                        except socket.error:
+                            pass
+                        continue
+                    if mask & selectors.EVENT_WRITE:
+                        self._write()
+                    if mask & selectors.EVENT_READ and not self._read():
+                        logger.warning("KnxdTransceiver._ioLoop(): connection closed by %s" % self._url)
+                        self._disconnect()
+                        break
+
+            except Exception:
+                if self._running:
+                    logger.exception("KnxdTransceiver._ioLoop()")
+                    self._disconnect()
+                    self._wait(self.RECONNECT_DELAY)
+
+        self._disconnect()
+        logger.trace("KnxdTransceiver._ioLoop(): ended")
+
+    def _wait(self, delay):
+        """ Wait, unless we are stopped
+        """
+        end = time.time() + delay
+        while self._running and time.time() < end:
+            time.sleep(0.1)
+
+    def dataInd(self, cEMI):
+        destAddr = cEMI.destinationAddress
+        if not isinstance(destAddr, GroupAddress):
+            return
+        tpdu = cEMI.npdu[1:]
+        packet = struct.pack(">HHH", 4 + len(tpdu), EIB_GROUP_PACKET, destAddr.raw)
+        with self._lock:
+            self._outBuf += packet
+            self._outBuf += tpdu
+            self._stats['sent'] += 1
+        self._wakeup()
+
+    def start(self):
+        """
+        """
+        logger.trace("KnxdTransceiver.start()")
+
+        self._ioThread = threading.Thread(target=self._ioLoop, name="knxd I/O")
+        self._ioThread.setDaemon(True)
+        self._running = True
+        self._ioThread.start()
+
+    def stop(self):
+        """
+        """
+        logger.trace("KnxdTransceiver.stop()")
+
+        self._running = False
+        self._wakeup()
+        if self._ioThread is not None:
+            self._ioThread.join(2)
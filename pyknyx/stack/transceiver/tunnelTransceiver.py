@@ -0,0 +1,516 @@
+# -*- coding: utf-8 -*-
+
+""" Python KNX framework
+
+License
+=======
+
+ - B{pKNyX} (U{http://www.pyknyx.org}) is Copyright:
+  - (C) 2013-2015 Frédéric Mantegazza
+
+This program is free software; you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation; either version 2 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program; if not, write to the Free Software
+Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+or see:
+
+ - U{http://www.gnu.org/licenses/gpl.html}
+
+
+Module purpose
+==============
+
+KNXnet/IP tunnelling transceiver
+
+Implements
+==========
+
+ - B{TunnelTransceiver}
+ - B{TunnelTransceiverValueError}
+
+Documentation
+=============
+
+Connects to a KNXnet/IP interface (gateway) and exchanges cEMI frames with it through a tunnelling connection:
+
+ - the connection is opened with a CONNECT_REQ, and re-opened whenever it is lost;
+ - a CONNECTIONSTATE_REQ heartbeat is sent every HEARTBEAT_INTERVAL seconds; after HEARTBEAT_RETRIES unanswered
+   requests, the connection is considered lost;
+ - outgoing frames are sent as L_Data.req in TUNNELING_REQ, with a sequence counter. A request which is not
+   acknowledged within TUNNELING_REQUEST_TIMEOUT is resent (up to retries times), then the connection is re-opened;
+ - incoming TUNNELING_REQ are acknowledged, checked against the receive sequence counter (repeated requests are
+   acknowledged again but discarded), and their L_Data.ind frames forwarded to ETS.
+
+Connection requests and heartbeats go to the control endpoint of the interface (gatewayAddr:gatewayPort); tunnelling
+requests and acks go to the data endpoint it gives in its CONNECT_RES, or to the control endpoint if it gives none
+(0.0.0.0:0, NAT mode).
+
+The KNXnet/IP specification allows only one unacknowledged TUNNELING_REQ at a time (window=1, the default). Many
+interfaces accept more: a larger window lets bulk writes go out without waiting a full round trip per telegram.
+
+Usage
+=====
+
+>>> ets = ETS("1.2.0", transCls=TunnelTransceiver, transParams=dict(gatewayAddr="192.168.1.10", window=4))
+
+@author: Frédéric Mantegazza
+@copyright: (C) 2013-2015 Frédéric Mantegazza
+@license: GPL
+"""
+
+
+import time
+import threading
+import socket
+import struct
+
+from pyknyx.common.exception import PKNyXValueError
+from pyknyx.services.logger import logging, HOT_PATH; logger = logging.getLogger(__name__)
+from pyknyx.stack.priority import Priority
+from pyknyx.stack.priorityQueue import PriorityQueue
+from pyknyx.stack.individualAddress import IndividualAddress
+from pyknyx.stack.layer2.l_dataServiceBase import L_DataServiceBroadcast
+from pyknyx.stack.knxnetip.knxNetIPHeader import KNXnetIPHeader, KNXnetIPHeaderValueError
+from pyknyx.stack.cemi.cemiLData import CEMILData, CEMIValueError
+from pyknyx.stack.layer2.l_dataService import PRIORITY_DISTRIBUTION
+
+
+class TunnelTransceiverValueError(PKNyXValueError):
+    """
+    """
+
+
+class TunnelTransceiver(L_DataServiceBroadcast):
+    """ TunnelTransceiver class
+
+    @ivar _gatewayAddr: address of the KNXnet/IP interface
+    @type _gatewayAddr: str
+
+    @ivar _gatewayPort: port of the KNXnet/IP interface
+    @type _gatewayPort: int
+
+    @ivar _controlEndpoint: control endpoint of the KNXnet/IP interface
+    @type _controlEndpoint: tuple of (str, int)
+
+    @ivar _dataEndpoint: data endpoint of the current connection (control endpoint if not connected)
+    @type _dataEndpoint: tuple of (str, int)
+
+    @ivar _window: max. number of unacknowledged tunnelling requests
+    @type _window: int
+
+    @ivar _retries: number of times an unacknowledged tunnelling request is resent
+    @type _retries: int
+
+    @ivar _channel: communication channel id, or None if not connected
+    @type _channel: int
+
+    @ivar _sendSeq: sequence counter of the next tunnelling request to send
+    @type _sendSeq: int
+
+    @ivar _recvSeq: expected sequence counter of the next tunnelling request to receive
+    @type _recvSeq: int
+
+    @ivar _inFlight: unacknowledged tunnelling requests, by sequence counter ([frame, sent time, resend count])
+    @type _inFlight: dict
+
+    @ivar _condition: protects the connection state; notified when the window opens
+    @type _condition: L{Condition<threading>}
+
+    @ivar _stats: counters
+    @type _stats: dict
+    """
+    CONNECT_REQUEST_TIMEOUT = 10
+    CONNECTIONSTATE_REQUEST_TIMEOUT = 10
+    HEARTBEAT_INTERVAL = 60
+    HEARTBEAT_RETRIES = 3
+    TUNNELING_REQUEST_TIMEOUT = 1
+
+    TUNNEL_CONNECTION = 0x04
+    TUNNEL_LINKLAYER = 0x02
+    IPV4_UDP = 0x01
+    E_NO_ERROR = 0x00
+    MIN_BODY_SIZE = {KNXnetIPHeader.TUNNELING_REQ: 4,  # connection header
+                     KNXnetIPHeader.TUNNELING_ACK: 4,
+                     KNXnetIPHeader.CONNECT_RES: 2,
+                     KNXnetIPHeader.CONNECTIONSTATE_RES: 2,
+                     KNXnetIPHeader.DISCONNECT_REQ: 2}
+
+    def __init__(self, ets, gatewayAddr, gatewayPort=3671, window=1, retries=1):
+        """
+
+        @param gatewayAddr: address of the KNXnet/IP interface
+        @type gatewayAddr: str
+
+        @param gatewayPort: port of the KNXnet/IP interface
+        @type gatewayPort: int
+
+        @param window: max. number of unacknowledged tunnelling requests
+        @type window: int
+
+        @param retries: number of times an unacknowledged tunnelling request is resent
+        @type retries: int
+
+        raise TunnelTransceiverValueError:
+        """
+        super(TunnelTransceiver, self).__init__(ets)
+
+        if not 1 <= window <= 255:
+            raise TunnelTransceiverValueError("invalid window (%d)" % window)
+        if retries < 0:
+            raise TunnelTransceiverValueError("invalid retries (%d)" % retries)
+
+        self._gatewayAddr = gatewayAddr
+        self._gatewayPort = gatewayPort
+        self._window = window
+        self._retries = retries
+
+        self._controlEndpoint = (socket.gethostbyname(gatewayAddr), gatewayPort)
+        self._dataEndpoint = self._controlEndpoint
+
+        # The socket is not connected, as the data endpoint may differ from the control endpoint; bind it to the
+        # local address used to reach the interface, which is given in our HPAI
+        probe = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            probe.connect(self._controlEndpoint)
+            localAddr = probe.getsockname()[0]
+        finally:
+            probe.close()
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._sock.bind((localAddr, 0))
+        self._sock.settimeout(0.1)
+
+        self._queue = PriorityQueue(PRIORITY_DISTRIBUTION)
+        self._condition = threading.Condition()
+        self._channel = None
+        self._tunnelAddr = None
+        self._sendSeq = 0
+        self._recvSeq = 0
+        self._inFlight = {}
+        self._nextConnect = 0
+        self._nextHeartbeat = 0
+        self._heartbeatSent = None
+        self._heartbeatFailures = 0
+        self._stats = dict(connects=0, sent=0, resent=0, acked=0, lost=0, received=0)
+        self._receiver = None
+        self._transmitter = None
+        self._running = False
+
+    @property
+    def gatewayAddr(self):
+        return self._gatewayAddr
+
+    @property
+    def gatewayPort(self):
+        return self._gatewayPort
+
+    @property
+    def dataEndpoint(self):
+        """ Endpoint tunnelling requests are sent to
+        """
+        return self._dataEndpoint
+
+    @property
+    def window(self):
+        return self._window
+
+    @property
+    def connected(self):
+        return self._channel is not None
+
+    @property
+    def tunnelAddr(self):
+        """ Individual address assigned to the connection by the interface
+        """
+        return self._tunnelAddr
+
+    @property
+    def stats(self):
+        """ Counters
+
+         - connects: number of connections opened
+         - sent: number of tunnelling requests sent (not counting resends)
+         - resent: number of tunnelling requests resent
+         - acked: number of tunnelling requests acknowledged
+         - lost: number of tunnelling requests never acknowledged
+         - received: number of frames received from the interface
+        """
+        return dict(self._stats)
+
+    def _hpai(self):
+        """ Host protocol address information of our endpoint
+        """
+        addr, port = self._sock.getsockname()
+        return struct.pack(">BB4sH", 8, TunnelTransceiver.IPV4_UDP, socket.inet_aton(addr), port)
+
+    def _send(self, service, body, endpoint=None):
+        """ Send a frame to the interface, on its control endpoint by default
+        """
+        header = KNXnetIPHeader(service=service, serviceLength=len(body))
+        try:
+            self._sock.sendto(header.frame + body, endpoint or self._controlEndpoint)
+        except socket.error:
+            logger.exception("TunnelTransceiver._send()")
+
+    def _connect(self, now):
+        logger.debug("TunnelTransceiver._connect(): %s:%d", self._gatewayAddr, self._gatewayPort)
+        cri = struct.pack(">4B", 4, TunnelTransceiver.TUNNEL_CONNECTION, TunnelTransceiver.TUNNEL_LINKLAYER, 0)
+        self._send(KNXnetIPHeader.CONNECT_REQ, self._hpai() + self._hpai() + cri)
+        self._nextConnect = now + self.CONNECT_REQUEST_TIMEOUT
+
+    def _disconnect(self, now, notify=True):
+        """ Drop the connection; it will be re-opened by the receiver loop
+
+        Must be called with the condition held.
+        """
+        if self._channel is None:
+            return
+        logger.warning("TunnelTransceiver._disconnect(): channel %d closed" % self._channel)
+        if notify:
+            self._send(KNXnetIPHeader.DISCONNECT_REQ, struct.pack(">BB", self._channel, 0) + self._hpai())
+        self._stats['lost'] += len(self._inFlight)
+        self._inFlight.clear()
+        self._channel = None
+        self._dataEndpoint = self._controlEndpoint
+        self._heartbeatSent = None
+        self._nextConnect = now
+        self._condition.notify_all()
+
+    def _checkTimers(self, now):
+        """ Connect, resend unacknowledged requests and send heartbeats, when due
+        """
+        with self._condition:
+            if self._channel is None:
+                if now >= self._nextConnect:
+                    self._connect(now)
+                return
+
+            for seq, entry in list(self._inFlight.items()):
+                frame, sent, resent = entry
+                if now - sent < self.TUNNELING_REQUEST_TIMEOUT:
+                    continue
+                if resent >= self._retries:
+                    logger.warning("TunnelTransceiver._checkTimers(): no ack for request #%d" % seq)
+                    self._disconnect(now)
+                    return
+                logger.debug("TunnelTransceiver._checkTimers(): resend request #%d", seq)
+                self._sock.sendto(frame, self._dataEndpoint)
+                entry[1] = now
+                entry[2] += 1
+                self._stats['resent'] += 1
+
+            if self._heartbeatSent is not None and now - self._heartbeatSent >= self.CONNECTIONSTATE_REQUEST_TIMEOUT:
+                self._heartbeatSent = None
+                self._heartbeatFailures += 1
+                if self._heartbeatFailures >= self.HEARTBEAT_RETRIES:
+                    self._disconnect(now)
+                    return
+                self._nextHeartbeat = now
+            if self._heartbeatSent is None and now >= self._nextHeartbeat:
+                self._send(KNXnetIPHeader.CONNECTIONSTATE_REQ, struct.pack(">BB", self._channel, 0) + self._hpai())
+                self._heartbeatSent = now
+
+    def _handleFrame(self, frame, now):
+        """ Handle a frame received from the interface
+        """
+        try:
+            header = KNXnetIPHeader(frame)
+        except KNXnetIPHeaderValueError:
+            logger.exception("TunnelTransceiver._handleFrame()")
+            return
+        service = header.service
+        body = frame[KNXnetIPHeader.HEADER_SIZE:]
+        if len(body) < TunnelTransceiver.MIN_BODY_SIZE.get(service, 2):
+            logger.warning("TunnelTransceiver._handleFrame(): %s too short" % header.serviceName)
+            return
+
+        with self._condition:
+            if service == KNXnetIPHeader.TUNNELING_REQ:
+                self._handleTunnelingReq(body)
+
+            elif service == KNXnetIPHeader.TUNNELING_ACK:
+                channel, seq, status = body[1], body[2], body[3]
+                if channel != self._channel or seq not in self._inFlight:
+                    return
+                if status != TunnelTransceiver.E_NO_ERROR:
+                    logger.warning("TunnelTransceiver._handleFrame(): request #%d nacked (%d)" % (seq, status))
+                    return  # will be resent
+                del self._inFlight[seq]
+                self._stats['acked'] += 1
+                self._condition.notify_all()
+
+            elif service == KNXnetIPHeader.CONNECT_RES:
+                channel, status = body[0], body[1]
+                if self._channel is not None:
+                    return
+                if status != TunnelTransceiver.E_NO_ERROR:
+                    logger.error("TunnelTransceiver._handleFrame(): connection refused (%d)" % status)
+                    return
+                if len(body) >= 10:
+                    self._dataEndpoint = self._parseHpai(body[2:10])
+                if len(body) >= 14:
+                    self._tunnelAddr = IndividualAddress(body[12] << 8 | body[13])
+                logger.info("TunnelTransceiver._handleFrame(): connected (channel %d, address %s, data endpoint %s:%d)" %
+                            ((channel, self._tunnelAddr) + self._dataEndpoint))
+                self._channel = channel
+                self._sendSeq = self._recvSeq = 0
+                self._heartbeatFailures = 0
+                self._nextHeartbeat = now + self.HEARTBEAT_INTERVAL
+                self._stats['connects'] += 1
+                self._condition.notify_all()
+
+            elif service == KNXnetIPHeader.CONNECTIONSTATE_RES:
+                channel, status = body[0], body[1]
+                if channel != self._channel:
+                    return
+                if status != TunnelTransceiver.E_NO_ERROR:
+                    logger.warning("TunnelTransceiver._handleFrame(): connection state error (%d)" % status)
+                    self._disconnect(now)
+                    return
+                self._heartbeatSent = None
+                self._heartbeatFailures = 0
+                self._nextHeartbeat = now + self.HEARTBEAT_INTERVAL
+
+            elif service == KNXnetIPHeader.DISCONNECT_REQ:
+                channel = body[0]
+                self._send(KNXnetIPHeader.DISCONNECT_RES, struct.pack(">BB", channel, TunnelTransceiver.E_NO_ERROR))
+                if channel == self._channel:
+                    self._disconnect(now, notify=False)
+
+            else:
+                logger.debug("TunnelTransceiver._handleFrame(): ignore %s", header.serviceName)
+
+    def _parseHpai(self, hpai):
+        """ Endpoint given by a host protocol address information
+
+        @return: the endpoint, or the control endpoint for 0.0.0.0:0 (NAT mode)
+        @rtype: tuple of (str, int)
+        """
+        addr = socket.inet_ntoa(bytes(hpai[2:6]))
+        port = hpai[6] << 8 | hpai[7]
+        if addr == "0.0.0.0" and not port:
+            return self._controlEndpoint
+        return addr, port
+
+    def _handleTunnelingReq(self, body):
+        channel, seq = body[1], body[2]
+        if channel != self._channel:
+            return
+        if seq == (self._recvSeq - 1) & 0xff:
+            self._send(KNXnetIPHeader.TUNNELING_ACK, struct.pack(">4B", 4, channel, seq, TunnelTransceiver.E_NO_ERROR),
+                       self._dataEndpoint)
+            return  # repeated
+        if seq != self._recvSeq:
+            logger.warning("TunnelTransceiver._handleTunnelingReq(): out of sequence (%d; expected %d)" % (seq, self._recvSeq))
+            return
+        self._send(KNXnetIPHeader.TUNNELING_ACK, struct.pack(">4B", 4, channel, seq, TunnelTransceiver.E_NO_ERROR),
+                   self._dataEndpoint)
+        self._recvSeq = (seq + 1) & 0xff
+
+        try:
+            cEMI = CEMILData(body[body[0]:])
+        except CEMIValueError:
+            logger.exception("TunnelTransceiver._handleTunnelingReq()")
+            return
+        if cEMI.messageCode == CEMILData.MC_LDATA_IND:
+            self._stats['received'] += 1
+            self.dataReq(cEMI)
+
+    def _receiverLoop(self):
+        """
+        """
+        logger.trace("TunnelTransceiver._receiverLoop()")
+
+        while self._running:
+            try:
+                self._checkTimers(time.time())
+                try:
+                    frame, addr = self._sock.recvfrom(1024)
+                except socket.timeout:
+                    continue
+                if addr[0] not in (self._controlEndpoint[0], self._dataEndpoint[0]):
+                    logger.debug("TunnelTransceiver._receiverLoop(): ignore frame from %s:%d", *addr)
+                    continue
+                self._handleFrame(bytearray(frame), time.time())
+
+            except:
+                if self._running:
+                    logger.exception("TunnelTransceiver._receiverLoop()")
+                    time.sleep(0.1)  # e.g. ECONNREFUSED while the interface is down
+
+        logger.trace("TunnelTransceiver._receiverLoop(): ended")
+
+    def dataInd(self, cEMI):
+        cEMI = cEMI.copy()  # sent later, as a request
+        cEMI.messageCode = CEMILData.MC_LDATA_REQ
+        self._queue.add(cEMI, cEMI.priority)
+
+    def _transmitterLoop(self):
+        """
+        """
+        logger.trace("TunnelTransceiver._transmitterLoop()")
+
+        while self._running:
+            try:
+                cEMI = self._queue.remove()
+                if cEMI is None:
+                    return
+
+                cEMIRawFrame = cEMI.frame.raw
+                with self._condition:
+                    while self._running and (self._channel is None or len(self._inFlight) >= self._window):
+                        self._condition.wait()
+                    if not self._running:
+                        return
+
+                    seq = self._sendSeq
+                    self._sendSeq = (seq + 1) & 0xff
+                    body = struct.pack(">4B", 4, self._channel, seq, 0) + cEMIRawFrame
+                    header = KNXnetIPHeader(service=KNXnetIPHeader.TUNNELING_REQ, serviceLength=len(body))
+                    frame = header.frame + body
+                    if HOT_PATH and logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("TunnelTransceiver._transmitterLoop(): frame= %r", frame)
+                    self._inFlight[seq] = [frame, time.time(), 0]
+                    self._stats['sent'] += 1
+                    self._sock.sendto(frame, self._dataEndpoint)
+
+            except Exception:
+                logger.exception("TunnelTransceiver._transmitterLoop()")
+
+        logger.trace("TunnelTransceiver._transmitterLoop(): ended")
+
+    def start(self):
+        """
+        """
+        logger.trace("TunnelTransceiver.start()")
+
+        self._receiver = threading.Thread(target=self._receiverLoop, name="Tunnel receiver")
+        self._receiver.setDaemon(True)
+        self._transmitter = threading.Thread(target=self._transmitterLoop, name="Tunnel transmitter")
+        self._transmitter.setDaemon(True)
+
+        self._running = True
+        self._receiver.start()
+        self._transmitter.start()
+
+    def stop(self):
+        """
+        """
+        logger.trace("TunnelTransceiver.stop()")
+
+        with self._condition:
+            self._disconnect(time.time())
+            self._running = False
+            self._condition.notify_all()
+        self._queue.add(None, Priority('system'))
+        if self._receiver is not None:
+            self._receiver.join(1)
+        self._sock.close()
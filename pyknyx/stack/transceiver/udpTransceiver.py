@@ -55,15 +55,18 @@ Usage
 
 
 import time
+import random
 import threading
 import socket
 
 from pyknyx.common.exception import PKNyXValueError
-from pyknyx.services.logger import logging; logger = logging.getLogger(__name__)
+from pyknyx.services.logger import logging, HOT_PATH; logger = logging.getLogger(__name__)
 from pyknyx.stack.result import Result
 from pyknyx.stack.priority import Priority
 from pyknyx.stack.priorityQueue import PriorityQueue
 from pyknyx.stack.multicastSocket import MulticastSocketReceive, MulticastSocketTransmit
+from pyknyx.stack.bufferRing import BufferRing
+from pyknyx.stack.tokenBucket import TokenBucket
 from pyknyx.stack.layer2.l_dataServiceBase import L_DataServiceBroadcast
 from pyknyx.stack.knxnetip.knxNetIPHeader import KNXnetIPHeader, KNXnetIPHeaderValueError
 from pyknyx.stack.cemi.cemiLData import CEMILData, CEMIValueError
@@ -89,8 +92,30 @@ class UDPTransceiver(L_DataServiceBroadcast):
 
     @ivar _transmitter: multicast transmitter loop
     @type _transmitter: L{Thread<threading>}
+
+    @ivar _batchSize: max. number of datagrams read per wakeup; 0 to read them one at a time
+    @type _batchSize: int
+
+    @ivar _stats: receiver counters
+    @type _stats: dict
+
+    @ivar _ring: receive buffers, if frames are received without copy
+    @type _ring: L{BufferRing}
+
+    @ivar _bucket: transmission rate limiter, if any
+    @type _bucket: L{TokenBucket}
+
+    @ivar _busyUntil: time until which transmission is suspended, following a ROUTING_BUSY
+    @type _busyUntil: float
+
+    @ivar _busyCount: number of ROUTING_BUSY received in a row
+    @type _busyCount: int
     """
-    def __init__(self, ets, mcastAddr="224.0.23.12", mcastPort=3671):
+    BUSY_RESET_TIME = 1.
+    BUSY_RANDOM_WAIT = 0.05
+
+    def __init__(self, ets, mcastAddr="224.0.23.12", mcastPort=3671, batchSize=0, rcvBuf=None, ringSize=0, rate=50,
+                 queueCapacity=None, queuePolicy="drop-oldest", queueTimeout=1.):
         """
 
         @param mcastAddr: multicast address to bind to
@@ -99,24 +124,63 @@ class UDPTransceiver(L_DataServiceBroadcast):
         @param mcastPort: multicast port to bind to
         @type mcastPort: str
 
+        @param batchSize: if not 0, wait once for incoming data, then drain up to batchSize pending datagrams
+                          without blocking and hand them over to ETS together
+        @type batchSize: int
+
+        @param rcvBuf: size of the kernel receive buffer (SO_RCVBUF); system default if None
+        @type rcvBuf: int
+
+        @param ringSize: if not 0, datagrams are received into a ring of ringSize preallocated buffers, and the
+                         frames handed over to ETS are views on these buffers
+        @type ringSize: int
+
+        @param rate: max. number of telegrams sent per second (the KNX IP routers limit); 0 for no limit
+        @type rate: float
+
+        @param queueCapacity: max. number of frames waiting to be sent, for all priorities or per priority level
+                              (None for no limit)
+        @type queueCapacity: int or list/tuple of int
+
+        @param queuePolicy: what to do with a new frame when its priority level is full (see
+                            L{PriorityQueue<pyknyx.stack.priorityQueue>})
+        @type queuePolicy: str or list/tuple of str
+
+        @param queueTimeout: max. time ETS waits for room, with the "block" policy (s)
+        @type queueTimeout: float
+
         raise UDPTransceiverValueError:
         """
         super(UDPTransceiver, self).__init__(ets)
 
+        if batchSize < 0:
+            raise UDPTransceiverValueError("invalid batchSize (%d)" % batchSize)
+        if rate < 0:
+            raise UDPTransceiverValueError("invalid rate (%r)" % rate)
+
         self._mcastAddr = mcastAddr
         self._mcastPort = mcastPort
+        self._batchSize = batchSize
+        self._stats = dict(frames=0, batches=0, maxBatch=0, batchSizes={}, sent=0, busy=0, lost=0)
+        if ringSize:
+            self._ring = BufferRing(ringSize, MulticastSocketReceive.MAX_FRAME_SIZE)
+        else:
+            self._ring = None
+        if rate:
+            self._bucket = TokenBucket(rate)
+        else:
+            self._bucket = None
+        self._busyUntil = 0.
+        self._busyCount = 0
+        self._lastBusy = 0.
 
         localAddr = socket.gethostbyname(socket.gethostname())
         self._transmitterSock = MulticastSocketTransmit(localAddr, 0, mcastAddr, mcastPort)
-        self._receiverSock = MulticastSocketReceive(localAddr, self._transmitterSock.localPort, mcastAddr, mcastPort)
-        self._queue = PriorityQueue(PRIORITY_DISTRIBUTION)
-
-
-        # Create transmitter and receiver threads
-        self._receiver = threading.Thread(target=self._receiverLoop, name="UDP receiver")
-        self._receiver.setDaemon(True)
-        self._transmitter = threading.Thread(target=self._transmitterLoop, name="UDP transmitter")
-        self._transmitter.setDaemon(True)
+        self._receiverSock = MulticastSocketReceive(localAddr, self._transmitterSock.localPort, mcastAddr, mcastPort,
+                                                    rcvBuf=rcvBuf, batch=bool(batchSize))
+        self._queue = PriorityQueue(PRIORITY_DISTRIBUTION, queueCapacity, queuePolicy, queueTimeout)
+        self._receiver = None
+        self._transmitter = None
 
     @property
     def mcastAddr(self):
@@ -134,35 +198,160 @@ class UDPTransceiver(L_DataServiceBroadcast):
     def localPort(self):
         return self._receiverSock.localPort
 
+    @property
+    def stats(self):
+        """ Receiver counters
+
+         - frames: number of frames handed over to ETS
+         - batches: number of wakeups which returned at least one datagram
+         - maxBatch: largest number of datagrams read in one wakeup
+         - batchSizes: number of wakeups, per number of datagrams read
+         - dropped: number of datagrams dropped by the kernel (batch mode only)
+         - ringOverflows: number of frames received into a temporary buffer because the ring was exhausted
+         - sent: number of frames sent
+         - busy: number of ROUTING_BUSY received
+         - lost: number of telegrams routers reported as lost (ROUTING_LOST_MSG)
+         - queue: transmit queue metrics (see L{PriorityQueue.stats<pyknyx.stack.priorityQueue.PriorityQueue.stats>})
+        """
+        stats = dict(self._stats)
+        stats['batchSizes'] = dict(self._stats['batchSizes'])
+        stats['dropped'] = self._receiverSock.dropped
+        if self._ring is not None:
+            stats['ringOverflows'] = self._ring.overflows
+        stats['queue'] = self._queue.stats
+        return stats
+
+    def _decodeFrame(self, inFrame, fromAddr, fromPort, buffer=None):
+        """ Decode a received datagram
+
+        @param buffer: receive buffer inFrame is a view on. It is released if the datagram is ignored
+        @type buffer: L{FrameBuffer<pyknyx.stack.bufferRing>}
+
+        @return: decoded frame, or None if it must be ignored
+        @rtype: L{CEMILData}
+        """
+        cEMI = None
+        try:
+            cEMI = self._decodeFrame_(inFrame, fromAddr, fromPort, buffer)
+        finally:
+            if cEMI is None and buffer is not None:
+                buffer.release()
+        return cEMI
+
+    def _decodeFrame_(self, inFrame, fromAddr, fromPort, buffer):
+        debug = HOT_PATH and logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("UDPTransceiver._decodeFrame(): inFrame=%r (%s, %d)", inFrame, fromAddr, fromPort)
+        if fromAddr == self._transmitterSock.localAddress and fromPort == self._transmitterSock.localPort:
+            return None # we got our own packet
+        if not isinstance(inFrame, memoryview):
+            inFrame = bytearray(inFrame)
+        try:
+            header = KNXnetIPHeader(inFrame)
+        except KNXnetIPHeaderValueError:
+            logger.exception("UDPTransceiver._decodeFrame()")
+            return None
+        if debug:
+            logger.debug("UDPTransceiver._decodeFrame(): KNXnetIP header=%r", header)
+
+        if header.service != KNXnetIPHeader.ROUTING_IND:
+            self._routingMessage(header, inFrame[KNXnetIPHeader.HEADER_SIZE:])
+            return None
+
+        frame = inFrame[KNXnetIPHeader.HEADER_SIZE:]
+        if debug:
+            logger.debug("UDPTransceiver._decodeFrame(): frame=%r", frame)
+        try:
+            cEMI = CEMILData(frame, buffer)
+        except CEMIValueError:
+            logger.exception("UDPTransceiver._decodeFrame()")
+            return None
+        if debug:
+            logger.debug("UDPTransceiver._decodeFrame(): cEMI=%s", cEMI)
+
+        return cEMI
+
+    def _routingMessage(self, header, body):
+        """ Handle routing flow control messages
+        """
+        if len(body) < 4:
+            logger.debug("UDPTransceiver._routingMessage(): ignore %s", header.serviceName)
+        elif header.service == KNXnetIPHeader.ROUTING_LOST_MSG:
+            lost = body[2] << 8 | body[3]
+            logger.warning("UDPTransceiver._routingMessage(): router lost %d telegram(s)" % lost)
+            self._stats['lost'] += lost
+        elif header.service == KNXnetIPHeader.ROUTING_BUSY:
+            self._routingBusy((body[2] << 8 | body[3]) / 1000.)
+        else:
+            logger.debug("UDPTransceiver._routingMessage(): ignore %s", header.serviceName)
+
+    def _routingBusy(self, waitTime):
+        """ Suspend transmission after a ROUTING_BUSY
+
+        Transmission is suspended for the time requested by the router, plus a random time growing with the number
+        of ROUTING_BUSY received in a row, so that all senders don't resume together.
+
+        @param waitTime: time requested by the router (s)
+        @type waitTime: float
+        """
+        now = time.time()
+        if now - self._lastBusy > self.BUSY_RESET_TIME:
+            self._busyCount = 0
+        self._busyCount += 1
+        self._lastBusy = now
+        self._stats['busy'] += 1
+        busyUntil = now + waitTime + random.random() * self._busyCount * self.BUSY_RANDOM_WAIT
+        self._busyUntil = max(self._busyUntil, busyUntil)
+        logger.debug("UDPTransceiver._routingBusy(): suspend transmission for %.3fs", self._busyUntil - now)
+
+    def _transmitDelay(self):
+        """ Take a transmission slot
+
+        @return: 0. if a frame may be sent now, else the time to wait before trying again (s)
+        @rtype: float
+        """
+        delay = self._busyUntil - time.time()
+        if delay > 0:
+            return delay
+        if self._bucket is not None:
+            return self._bucket.take()
+        return 0.
+
+    def _encodeFrame(self, cEMI):
+        """ Build the datagram to send for a frame
+
+        @rtype: bytearray
+        """
+        cEMIRawFrame = cEMI.frame.raw
+        header = KNXnetIPHeader(service=KNXnetIPHeader.ROUTING_IND, serviceLength=len(cEMIRawFrame))
+        return header.frame + cEMIRawFrame
+
     def _receiverLoop(self):
         """
         """
         logger.trace("UDPTransceiver._receiverLoop()")
 
+        if self._batchSize:
+            self._batchReceiverLoop()
+            return
+
+        ring = self._ring
         while self._running:
             try:
-                inFrame, (fromAddr, fromPort) = self._receiverSock.receive()
-                logger.debug("UDPTransceiver._receiverLoop(): inFrame=%s (%s, %d)" % (repr(inFrame), fromAddr, fromPort))
-                if fromAddr == self._transmitterSock.localAddress and fromPort == self._transmitterSock.localPort:
-                    continue # we got our own packet
-                inFrame = bytearray(inFrame)
-                try:
-                    header = KNXnetIPHeader(inFrame)
-                except KNXnetIPHeaderValueError:
-                    logger.exception("UDPTransceiver._receiverLoop()")
-                    continue
-                logger.debug("UDPTransceiver._receiverLoop(): KNXnetIP header=%s" % repr(header))
-
-                frame = inFrame[KNXnetIPHeader.HEADER_SIZE:]
-                logger.debug("UDPTransceiver._receiverLoop(): frame=%s" % repr(frame))
-                try:
-                    cEMI = CEMILData(frame)
-                except CEMIValueError:
-                    logger.exception("UDPTransceiver._receiverLoop()")
-                    continue
-                logger.debug("UDPTransceiver._receiverLoop(): cEMI=%s" % cEMI)
-
-                self.dataReq(cEMI)
+                if ring is None:
+                    inFrame, (fromAddr, fromPort) = self._receiverSock.receive()
+                    cEMI = self._decodeFrame(inFrame, fromAddr, fromPort)
+                else:
+                    buf = ring.acquire()
+                    try:
+                        fromAddr, fromPort = self._receiverSock.receiveInto(buf)
+                    except:
+                        buf.release()
+                        raise
+                    cEMI = self._decodeFrame(buf.frame, fromAddr, fromPort, buf)
+                if cEMI is not None:
+                    self._stats['frames'] += 1
+                    self.dataReq(cEMI)
 
             except socket.timeout:
                 pass
@@ -172,7 +361,43 @@ class UDPTransceiver(L_DataServiceBroadcast):
 
         logger.trace("UDPTransceiver._receiverLoop(): ended")
 
+    def _batchReceiverLoop(self):
+        """
+        """
+        logger.trace("UDPTransceiver._batchReceiverLoop()")
+
+        stats = self._stats
+        while self._running:
+            try:
+                inFrames = self._receiverSock.receiveBatch(self._batchSize, self._ring)
+                if not inFrames:
+                    continue
+
+                n = len(inFrames)
+                stats['batches'] += 1
+                stats['batchSizes'][n] = stats['batchSizes'].get(n, 0) + 1
+                if n > stats['maxBatch']:
+                    stats['maxBatch'] = n
+
+                cEMIs = []
+                for inFrame, (fromAddr, fromPort) in inFrames:
+                    if self._ring is None:
+                        cEMI = self._decodeFrame(inFrame, fromAddr, fromPort)
+                    else:
+                        cEMI = self._decodeFrame(inFrame.frame, fromAddr, fromPort, inFrame)
+                    if cEMI is not None:
+                        cEMIs.append(cEMI)
+                stats['frames'] += len(cEMIs)
+                self.dataReqBatch(cEMIs)
+
+            except:
+                if self._running:
+                    logger.exception("UDPTransceiver._batchReceiverLoop()")
+
+        logger.trace("UDPTransceiver._batchReceiverLoop(): ended")
+
     def dataInd(self, cEMI):
+        cEMI.keep()  # transmitted later, after ETS has processed the frame
         self._queue.add(cEMI, cEMI.priority)
 
     def _transmitterLoop(self):
@@ -186,15 +411,21 @@ class UDPTransceiver(L_DataServiceBroadcast):
                 if cEMI is None:
                     return
 
-                logger.debug("UDPTransceiver._transmitterLoop(): frame=%s" % repr(cEMI))
+                debug = HOT_PATH and logger.isEnabledFor(logging.DEBUG)
+                if debug:
+                    logger.debug("UDPTransceiver._transmitterLoop(): frame=%r", cEMI)
+
+                frame = self._encodeFrame(cEMI)
+                if debug:
+                    logger.debug("UDPTransceiver._transmitterLoop(): frame= %r", frame)
 
-                cEMIFrame = cEMI.frame
-                cEMIRawFrame = cEMIFrame.raw
-                header = KNXnetIPHeader(service=KNXnetIPHeader.ROUTING_IND, serviceLength=len(cEMIRawFrame))
-                frame = header.frame + cEMIRawFrame
-                logger.debug("UDPTransceiver._transmitterLoop(): frame= %s" % repr(frame))
+                delay = self._transmitDelay()
+                while delay and self._running:
+                    time.sleep(delay)
+                    delay = self._transmitDelay()
 
                 self._transmitterSock.transmit(frame)
+                self._stats['sent'] += 1
 
             except Exception:
                 logger.exception("UDPTransceiver._transmitterLoop()")
@@ -206,6 +437,12 @@ class UDPTransceiver(L_DataServiceBroadcast):
         """
         logger.trace("UDPTransceiver.start()")
 
+        # Create transmitter and receiver threads
+        self._receiver = threading.Thread(target=self._receiverLoop, name="UDP receiver")
+        self._receiver.setDaemon(True)
+        self._transmitter = threading.Thread(target=self._transmitterLoop, name="UDP transmitter")
+        self._transmitter.setDaemon(True)
+
         self._running = True
         self._receiver.start()
         self._transmitter.start()
@@ -216,7 +453,7 @@ class UDPTransceiver(L_DataServiceBroadcast):
         logger.trace("UDPTransceiver.stop()")
 
         self._running = False
-        self._queue.add(None,Priority('system'))
+        self._queue.add(None,Priority('system'),force=True)
         self._transmitterSock.close()
         self._receiverSock.close()
 
@@ -112,6 +112,10 @@ setup(name=config.APP_NAME,
         'testing': [
             'pytest',
             'pytest-cov',
+            'numpy',
+        ],
+        'bulk': [
+            'numpy',
         ],
       },
       scripts=["pyknyx/scripts/pyknyx-group.py",
@@ -121,6 +125,6 @@ setup(name=config.APP_NAME,
                         "blinker",
                         "six",
                         ]+py2_req,
-      tests_require=['pytest','six'],
+      tests_require=['pytest','six','numpy'],
       cmdclass = {'test': PyTest},
 )
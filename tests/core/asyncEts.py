@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+
+from pyknyx.core.asyncEts import *
+import asyncio
+import unittest
+
+# Mute logger
+from pyknyx.services.logger import logging
+logger = logging.getLogger(__name__)
+logging.getLogger("pyknyx").setLevel(logging.ERROR)
+
+
+class AsyncETSTestCase(unittest.TestCase):
+
+    def setUp(self):
+        pass
+
+    def tearDown(self):
+        pass
+
+    def test_constructor(self):
+        pass
+
+    def test_startFailure(self):
+
+        class Device(object):
+            def __init__(self, fail):
+                self.fail = fail
+
+            def start(self):
+                if self.fail:
+                    raise RuntimeError("start failed")
+
+            def stop(self):
+                pass
+
+        async def main(fail):
+            ets = AsyncETS("1.2.0", transCls=None)
+            ets._devices.update((Device(False), Device(fail)))
+            ets.start()
+            try:
+                await asyncio.sleep(0.1)
+                return ets.initReader._running
+            finally:
+                ets.stop()
+
+        self.assertTrue(asyncio.run(main(False)))
+        with self.assertLogs("pyknyx.core.asyncEts", logging.ERROR) as logs:
+            self.assertFalse(asyncio.run(main(True)))
+        self.assertEqual(len(logs.records), 1)
+        self.assertIsInstance(logs.records[0].exc_info[1], RuntimeError)
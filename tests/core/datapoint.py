@@ -26,3 +26,25 @@ class DPTestCase(unittest.TestCase):
             DP = dict(name="dp", access="outpu", dptId="1.xxx", default=0.)
             Datapoint(self, **DP)
 
+
+    def notify(self, name, oldValue, newValue):
+        self.notified = (name, oldValue, newValue)
+
+    def test_frame(self):
+        dp = Datapoint(self, name="temp", access="input", dptId="9.001", default=20.)
+        dp.frame = bytearray(b"\x0c\x1a")
+        self.assertEqual(self.notified, ("temp", 20., 21.))
+        self.assertEqual(dp.value, 21.)
+        self.assertEqual(dp.frame, (bytearray(b"\x0c\x1a"), 2))
+
+    def test_value(self):
+        dp = Datapoint(self, name="switch", access="output", dptId="1.001", default="Off")
+        self.assertEqual(dp.data, 0)
+        dp.value = "On"
+        self.assertEqual(self.notified, ("switch", "Off", "On"))
+        self.assertEqual(dp.data, 1)
+        with self.assertRaises(PKNyXValueError):
+            dp.value = "Dimmed"
+        dp = Datapoint(self, name="temp", access="input", dptId="9.001")
+        with self.assertRaises(PKNyXValueError):
+            dp.value = -300.
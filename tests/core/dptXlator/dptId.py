@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 from pyknyx.core.dptXlator.dptId import *
+import pickle
 import unittest
 
 # Mute logger
@@ -57,3 +58,24 @@ class DPTIDTestCase(unittest.TestCase):
         self.assertEqual(self.dptId.isGeneric(), False)
         self.assertEqual(self.dptId1.isGeneric(), True)
 
+
+    def test_intern(self):
+        self.assertIs(self.dptId6, self.dptId7)
+        self.assertIs(DPTID(self.dptId6), self.dptId6)
+        self.assertIs(self.dptId6.generic, self.dptId5)
+        self.assertIs(self.dptId5.generic, self.dptId5)
+        self.assertEqual(hash(DPTID("9.1")), hash(self.dptId6))
+        self.assertIs(pickle.loads(pickle.dumps(self.dptId)), self.dptId)
+        self.assertNotEqual(self.dptId, "9.003")
+        with self.assertRaises(DPTIDValueError):
+            DPTID(9)
+
+    def test_oldPickle(self):
+        for data in (b'\x80\x02cpyknyx.core.dptXlator.dptId\nDPTID\nq\x00)\x81q\x01}q\x02'
+                     b'X\x03\x00\x00\x00_idq\x03X\x05\x00\x00\x009.001q\x04sb.',
+                     b'ccopy_reg\n_reconstructor\np0\n(cpyknyx.core.dptXlator.dptId\nDPTID\np1\n'
+                     b'c__builtin__\nobject\np2\nNtp3\nRp4\n(dp5\nV_id\np6\nV9.001\np7\nsb.'):
+            dptId = pickle.loads(data)
+            self.assertEqual(dptId, DPTID("9.001"))
+            self.assertIs(dptId.generic, DPTID("9.xxx"))
+        self.assertEqual(DPTID("1.xxx").id, "1.xxx")
@@ -59,3 +59,16 @@ class DPTXlator2ByteFloatTestCase(unittest.TestCase):
             self.assertEqual(data_, data, "Conversion failed (converted data for %r is %s, should be %s)" %
                                 (frame, hex(data_), hex(data)))
 
+    def test_tables(self):
+        table = self.dptXlator.decodeTable
+        self.assertEqual(len(table), 0x10000)
+        self.assertEqual(table, tuple(self.dptXlator.dataToValue(data) for data in range(0x10000)))
+        self.assertIs(DPTXlator2ByteFloat("9.001").decodeTable, table)
+        self.assertIsNone(self.dptXlator.encodeTable)
+        for value, data, frame in self.testTable:
+            self.assertEqual(self.dptXlator.lookupValue(data), value)
+            self.assertEqual(self.dptXlator.lookupData(value), data)
+        with self.assertRaises(DPTXlatorValueError):
+            self.dptXlator.lookupValue(0x10000)
+        with self.assertRaises(DPTXlatorValueError):
+            self.dptXlator.lookupData(-671088.65)
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 from pyknyx.core.dptXlator.dptXlator8BitEncAbsValue import *
+from pyknyx.core.dptXlator.dptXlatorBase import INVALID
 from pyknyx.core.dptXlator.dptXlatorBoolean import DPTXlatorBoolean
 import unittest
 
@@ -55,3 +56,12 @@ class DPT8BitUnsignedTestCase(unittest.TestCase):
             data_ = self.dptXlator.frameToData(frame)
             self.assertEqual(data_, data, "Conversion failed (converted data for %r is %s, should be %s)" %
                                 (frame, hex(data_), hex(data)))
+
+    def test_tables(self):
+        self.dptXlator.dpt = "20.003"
+        self.assertEqual(self.dptXlator.decodeTable[:3], ("occupied", "standby", "not occupied"))
+        self.assertIs(self.dptXlator.decodeTable[3], INVALID)
+        self.assertEqual(self.dptXlator.encodeTable, {"occupied": 0, "standby": 1, "not occupied": 2})
+        self.assertEqual(self.dptXlator.lookupValue(2), "not occupied")
+        with self.assertRaises(IndexError):
+            self.dptXlator.lookupValue(3)
@@ -1,13 +1,53 @@
 # -*- coding: utf-8 -*-
 
 from pyknyx.core.dptXlator.dptXlatorBase import *
+from pyknyx.core.dptXlator.dptXlatorBoolean import DPTXlatorBoolean
+from pyknyx.core.dptXlator.dptXlator3BitControl import DPTXlator3BitControl
+from pyknyx.core.dptXlator.dptXlator8BitUnsigned import DPTXlator8BitUnsigned
+from pyknyx.core.dptXlator.dptXlator8BitSigned import DPTXlator8BitSigned
+from pyknyx.core.dptXlator.dptXlator2ByteUnsigned import DPTXlator2ByteUnsigned
+from pyknyx.core.dptXlator.dptXlator2ByteSigned import DPTXlator2ByteSigned
+from pyknyx.core.dptXlator.dptXlator2ByteFloat import DPTXlator2ByteFloat
+from pyknyx.core.dptXlator.dptXlatorTime import DPTXlatorTime
+from pyknyx.core.dptXlator.dptXlatorDate import DPTXlatorDate
+from pyknyx.core.dptXlator.dptXlator4ByteUnsigned import DPTXlator4ByteUnsigned
+from pyknyx.core.dptXlator.dptXlator4ByteSigned import DPTXlator4ByteSigned
+from pyknyx.core.dptXlator.dptXlator4ByteFloat import DPTXlator4ByteFloat
+from pyknyx.core.dptXlator.dptXlatorScene import DPTXlatorScene
+import random
 import unittest
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 # Mute logger
 from pyknyx.services.logger import logging
 logger = logging.getLogger(__name__)
 logging.getLogger("pyknyx").setLevel(logging.ERROR)
 
+# Xlators with vectorized bulk conversions, with the DPTs and the KNX encoded data to check them on
+RANDOM_32 = [random.getrandbits(32) for i in range(10000)]
+BULK_TABLE = (
+    (DPTXlatorBoolean, ("1.xxx", "1.002"), range(0x2)),
+    (DPTXlator3BitControl, ("3.xxx",), range(0x10)),
+    (DPTXlator8BitUnsigned, ("5.xxx", "5.001", "5.003", "5.005"), range(0x100)),
+    (DPTXlator8BitSigned, ("6.xxx",), range(0x100)),
+    (DPTXlator2ByteUnsigned, ("7.xxx", "7.003", "7.004"), range(0x10000)),
+    (DPTXlator2ByteSigned, ("8.xxx", "8.003", "8.004", "8.010"), range(0x10000)),
+    (DPTXlator2ByteFloat, ("9.xxx",), range(0x10000)),
+    (DPTXlatorTime, ("10.001",), range(0x20000)),
+    (DPTXlatorDate, ("11.001",), range(0x20000)),
+    (DPTXlator4ByteUnsigned, ("12.xxx",), RANDOM_32),
+    (DPTXlator4ByteSigned, ("13.xxx", "13.001"), RANDOM_32),
+    (DPTXlator4ByteFloat, ("14.xxx",), RANDOM_32),
+    (DPTXlatorScene, ("17.001",), range(0x100)),
+)
+
+# DPTs whose negative (scaled) values can't be converted back to data, by valueToData() as well
+UNSIGNED_VALUE_TO_DATA = ("8.003", "8.004", "8.010", "13.001")
+
 
 class DPTXlatorBaseTestCase(unittest.TestCase):
 
@@ -23,3 +63,41 @@ class DPTXlatorBaseTestCase(unittest.TestCase):
     def test_constructor(self):
         with self.assertRaises(DPTXlatorValueError):
             DPTXlatorBase("1.001", 0)
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_frameArray(self):
+        dptXlator = DPTXlator2ByteUnsigned("7.xxx")
+        self.assertEqual(dptXlator.frameToDataArray(b"\x12\x34\x56\x78").tolist(), [0x1234, 0x5678])
+        self.assertEqual(dptXlator.frameToDataArray(b"\x12\x34\xaa\x56\x78", stride=3).tolist(), [0x1234, 0x5678])
+        self.assertEqual(dptXlator.frameToDataArray(b"\x12\x34\xaa\x56\x78\xaa", stride=3).tolist(), [0x1234, 0x5678])
+        self.assertEqual(dptXlator.frameToDataArray(b"").tolist(), [])
+        with self.assertRaises(DPTXlatorValueError):
+            dptXlator.frameToDataArray(b"\x00")
+        with self.assertRaises(DPTXlatorValueError):
+            dptXlator.frameToDataArray(b"\x12\x34\x56")
+        with self.assertRaises(DPTXlatorValueError):
+            dptXlator.frameToDataArray(b"\x12\x34\xaa\x56", stride=3)
+        with self.assertRaises(DPTXlatorValueError):
+            dptXlator.frameToDataArray(b"\x12\x34", stride=1)
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_bulk(self):
+        """ Check the vectorized conversions give the same results as the scalar ones
+        """
+        for cls, dptIds, data in BULK_TABLE:
+            for dptId in dptIds:
+                with self.subTest(dptId=dptId):
+                    dptXlator = cls(dptId)
+                    data = list(data)
+                    frames = b"".join(bytes(dptXlator.dataToFrame(data_)) for data_ in data)
+                    self.assertEqual(dptXlator.frameToDataArray(frames).tolist(), data)
+                    self.assertEqual(dptXlator.dataToFrameArray(data), frames)
+
+                    values = dptXlator.dataToValueArray(data)
+                    values_ = numpy.array([dptXlator.dataToValue(data_) for data_ in data])
+                    self.assertEqual(values.dtype, values_.dtype)
+                    self.assertEqual(values.tobytes(), values_.tobytes())
+                    if dptId in UNSIGNED_VALUE_TO_DATA:
+                        values = values[values >= 0]
+                    self.assertEqual(dptXlator.valueToDataArray(values).tolist(),
+                                     [dptXlator.valueToData(value) for value in values.tolist()])
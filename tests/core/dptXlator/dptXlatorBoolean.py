@@ -58,3 +58,14 @@ class DPTBooleanTestCase(unittest.TestCase):
             data_ = self.dptXlator.frameToData(frame)
             self.assertEqual(data_, data, "Conversion failed (converted data for %r is %s, should be %s)" %
                                 (frame, hex(data_), hex(data)))
+
+    def test_tables(self):
+        self.dptXlator.dpt = "1.001"
+        self.assertEqual(self.dptXlator.decodeTable, ("Off", "On"))
+        self.assertEqual(self.dptXlator.encodeTable, {"Off": 0, "On": 1})
+        self.assertEqual(self.dptXlator.lookupValue(1), "On")
+        self.assertEqual(self.dptXlator.lookupData("Off"), 0)
+        with self.assertRaises(DPTXlatorValueError):
+            self.dptXlator.lookupValue(2)
+        with self.assertRaises(DPTXlatorValueError):
+            self.dptXlator.lookupData("Dimmed")
@@ -1,6 +1,12 @@
 # -*- coding: utf-8 -*-
 
 from pyknyx.core.ets import *
+from pyknyx.core.groupListener import GroupListener
+from pyknyx.core.groupMonitorListener import GroupMonitorListener
+from pyknyx.stack.cemi.cemiLData import CEMILData
+from pyknyx.stack.stack import Stack
+from pyknyx.stack.layer2.l_dataServiceBase import L_DataServiceBroadcast
+import time
 import unittest
 
 # Mute logger
@@ -20,3 +26,170 @@ class ETSTestCase(unittest.TestCase):
     def test_constructor(self):
         pass
 
+
+    def test_groupIndex(self):
+        class Source(object):
+            hop = False
+
+        ets = ETS("1.2.0", transCls=None)
+        stacks = [Stack(ets, "1.2.%d" % i) for i in range(3, 6)]
+        stacks[0].agds.subscribe("1/1/1", GroupListener())
+        stacks[2].agds.subscribe("0/0/0", GroupMonitorListener())
+        received = []
+        for stack in stacks:
+            stack._lds.dataInd = lambda cEMI, stack=stack: received.append(stack)
+
+        ets.processFrame(Source(), CEMILData(b")\x00\xbc\xd0\x11\x0e\x09\x01\x01\x00\x80"))  # 1/1/1
+        self.assertEqual(sorted(received, key=stacks.index), [stacks[0], stacks[2]])
+        del received[:]
+        ets.processFrame(Source(), CEMILData(b")\x00\xbc\xd0\x11\x0e\x09\x02\x01\x00\x80"))  # 1/1/2
+        self.assertEqual(received, [stacks[2]])
+
+    def test_addrTable(self):
+        class Bus(L_DataServiceBroadcast):
+            def dataInd(self, cEMI):
+                self.received.append(cEMI.destinationAddress.address)
+
+        ets = ETS("1.2.0", transCls=None, addrTableSize=2, addrTableAge=0.1)
+        bus1 = Bus(ets, "1.0.1")
+        bus2 = Bus(ets, "1.0.2")
+        bus3 = Bus(ets, "1.0.3")
+        for bus in (bus1, bus2, bus3):
+            bus.received = []
+
+        def frame(src, dest):
+            cEMI = CEMILData()
+            cEMI.messageCode = CEMILData.MC_LDATA_IND
+            cEMI.sourceAddress = src
+            cEMI.destinationAddress = IndividualAddress(dest)
+            cEMI.hopCount = 6
+            return cEMI
+
+        ets.processFrame(bus1, frame("1.1.1", "1.1.2"))  # unknown: flooded
+        self.assertEqual((bus2.received, bus3.received), (["1.1.2"], ["1.1.2"]))
+        ets.processFrame(bus2, frame("1.1.2", "1.1.1"))
+        self.assertEqual((bus1.received, bus3.received), (["1.1.1"], ["1.1.2"]))
+        ets.processFrame(bus1, frame("1.1.1", "1.1.2"))
+        self.assertEqual((bus2.received, bus3.received), (["1.1.2", "1.1.2"], ["1.1.2"]))
+        ets.processFrame(bus1, frame("1.1.3", "1.1.1"))  # same segment; evicts 1.1.2
+        self.assertEqual(bus1.received, ["1.1.1"])
+        ets.processFrame(bus1, frame("1.1.1", "1.1.2"))
+        self.assertEqual(bus3.received, ["1.1.2", "1.1.2"])
+        time.sleep(0.2)
+        ets.processFrame(bus3, frame("1.1.4", "1.1.3"))  # expired
+        self.assertEqual((bus1.received, bus2.received), (["1.1.1", "1.1.3"], ["1.1.2", "1.1.2", "1.1.2", "1.1.3"]))
+
+    def test_queueCapacity(self):
+        ets = ETS("1.2.0", transCls=None, queueCapacity=1)
+        bus = L_DataServiceBroadcast(ets, "1.0.1")
+        for i in range(3):
+            ets.putFrame(bus, CEMILData(b")\x00\xbc\xd0\x11\x0e\x09\x01\x01\x00\x80"))
+        self.assertEqual(ets.queueStats, dict(depth=[0, 0, 0, 1], highWater=[0, 0, 0, 1], dropped=[0, 0, 0, 2]))
+
+        # A frame sent from the ETS thread (here, the thread which took frames from the queue) is not blocked
+        ets = ETS("1.2.0", transCls=None, queueCapacity=1, queuePolicy="block", queueTimeout=5)
+        bus = L_DataServiceBroadcast(ets, "1.0.1")
+        ets._queue.removeBatch(1, timeout=0)
+        start = time.time()
+        for i in range(2):
+            ets.putFrame(bus, CEMILData(b")\x00\xbc\xd0\x11\x0e\x09\x01\x01\x00\x80"))
+        self.assertLess(time.time() - start, 1)
+        self.assertEqual(ets.queueStats["dropped"], [0, 0, 0, 1])
+
+    def test_stopRelease(self):
+        released = []
+
+        class Frame(object):
+            def __init__(self, name):
+                self.name = name
+
+            def release(self):
+                released.append(self.name)
+
+        ets = ETS("1.2.0", transCls=None)
+        for i in range(ETS.BATCH_SIZE + 2):
+            ets._queue.add((None, Frame(i)), Priority('low'))
+        ets._queue.add(None, Priority('system'), force=True)
+        ets.run()  # stops at once
+        ets.stop()
+        self.assertEqual(sorted(released), list(range(ETS.BATCH_SIZE + 2)))
+        self.assertEqual(len(ets._queue), 1)  # the None of stop()
+
+    def test_localDelivery(self):
+        def frame(ctrl, gad):
+            return CEMILData(bytes(bytearray((0x29, 0x00, ctrl, 0xd0, 0x11, 0x0e, 0x09, gad, 0x01, 0x00, 0x80))))
+
+        ets = ETS("1.2.0", transCls=None, localDelivery=True)
+        stacks = [Stack(ets, "1.2.%d" % i) for i in range(3, 6)]
+        for stack in stacks:
+            stack.agds.subscribe("1/1/1", GroupListener())
+        stacks[2].agds.subscribe("1/1/2", GroupListener())
+        stacks[2].agds.subscribe("1/1/3", GroupListener())
+        received = []
+
+        def dataInd(cEMI, stack):
+            received.append((stacks.index(stack), cEMI.destinationAddress.address))
+            if cEMI.destinationAddress.address == "1/1/1" and stack is stacks[1]:
+                stack._lds.dataReq(frame(0xbc, 2))  # low
+                stack._lds.dataReq(frame(0xb0, 3))  # system
+        for stack in stacks:
+            stack._lds.dataInd = lambda cEMI, stack=stack: dataInd(cEMI, stack)
+
+        stacks[0]._lds.dataReq(frame(0xbc, 1))
+        self.assertEqual(sorted(received[:2]), [(1, "1/1/1"), (2, "1/1/1")])
+        self.assertEqual(received[2:], [(2, "1/1/3"), (2, "1/1/2")])
+        self.assertEqual(len(ets._queue), 0)
+
+        # Other transports still get the frames, through the queue; stacks are not served twice
+        bus = L_DataServiceBroadcast(ets, "1.0.1")
+        bus.dataInd = lambda cEMI: received.append((bus, cEMI.destinationAddress.address))
+        del received[:]
+        seq = ets.groupState.lastSeq
+        stacks[0]._lds.dataReq(frame(0xbc, 2))
+        self.assertEqual(received, [(2, "1/1/2")])
+        self.assertEqual(ets.groupState.lastSeq, seq + 1)
+        self.assertEqual(len(ets._queue), 1)
+        ets.processFrame(*ets._queue.remove())
+        self.assertEqual(received, [(2, "1/1/2"), (bus, "1/1/2")])
+
+        # The frame is fed once to the group state
+        self.assertEqual(ets.groupState.lastSeq, seq + 1)
+        self.assertEqual([gad.address for seq, gad, src, data, timestamp in ets.groupState.changes(seq)],
+                         ["1/1/2"])
+
+    def test_addAddr(self):
+        bus = L_DataServiceBroadcast(ETS("1.2.0", transCls=None), "1.0.1")
+        bus.addAddr(IndividualAddress("1.1.1"))
+        cEMI = CEMILData()
+        cEMI.destinationAddress = IndividualAddress("1.1.1")
+        self.assertTrue(bus.wantsIndividualFrame(cEMI))
+
+    def test_wildcardLink(self):
+        from pyknyx.api import Device, FunctionalBlock
+
+        class ContactsFB(FunctionalBlock):
+            DP_01 = dict(name="contact", dptId="1.019", default="Closed", access="input")
+            DP_02 = dict(name="status", dptId="1.019", default="Closed", access="output")
+            GO_01 = dict(dp="contact", flags="CWU", priority="low")
+            GO_02 = dict(dp="status", flags="CRT", priority="low")
+
+        class Contacts(Device):
+            FB_01 = dict(cls=ContactsFB, name="contacts_fb", desc="window contacts")
+
+            LNK_01 = dict(fb="contacts_fb", dp="contact", gad="4/1/*")
+            LNK_02 = dict(fb="contacts_fb", dp="status", gad="4/2/*")
+            LNK_03 = dict(fb="contacts_fb", dp="status", gad="4/2/1")
+
+        ets = ETS("1.2.0", transCls=None)
+        device = Contacts(ets, "1.2.3")
+        fb = device.fb["contacts_fb"]
+        self.assertIsNone(fb.go["contact"].group)
+        self.assertEqual(fb.go["status"].group.gad, GroupAddress("4/2/1"))
+
+        class Source(object):
+            hop = False
+
+        ets.processFrame(Source(), CEMILData(b")\x00\xbc\xe0\x11\x0e\x21\x07\x01\x00\x81"))  # write 1 to 4/1/7
+        self.assertEqual(fb.dp["contact"].value, "Open")
+        ets.processFrame(Source(), CEMILData(b")\x00\xbc\xe0\x11\x0e\x21\x10\x01\x00\x80"))  # write 0 to 4/1/16
+        self.assertEqual(fb.dp["contact"].value, "Closed")
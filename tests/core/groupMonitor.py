@@ -2,6 +2,11 @@
 
 from pyknyx.core.groupMonitor import *
 from pyknyx.core.group import Group
+from pyknyx.core.groupMonitorFilter import GroupMonitorFilter
+from pyknyx.core.groupMonitorListener import GroupMonitorListener
+from pyknyx.stack.groupAddress import GroupAddress
+from pyknyx.stack.individualAddress import IndividualAddress
+from pyknyx.stack.priority import Priority
 import unittest
 
 # Mute logger
@@ -25,3 +30,39 @@ class GroupMonitorTestCase(unittest.TestCase):
     def test_constructor(self):
         pass
 
+
+    def test_filter(self):
+        received = []
+
+        class Listener(GroupMonitorListener):
+            def __init__(self, name):
+                super(Listener, self).__init__()
+                self.name = name
+
+            def onWrite(self, src, gad, priority, data):
+                received.append((self.name, "write", gad.address))
+
+            def onRead(self, src, gad, priority):
+                received.append((self.name, "read", gad.address))
+
+        monitor = GroupMonitor(None)
+        self.assertEqual(monitor.gadBits, bytearray(8192))
+        monitor.addListener(Listener("main 1"), GroupMonitorFilter(main=1))
+        monitor.addListener(Listener("1/2/3 reads"), GroupMonitorFilter(gads=("1/2/3", "2/2/3"),
+                                                                        apci=(APCI.GROUPVALUE_READ,)))
+        bits = monitor.gadBits
+        for gad, wanted in (("1/0/0", True), ("1/7/255", True), ("2/2/3", True), ("2/2/4", False), ("0/7/255", False)):
+            raw = GroupAddress(gad).raw
+            self.assertEqual(bool(bits[raw >> 3] & 1 << (raw & 7)), wanted, gad)
+
+        src = IndividualAddress("1.1.1")
+        priority = Priority("low")
+        monitor.groupValueWriteInd(src, GroupAddress("1/2/3"), priority, b"\x01")
+        monitor.groupValueReadInd(src, GroupAddress("1/2/3"), priority)
+        monitor.groupValueReadInd(src, GroupAddress("2/2/3"), priority)
+        monitor.groupValueWriteInd(src, GroupAddress("2/2/3"), priority, b"\x01")
+        self.assertEqual(sorted(received), [("1/2/3 reads", "read", "1/2/3"), ("1/2/3 reads", "read", "2/2/3"),
+                                            ("main 1", "read", "1/2/3"), ("main 1", "write", "1/2/3")])
+
+        monitor.addListener(Listener("all"))
+        self.assertIsNone(monitor.gadBits)
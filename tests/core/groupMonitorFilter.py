@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+
+from pyknyx.core.groupMonitorFilter import *
+import unittest
+
+# Mute logger
+from pyknyx.services.logger import logging
+logger = logging.getLogger(__name__)
+logging.getLogger("pyknyx").setLevel(logging.ERROR)
+
+
+class GroupMonitorFilterTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.src = IndividualAddress("1.1.1")
+
+    def tearDown(self):
+        pass
+
+    def test_constructor(self):
+        for kwargs in (dict(middle=1), dict(main=32), dict(main=(2, 1)), dict(main=1, middle=8), dict(gads=("foo",)),
+                       dict(src=("1.1.2", "1.1.1")), dict(src="foo"), dict(apci=()), dict(apci=(0x0100,))):
+            with self.assertRaises(GroupMonitorFilterValueError):
+                GroupMonitorFilter(**kwargs)
+
+    def test_gads(self):
+        f = GroupMonitorFilter()
+        self.assertIsNone(f.gadBits)
+        self.assertEqual(len(f), 0x10000)
+
+        f = GroupMonitorFilter(main=4)
+        self.assertEqual(len(f), 2048)
+        self.assertTrue(f.match(self.src, GroupAddress("4/0/0"), APCI.GROUPVALUE_WRITE))
+        self.assertTrue(f.match(self.src, GroupAddress("4/7/255"), APCI.GROUPVALUE_WRITE))
+        self.assertFalse(f.match(self.src, GroupAddress("3/7/255"), APCI.GROUPVALUE_WRITE))
+        self.assertFalse(f.match(self.src, GroupAddress("5/0/0"), APCI.GROUPVALUE_WRITE))
+
+        f = GroupMonitorFilter(main=(1, 2), middle=(3, 4), gads=("6/0/1", GroupAddress("6/0/3")))
+        self.assertEqual(len(f), 2 * 2 * 256 + 2)
+        for gad in ("1/3/0", "1/4/255", "2/3/17", "2/4/255", "6/0/1", "6/0/3"):
+            self.assertTrue(f.match(self.src, GroupAddress(gad), APCI.GROUPVALUE_WRITE), gad)
+        for gad in ("1/2/255", "1/5/0", "0/3/0", "3/3/0", "6/0/2"):
+            self.assertFalse(f.match(self.src, GroupAddress(gad), APCI.GROUPVALUE_WRITE), gad)
+
+    def test_src(self):
+        f = GroupMonitorFilter(src=("1.1.10", "1.1.20"))
+        gad = GroupAddress("1/1/1")
+        self.assertTrue(f.match(IndividualAddress("1.1.10"), gad, APCI.GROUPVALUE_WRITE))
+        self.assertTrue(f.match(IndividualAddress("1.1.20"), gad, APCI.GROUPVALUE_WRITE))
+        self.assertFalse(f.match(IndividualAddress("1.1.9"), gad, APCI.GROUPVALUE_WRITE))
+        self.assertFalse(f.match(IndividualAddress("1.1.21"), gad, APCI.GROUPVALUE_WRITE))
+
+        f = GroupMonitorFilter(src="1.1.10")
+        self.assertTrue(f.match(IndividualAddress("1.1.10"), gad, APCI.GROUPVALUE_WRITE))
+        self.assertFalse(f.match(IndividualAddress("1.1.11"), gad, APCI.GROUPVALUE_WRITE))
+
+    def test_apci(self):
+        f = GroupMonitorFilter(apci=(APCI.GROUPVALUE_WRITE, APCI.GROUPVALUE_RES))
+        gad = GroupAddress("1/1/1")
+        self.assertTrue(f.match(self.src, gad, APCI.GROUPVALUE_WRITE))
+        self.assertTrue(f.match(self.src, gad, APCI.GROUPVALUE_RES))
+        self.assertFalse(f.match(self.src, gad, APCI.GROUPVALUE_READ))
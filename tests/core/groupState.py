@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+
+from pyknyx.core.groupState import *
+from pyknyx.core.ets import ETS
+from pyknyx.stack.groupAddress import GroupAddress
+from pyknyx.stack.individualAddress import IndividualAddress
+from fakes import FakeClock, groupFrame
+import unittest
+
+# Mute logger
+from pyknyx.services.logger import logging
+logger = logging.getLogger(__name__)
+logging.getLogger("pyknyx").setLevel(logging.ERROR)
+
+
+class GroupStateTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.state = GroupState(logSize=4, clock=self.clock)
+
+    def tearDown(self):
+        pass
+
+    def test_constructor(self):
+        with self.assertRaises(GroupStateValueError):
+            GroupState(logSize=0)
+        self.assertEqual(len(self.state), 0)
+        self.assertEqual(self.state.lastSeq, 0)
+
+    def test_frameInd(self):
+        self.state.frameInd(groupFrame("1/1/1", 0x81))  # write
+        self.clock.now += 1.
+        self.state.frameInd(groupFrame("1/1/2", 0x40, b"\x12\x34"))  # response
+        self.state.frameInd(groupFrame("1/1/3", 0x00))  # read
+        self.assertEqual(self.state.get("1/1/1"),
+                         (1, GroupAddress("1/1/1"), IndividualAddress("1.1.14"), b"\x01", 100.))
+        self.assertEqual(self.state.get(GroupAddress("1/1/2").raw),
+                         (2, GroupAddress("1/1/2"), IndividualAddress("1.1.14"), b"\x12\x34", 101.))
+        self.assertIsNone(self.state.get("1/1/3"))
+        self.assertEqual(len(self.state), 2)
+        self.assertEqual(self.state.lastSeq, 2)
+
+    def test_changes(self):
+        for i in range(3):
+            self.state.update(i, 0x1101, bytes((i,)))
+        self.state.update(0, 0x1102, b"\x10")
+        self.assertEqual([(seq, gad.raw, data) for seq, gad, src, data, timestamp in self.state.changes()],
+                         [(2, 1, b"\x01"), (3, 2, b"\x02"), (4, 0, b"\x10")])
+        self.assertEqual([seq for seq, gad, src, data, timestamp in self.state.changes(2)], [3, 4])
+        self.assertEqual(list(self.state.changes(4)), [])
+
+        # Older than the log: the whole table is scanned
+        for i in range(3, 8):
+            self.state.update(i, 0x1101, bytes((i,)))
+        self.assertEqual([(seq, gad.raw) for seq, gad, src, data, timestamp in self.state.changes(3)],
+                         [(4, 0), (5, 3), (6, 4), (7, 5), (8, 6), (9, 7)])
+        self.assertEqual(len(list(self.state.changes())), 8)
+
+    def test_changesConcurrent(self):
+        for i in range(3):
+            self.state.update(i, 0x1101, bytes((i,)))
+        state = self.state
+
+        class Log(object):
+            """ Log updating group address 0 (as the ETS thread would) when the scan starts
+            """
+            def __init__(self, log):
+                self.log = log
+                self.updated = False
+
+            def __getitem__(self, index):
+                if not self.updated:
+                    self.updated = True
+                    state._log = self.log
+                    state.update(0, 0x1102, b"\x10")
+                return self.log[index]
+
+        self.state._log = Log(self.state._log)
+        changes = self.state.changes()
+        self.assertEqual([(seq, gad.raw, data) for seq, gad, src, data, timestamp in changes],
+                         [(2, 1, b"\x01"), (3, 2, b"\x02"), (4, 0, b"\x10")])
+
+        # Updated between the scan and the yield: given with the new value
+        changes = self.state.changes(2)
+        self.assertEqual(next(changes)[0], 3)
+        self.state.update(0, 0x1102, b"\x11")
+        self.assertEqual([(seq, gad.raw, data) for seq, gad, src, data, timestamp in changes], [(5, 0, b"\x11")])
+        self.assertEqual(list(self.state.changes(self.state.lastSeq)), [])
+
+    def test_ets(self):
+
+        class Source(object):
+            hop = False
+
+        ets = ETS("1.2.0", transCls=None, groupStateParams=dict(logSize=16))
+        ets.processFrame(Source(), groupFrame("1/1/1", 0x81))
+        self.assertEqual(ets.groupState.get("1/1/1")[3], b"\x01")
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+
+from pyknyx.core.initReader import *
+from pyknyx.core.ets import ETS
+from pyknyx.stack.groupAddress import GroupAddress
+from fakes import FakeClock, groupFrame
+import threading
+import unittest
+
+# Mute logger
+from pyknyx.services.logger import logging
+logger = logging.getLogger(__name__)
+logging.getLogger("pyknyx").setLevel(logging.ERROR)
+
+
+class FakeGroup(object):
+    def __init__(self, gad, reads):
+        self.gad = GroupAddress(gad)
+        self._reads = reads
+
+    def read(self, priority):
+        self._reads.append(self.gad.address)
+
+
+class InitReaderTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.reads = []
+        self.reader = InitReader(rate=4, window=2, timeout=1., retries=2, backoff=1., clock=self.clock)
+
+    def tearDown(self):
+        pass
+
+    def test_constructor(self):
+        with self.assertRaises(InitReaderValueError):
+            InitReader(window=0)
+        with self.assertRaises(InitReaderValueError):
+            InitReader(timeout=0)
+
+    def test_pacing(self):
+        for gad in ("1/1/1", "1/1/2", "1/1/1", "1/1/3"):
+            self.reader.add(FakeGroup(gad, self.reads))
+        self.assertEqual(self.reader._step(self.clock.now), 0.25)
+        self.assertEqual(self.reads, ["1/1/1"])
+        self.clock.now += 0.25
+        self.reader._step(self.clock.now)
+        self.clock.now += 0.25
+        self.reader._step(self.clock.now)
+        self.assertEqual(self.reads, ["1/1/1", "1/1/2"])  # window full
+        self.reader.frameInd(groupFrame("1/1/1", 0x00))  # read: not an answer
+        self.reader.frameInd(groupFrame("1/1/1", 0x40))
+        self.reader._step(self.clock.now)
+        self.assertEqual(self.reads, ["1/1/1", "1/1/2", "1/1/3"])
+        self.reader.frameInd(groupFrame("1/1/2", 0x80))
+        self.reader.frameInd(groupFrame("1/1/3", 0x40))
+        self.assertEqual(self.reader._step(self.clock.now), None)
+        self.assertTrue(self.reader.complete)
+        self.assertEqual([gad.address for gad in self.reader.answered], ["1/1/1", "1/1/2", "1/1/3"])
+
+    def test_retries(self):
+        self.reader.add(FakeGroup("1/1/1", self.reads))
+        self.reader._step(self.clock.now)
+        for delay in (1., 1., 1., 2.):  # timeout, backoff, timeout, backoff
+            self.clock.now += delay
+            self.reader._step(self.clock.now)
+        self.assertEqual(len(self.reads), 3)
+        self.assertFalse(self.reader.complete)
+        self.clock.now += 1.
+        self.assertEqual(self.reader._step(self.clock.now), None)
+        self.assertTrue(self.reader.complete)
+        self.assertEqual([gad.address for gad in self.reader.failed], ["1/1/1"])
+        self.assertEqual(self.reader.stats, dict(pending=0, inFlight=0, answered=0, failed=1))
+
+    def test_answerInd(self):
+        reads = []
+
+        class CachedGroup(FakeGroup):
+            def read(self, priority):
+                FakeGroup.read(self, priority)
+                reader.answerInd(self.gad.raw)  # answered from the cache, from within read()
+
+        reader = self.reader
+        reader.add(CachedGroup("1/1/1", reads))
+        reader._step(self.clock.now)
+        self.assertEqual(reads, ["1/1/1"])
+        self.assertTrue(reader.complete)
+        self.assertEqual(reader.stats, dict(pending=0, inFlight=0, answered=1, failed=0))
+
+    def test_readUnlocked(self):
+        class ThreadedGroup(FakeGroup):
+            def read(self, priority):
+                FakeGroup.read(self, priority)
+                thread = threading.Thread(target=reader.answerInd, args=(self.gad.raw,))  # answered by ETS thread
+                thread.start()
+                thread.join(1.)
+                self.blocked = thread.is_alive()
+
+        reader = InitReader(rate=100)
+        group = ThreadedGroup("1/1/1", self.reads)
+        reader.add(group)
+        reader.start()
+        try:
+            self.assertTrue(reader.wait(2))
+        finally:
+            reader.stop()
+            reader.join(2)
+        self.assertFalse(group.blocked)
+
+    def test_ets(self):
+        class Bus(object):
+            hop = local = False
+
+        class AnsweredGroup(FakeGroup):
+            def read(self, priority):
+                FakeGroup.read(self, priority)
+                ets.processFrame(Bus(), groupFrame(self.gad.address, 0x40))
+
+        ets = ETS("1.2.0", transCls=None, initReadParams=dict(rate=100))
+        ets.initRead(AnsweredGroup("1/1/1", self.reads))
+        self.assertFalse(ets.initReader.complete)
+        ets.start()
+        try:
+            self.assertTrue(ets.initReader.wait(2))
+            self.assertEqual(self.reads, ["1/1/1"])
+        finally:
+            ets.stop()
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+
+from pyknyx.core.wildcardGroup import *
+from pyknyx.core.groupListener import GroupListener
+from pyknyx.stack.groupAddress import GroupAddress
+from pyknyx.stack.individualAddress import IndividualAddress
+from pyknyx.stack.priority import Priority
+import unittest
+
+# Mute logger
+from pyknyx.services.logger import logging
+logger = logging.getLogger(__name__)
+logging.getLogger("pyknyx").setLevel(logging.ERROR)
+
+
+class WildcardGroupTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.group = WildcardGroup("4/1/*", None)
+
+    def tearDown(self):
+        pass
+
+    def test_display(self):
+        assert repr(self.group) == "<WildcardGroup(pattern='4/1/*')>"
+        assert str(self.group) == "<WildcardGroup('4/1/*')>"
+
+    def test_constructor(self):
+        with self.assertRaises(PKNyXValueError):
+            WildcardGroup("4/1/1-", None)
+
+    def test_dispatch(self):
+        received = []
+
+        class Listener(GroupListener):
+            def onWrite(self, src, data, gad=None):
+                received.append(("write", src, data, gad))
+
+            def onRead(self, src, gad=None):
+                received.append(("read", src, gad))
+
+            def onResponse(self, src, data, gad=None):
+                received.append(("response", src, data, gad))
+
+        self.group.addListener(Listener())
+        src = IndividualAddress("1.1.1")
+        gad = GroupAddress("4/1/7")
+        self.group.groupValueWriteInd(src, gad, Priority("low"), b"\x01")
+        self.group.groupValueReadInd(src, gad, Priority("low"))
+        self.group.groupValueReadCon(src, gad, Priority("low"), b"\x00")
+        self.assertEqual(received, [("write", src, b"\x01", gad), ("read", src, gad), ("response", src, b"\x00", gad)])
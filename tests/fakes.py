@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+
+""" Helpers shared by the tests
+"""
+
+from pyknyx.stack.cemi.cemiLData import CEMILData
+from pyknyx.stack.groupAddress import GroupAddress
+
+
+def groupFrame(gad, apci, data=b""):
+    """ Build a L_Data.ind group frame sent by 1.1.14
+
+    @param gad: destination group address
+    @type gad: str or int
+
+    @param apci: low byte of the APCI (with the 6 bits value of small data)
+    @type apci: int
+
+    @param data: data following the APCI
+    @type data: bytes
+    """
+    gad = GroupAddress(gad).raw
+    return CEMILData(bytes(bytearray((0x29, 0x00, 0xbc, 0xd0, 0x11, 0x0e, gad >> 8, gad & 0xff, 1 + len(data), 0x00,
+                                      apci))) + data)
+
+
+class FakeClock(object):
+    """ Time source set by the test
+
+    @ivar now: current time
+    @type now: float
+    """
+    def __init__(self, now=100.):
+        self.now = now
+
+    def __call__(self):
+        return self.now
@@ -5,6 +5,8 @@ from pprint import pprint
 
 from pyknyx.api import Device, FunctionalBlock, notify
 from pyknyx.core.ets import ETS
+from pyknyx.core.asyncEts import AsyncETS
+import asyncio
 from pyknyx.tools.deviceRunner import *
 import unittest
 
@@ -93,6 +95,29 @@ class SwitchTestCase(unittest.TestCase):
         self.ets2 = self.ets
         self._do_test()
 
+    def test_switch_async(self):
+        async def main():
+            ets = AsyncETS("1.2.0", transCls=None)
+            actor = Actor(ets, "1.2.3")
+            toggle = Toggle(ets, "1.2.4")
+            ets.start()
+            try:
+                afb = actor.fb["actor_fb"]
+                assert afb._current is None
+                await asyncio.sleep(0.5)
+                toggle.set(True)
+                await asyncio.sleep(0.1)
+                assert afb._current is True
+                assert toggle.status
+                toggle.set(False)
+                await asyncio.sleep(0.1)
+                assert afb._current is False
+                assert not toggle.status
+            finally:
+                ets.stop()
+
+        asyncio.run(main())
+
     def _do_test(self):
         self.actor = Actor(self.ets, "1.2.3")
         self.toggle = Toggle(self.ets2, "1.2.4")
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+
+from pyknyx.stack.asyncPriorityQueue import *
+from pyknyx.stack.priority import Priority
+import asyncio
+import unittest
+
+# Mute logger
+from pyknyx.services.logger import logging
+logger = logging.getLogger(__name__)
+logging.getLogger("pyknyx").setLevel(logging.ERROR)
+
+
+class AsyncPriorityQueueTestCase(unittest.TestCase):
+
+    def setUp(self):
+        pass
+
+    def tearDown(self):
+        pass
+
+    def test_constructor(self):
+        with self.assertRaises(PriorityQueueValueError):
+            AsyncPriorityQueue((1,))
+
+    def test_remove(self):
+        queue = AsyncPriorityQueue((-1, 3, 2, 1))
+        for i in range(4):
+            queue.add(("normal", i), Priority('normal'))
+            queue.add(("low", i), Priority('low'))
+        queue.add(("system", 0), Priority('system'))
+        self.assertEqual(len(queue), 9)
+        order = [queue.removeNoWait() for i in range(9)]
+        self.assertEqual(order[0], ("system", 0))
+        self.assertEqual(order[1:5], [("normal", 0), ("normal", 1), ("normal", 2), ("low", 0)])
+        with self.assertRaises(asyncio.QueueEmpty):
+            queue.removeNoWait()
+
+    def test_wait(self):
+        async def main():
+            queue = AsyncPriorityQueue((-1, 3, 2, 1))
+            loop = asyncio.get_running_loop()
+            loop.call_later(0.01, queue.addBatch, [(1, Priority('low')), (2, Priority('urgent'))])
+            return [await queue.remove(), await queue.remove()]
+
+        self.assertEqual(asyncio.run(main()), [2, 1])
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+
+from pyknyx.stack.bufferRing import *
+import unittest
+
+# Mute logger
+from pyknyx.services.logger import logging
+logger = logging.getLogger(__name__)
+logging.getLogger("pyknyx").setLevel(logging.ERROR)
+
+
+class BufferRingTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.ring = BufferRing(2, 16)
+
+    def tearDown(self):
+        pass
+
+    def test_constructor(self):
+        with self.assertRaises(BufferRingValueError):
+            BufferRing(0)
+        self.assertEqual(len(self.ring), 2)
+
+    def test_acquire(self):
+        buf1 = self.ring.acquire()
+        buf1.data[:3] = b"abc"
+        buf1.setLength(3)
+        self.assertEqual(buf1.frame, b"abc")
+        buf2 = self.ring.acquire()
+        self.assertIsNot(buf1, buf2)
+        buf3 = self.ring.acquire()  # ring exhausted
+        self.assertIsNot(buf3, buf1)
+        self.assertIsNot(buf3, buf2)
+        self.assertEqual(self.ring.overflows, 1)
+        buf1.release()
+        self.assertIsNone(buf1.frame)
+        self.assertIs(self.ring.acquire(), buf1)
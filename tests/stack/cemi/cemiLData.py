@@ -29,3 +29,25 @@ class CEMILDataTestCase(unittest.TestCase):
             import pdb;pdb.set_trace()
             CEMILData(b")\x03\xff\xff\xff\xbc\xd0\x11\x04\x10\x04\x03\x00\x80\x19,")  # ext frame
 
+
+    def test_messageCode(self):
+        with self.assertRaises(CEMIValueError):
+            CEMILData(b"\x00\x00\xbc\xd0\x11\x0e\x19\x02\x01\x00\x80")
+
+    def test_cache(self):
+        self.assertIs(self.frame2.destinationAddress, self.frame2.destinationAddress)
+        self.assertIs(self.frame2.sourceAddress, self.frame2.sourceAddress)
+        priority = self.frame2.priority
+        self.assertIs(self.frame2.priority, priority)
+        self.frame2.hopCount = 5
+        self.assertIs(self.frame2.priority, priority)
+        self.frame2.priority = Priority("urgent")
+        self.assertEqual(self.frame2.priority.level, Priority("urgent").level)
+        self.assertEqual(self.frame2.frame.ctrl1, 0xb8)
+        self.frame2.sourceAddress = "1.2.3"
+        self.assertEqual(self.frame2.sourceAddress, IndividualAddress("1.2.3"))
+        self.frame2.addressType = CEMILData.AT_INDIVIDUAL_ADDRESS
+        self.assertEqual(self.frame2.destinationAddress, IndividualAddress("1.9.2"))
+        self.frame2.destinationAddress = GroupAddress("1/1/1")
+        self.assertEqual(self.frame2.destinationAddress, GroupAddress("1/1/1"))
+        self.assertEqual(bytes(self.frame2.frame.raw), b")\x00\xb8\xd0\x12\x03\x09\x01\x01\x00\x80")
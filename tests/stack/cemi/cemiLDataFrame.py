@@ -121,3 +121,28 @@ class CEMILDataFrameTestCase(unittest.TestCase):
         self.assertEqual(self.frame1.npdu, b'\xff\xff')
         self.assertEqual(self.frame2.npdu, b'\x01\x00\x80')
         self.assertEqual(self.frame3.npdu, b'\x03\x00\x80\x19,')
+
+    def test_view(self):
+        buf = bytearray(b")\x00\xbc\xd0\x11\x0e\x19\x02\x01\x00\x80")
+        frame = CEMILDataFrame(memoryview(buf))
+        self.assertTrue(frame.isView)
+        buf[10] = 0x81
+        self.assertEqual(frame.npdu, b'\x01\x00\x81')
+        copy = frame.copy()
+        self.assertFalse(copy.isView)
+        frame.detach()
+        self.assertFalse(frame.isView)
+        buf[10] = 0x82
+        self.assertEqual(frame.npdu, b'\x01\x00\x81')
+        self.assertEqual(copy.npdu, b'\x01\x00\x81')
+        self.assertEqual(frame.dal, 2)
+
+    def test_decode(self):
+        self.assertEqual((self.frame5.ctrl1, self.frame5.sa, self.frame5.da), (0xbc, 0x1104, 0x1004))
+        self.frame5.da = 0x1234
+        self.frame5.dal = 0x56
+        self.assertEqual(self.frame5.raw[9:11], b'\x12\x56')
+        self.assertEqual(self.frame5.da, 0x1256)
+        self.assertEqual(self.frame5.sa, 0x1104)
+        with self.assertRaises(CEMIValueError):
+            CEMILDataFrame(b")\x03\xff\xff\xff\xbc\xd0\x11\x04")  # too short for the additional info
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 from pyknyx.stack.flags import *
+import pickle
 import unittest
 
 # Mute logger
@@ -48,3 +49,25 @@ class DFlagsTestCase(unittest.TestCase):
         self.assertTrue(self.flags("W"))
         self.assertTrue(self.flags("CRT"))
         self.assertTrue(self.flags("CRTWIUS"))
+
+    def test_shared(self):
+        self.assertIs(Flags("CWUI"), Flags("CWUI"))
+        self.assertIs(Flags(self.flags), self.flags)
+        self.assertIs(pickle.loads(pickle.dumps(self.flags)), self.flags)
+        self.assertEqual(Flags("CRT"), Flags())
+        self.assertNotEqual(Flags("CRT"), Flags("CR"))
+        self.assertEqual(Flags("CWUI").bits, 0x35)
+        flags = Flags("CT")
+        self.assertEqual((flags.communicate, flags.read, flags.write, flags.transmit), (True, False, False, True))
+        self.assertTrue(flags("TC"))
+        self.assertFalse(flags("CTW"))
+
+    def test_oldPickle(self):
+        for data in (b'\x80\x02cpyknyx.stack.flags\nFlags\nq\x00)\x81q\x01}q\x02'
+                     b'X\x04\x00\x00\x00_rawq\x03X\x03\x00\x00\x00CRTq\x04sb.',
+                     b'ccopy_reg\n_reconstructor\np0\n(cpyknyx.stack.flags\nFlags\np1\nc__builtin__\nobject\np2\nNtp3\n'
+                     b'Rp4\n(dp5\nV_raw\np6\nVCRT\np7\nsb.'):
+            flags = pickle.loads(data)
+            self.assertEqual(flags, Flags("CRT"))
+            self.assertEqual(flags.bits, Flags("CRT").bits)
+        self.assertEqual(Flags("CRT").raw, "CRT")
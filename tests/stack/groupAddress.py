@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 
 from pyknyx.stack.groupAddress import *
+import copy
+import pickle
 import unittest
 
 # Mute logger
@@ -89,10 +91,10 @@ class GroupAddressTestCase(unittest.TestCase):
         self.assertEqual(self.ad4.address, "1/0/2")
 
     def test_address2(self):
-        self.ad1.outFormatLevel = 2
-        self.ad2.outFormatLevel = 2
-        self.ad3.outFormatLevel = 2
-        self.ad4.outFormatLevel = 2
+        self.ad1 = GroupAddress(self.ad1, 2)
+        self.ad2 = GroupAddress(self.ad2, 2)
+        self.ad3 = GroupAddress(self.ad3, 2)
+        self.ad4 = GroupAddress(self.ad4, 2)
         self.assertEqual(self.ad1.address, "1/515")
         self.assertEqual(self.ad2.address, "1/2")
         self.assertEqual(self.ad3.address, "1/515")
@@ -111,10 +113,10 @@ class GroupAddressTestCase(unittest.TestCase):
         self.assertEqual(self.ad4.middle, 0)
 
     def test_middle2(self):
-        self.ad1.outFormatLevel = 2
-        self.ad2.outFormatLevel = 2
-        self.ad3.outFormatLevel = 2
-        self.ad4.outFormatLevel = 2
+        self.ad1 = GroupAddress(self.ad1, 2)
+        self.ad2 = GroupAddress(self.ad2, 2)
+        self.ad3 = GroupAddress(self.ad3, 2)
+        self.ad4 = GroupAddress(self.ad4, 2)
         self.assertEqual(self.ad1.middle, 0)
         self.assertEqual(self.ad2.middle, 0)
         self.assertEqual(self.ad3.middle, 0)
@@ -127,10 +129,10 @@ class GroupAddressTestCase(unittest.TestCase):
         self.assertEqual(self.ad4.sub, 2)
 
     def test_sub2(self):
-        self.ad1.outFormatLevel = 2
-        self.ad2.outFormatLevel = 2
-        self.ad3.outFormatLevel = 2
-        self.ad4.outFormatLevel = 2
+        self.ad1 = GroupAddress(self.ad1, 2)
+        self.ad2 = GroupAddress(self.ad2, 2)
+        self.ad3 = GroupAddress(self.ad3, 2)
+        self.ad4 = GroupAddress(self.ad4, 2)
         self.assertEqual(self.ad1.sub, 515)
         self.assertEqual(self.ad2.sub, 2)
         self.assertEqual(self.ad3.sub, 515)
@@ -138,8 +140,44 @@ class GroupAddressTestCase(unittest.TestCase):
 
     def test_outFormatLevel(self):
         self.assertEqual(self.ad1.outFormatLevel, 3)
-        with self.assertRaises(GroupAddressValueError):
-            self.ad1.outFormatLevel = 1
-        with self.assertRaises(GroupAddressValueError):
-            self.ad1.outFormatLevel = 4
-
+        with self.assertRaises(AttributeError):
+            self.ad1.outFormatLevel = 2
+        with self.assertRaises(GroupAddressValueError):
+            GroupAddress("1/2/3", 1)
+        with self.assertRaises(GroupAddressValueError):
+            GroupAddress("1/2/3", 4)
+
+    def test_intern(self):
+        self.assertIs(self.ad1, self.ad3)
+        self.assertIs(GroupAddress(2563), self.ad1)
+        self.assertIs(GroupAddress(" 1/2/3 "), self.ad1)
+        self.assertIs(GroupAddress(self.ad1), self.ad1)
+        ad = GroupAddress(self.ad1, 2)
+        self.assertIsNot(ad, self.ad1)
+        self.assertIs(GroupAddress(2563, 2), ad)
+        self.assertEqual(ad, self.ad1)
+        self.assertEqual(hash(ad), hash(self.ad1))
+        self.assertIs(pickle.loads(pickle.dumps(ad)), ad)
+        self.assertIs(copy.deepcopy(self.ad1), self.ad1)
+        self.assertEqual(GroupAddress("0/0/0").address, "0/0/0")
+
+        # Level 2 instances don't shadow tuple addresses
+        GroupAddress(1, 2)
+        self.assertEqual(GroupAddress((1, 2)).raw, 0x0802)
+        self.assertEqual(GroupAddress((1, 2), 2).address, "1/2")
+        with self.assertRaises(AttributeError):
+            self.ad1.foo = 1
+
+
+    def test_oldPickle(self):
+        data3 = (b'\x80\x02cpyknyx.stack.groupAddress\nGroupAddress\nq\x00)\x81q\x01}q\x02'
+                 b'(X\x0f\x00\x00\x00_outFormatLevelq\x03K\x03X\x04\x00\x00\x00_rawq\x04M\x03\nub.')
+        data2 = data3.replace(b'K\x03X', b'K\x02X')
+        data0 = (b'ccopy_reg\n_reconstructor\np0\n(cpyknyx.stack.groupAddress\nGroupAddress\np1\n'
+                 b'c__builtin__\nobject\np2\nNtp3\nRp4\n(dp5\nV_outFormatLevel\np6\nI3\nsV_raw\np7\nI2563\nsb.')
+        for data, address in ((data3, "1/2/3"), (data2, "1/515"), (data0, "1/2/3")):
+            ad = pickle.loads(data)
+            self.assertEqual(ad, self.ad1)
+            self.assertEqual(ad.address, address)
+        self.assertEqual(GroupAddress("0/0/0").address, "0/0/0")
+        self.assertEqual(GroupAddress(0, 2).address, "0/0")
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+
+from pyknyx.stack.groupAddressPattern import *
+import unittest
+
+# Mute logger
+from pyknyx.services.logger import logging
+logger = logging.getLogger(__name__)
+logging.getLogger("pyknyx").setLevel(logging.ERROR)
+
+
+class GroupAddressPatternTestCase(unittest.TestCase):
+
+    def setUp(self):
+        pass
+
+    def tearDown(self):
+        pass
+
+    def test_display(self):
+        self.assertEqual(repr(GroupAddressPattern(" 4/1/* ")), "<GroupAddressPattern('4/1/*')>")
+        self.assertEqual(str(GroupAddressPattern((GroupAddress("4/1/0"), "4/2/127"))), "4/1/0..4/2/127")
+
+    def test_constructor(self):
+        for pattern in ("4/1/*/*", "*", "32/*/*", "4/8/*", "4/1/256", "4/1/20-10", "4/2048", "4/a/*",
+                        "4/1/1..4/1/0", "4/1/1..foo", ("4/1/1",), 4):
+            with self.assertRaises(GroupAddressPatternValueError, msg=pattern):
+                GroupAddressPattern(pattern)
+
+    def test_isPattern(self):
+        for pattern in ("4/1/*", "4/*", "4/1/0-10", "4/1/0..4/1/10", GroupAddressPattern("4/1/*")):
+            self.assertTrue(GroupAddressPattern.isPattern(pattern))
+        for pattern in ("4/1/1", "4/1", GroupAddress("4/1/1"), (4, 1, 1), 2049):
+            self.assertFalse(GroupAddressPattern.isPattern(pattern))
+
+    def test_match(self):
+        for pattern, in_, out in (("4/1/*", ("4/1/0", "4/1/255"), ("4/0/255", "4/2/0")),
+                                  ("4/*/*", ("4/0/0", "4/7/255"), ("3/7/255", "5/0/0")),
+                                  ("4/*", ("4/0/0", "4/7/255"), ("3/7/255", "5/0/0")),
+                                  ("4/0-3/10-19", ("4/0/10", "4/3/19", "4/2/15"), ("4/0/9", "4/3/20", "4/4/15")),
+                                  ("4/100-199", ("4/0/100", "4/0/199"), ("4/0/99", "4/0/200")),
+                                  ("4/1/250..4/2/5", ("4/1/250", "4/2/5", "4/1/255"), ("4/1/249", "4/2/6"))):
+            pattern = GroupAddressPattern(pattern)
+            for gad in in_:
+                self.assertIn(GroupAddress(gad), pattern, (pattern, gad))
+            for gad in out:
+                self.assertNotIn(GroupAddress(gad), pattern, (pattern, gad))
+            self.assertEqual(len(pattern), len(list(pattern)))
+            self.assertEqual(len(pattern), sum(bin(byte).count("1") for byte in pattern.bits))
+
+    def test_eq(self):
+        self.assertEqual(GroupAddressPattern("4/1/*"), GroupAddressPattern("4/1/0-255"))
+        self.assertEqual(GroupAddressPattern("4/*/*"), GroupAddressPattern("4/*"))
+        self.assertEqual(GroupAddressPattern("4/*/*"), GroupAddressPattern("4/0/0..4/7/255"))
+        self.assertEqual(hash(GroupAddressPattern("4/*/*")), hash(GroupAddressPattern("4/*")))
+        self.assertNotEqual(GroupAddressPattern("4/1/*"), GroupAddressPattern("4/2/*"))
+        self.assertEqual(len(GroupAddressPattern("*/*/*").ranges), 1)
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 from pyknyx.stack.individualAddress import *
+import pickle
 import unittest
 
 # Mute logger
@@ -83,3 +84,20 @@ class IndividualAddressTestCase(unittest.TestCase):
         self.assertEqual(self.ad1.device, 3)
         self.assertEqual(self.ad2.device, 3)
 
+
+    def test_intern(self):
+        self.assertIs(self.ad1, self.ad2)
+        self.assertIs(IndividualAddress(4611), self.ad1)
+        self.assertIs(IndividualAddress(self.ad1), self.ad1)
+        self.assertIsNot(IndividualAddress(4611), KnxAddress(4611))
+        self.assertIs(pickle.loads(pickle.dumps(self.ad3)), self.ad3)
+
+    def test_oldPickle(self):
+        for data in (b'\x80\x02cpyknyx.stack.individualAddress\nIndividualAddress\nq\x00)\x81q\x01}q\x02'
+                     b'X\x04\x00\x00\x00_rawq\x03M\x03\x12sb.',
+                     b'ccopy_reg\n_reconstructor\np0\n(cpyknyx.stack.individualAddress\nIndividualAddress\np1\n'
+                     b'c__builtin__\nobject\np2\nNtp3\nRp4\n(dp5\nV_raw\np6\nI4611\nsb.'):
+            ad = pickle.loads(data)
+            self.assertEqual(ad, self.ad1)
+            self.assertEqual(ad.address, "1.2.3")
+        self.assertEqual(IndividualAddress("0.0.0").address, "0.0.0")
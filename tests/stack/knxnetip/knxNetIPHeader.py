@@ -46,3 +46,5 @@ class KNXnetIPHeaderTestCase(unittest.TestCase):
     def test_serviceName(self):
         self.assertEqual(self._header1.serviceName, "routing.ind")
         self.assertEqual(self._header2.serviceName, "routing.ind")
+        header = KNXnetIPHeader(frame=b"\x06\x10\x05\x32\x00\x0c\x06\x00\x00\x64\x00\x00")
+        self.assertEqual(header.serviceName, "routing-busy.msg")
@@ -1,6 +1,11 @@
 # -*- coding: utf-8 -*-
 
 from pyknyx.stack.layer7.a_groupDataService import *
+from pyknyx.core.groupListener import GroupListener
+from pyknyx.core.groupMonitorFilter import GroupMonitorFilter
+from pyknyx.core.groupMonitorListener import GroupMonitorListener
+from pyknyx.stack.individualAddress import IndividualAddress
+from pyknyx.stack.priority import Priority
 import unittest
 
 # Mute logger
@@ -12,7 +17,18 @@ logging.getLogger("pyknyx").setLevel(logging.ERROR)
 class A_GDSTestCase(unittest.TestCase):
 
     def setUp(self):
-        pass
+        class TGDS(object):
+            def __init__(self):
+                self.gads = []
+
+            def setListener(self, tgdl):
+                pass
+
+            def subscribeGroup(self, gad):
+                self.gads.append(gad)
+
+        self.tgds = TGDS()
+        self.agds = A_GroupDataService(self.tgds)
 
     def tearDown(self):
         pass
@@ -20,3 +36,97 @@ class A_GDSTestCase(unittest.TestCase):
     def test_constructor(self):
         pass
 
+
+    def test_groups(self):
+        group = self.agds.subscribe("1/1/1", GroupListener())
+        self.assertIs(self.agds.subscribe(GroupAddress("1/257", 2), GroupListener()), group)
+        monitor = self.agds.subscribe("0/0/0", GroupMonitorListener())
+        self.assertIs(self.agds.subscribe("0/0/0", GroupMonitorListener()), monitor)
+        self.assertIs(self.agds.groupMonitor, monitor)
+        self.assertEqual(self.tgds.gads, [GroupAddress("1/1/1"), GroupAddress("0/0/0")])
+
+        groups = self.agds.groups
+        self.assertEqual(list(groups.keys()), ["1/1/1"])
+        self.assertEqual(list(groups.values()), [group])
+        self.assertIs(groups["1/1/1"], group)
+        self.assertIs(groups[GroupAddress("1/1/1")], group)
+        self.assertIn("1/257", groups)
+        self.assertNotIn("1/1/2", groups)
+        self.assertNotIn("0/0/0", groups)
+        self.assertNotIn("foo", groups)
+        with self.assertRaises(KeyError):
+            groups["1/1/2"]
+        with self.assertRaises(TypeError):
+            groups["1/1/2"] = group
+
+    def test_groupDataInd(self):
+        received = []
+
+        class Listener(GroupListener):
+            def onWrite(self, src, data):
+                received.append(("write", src, bytes(data)))
+
+        class MonitorListener(GroupMonitorListener):
+            def onWrite(self, src, gad, priority, data):
+                received.append(("monitor write", src, gad, bytes(data)))
+
+        self.agds.subscribe("1/1/1", Listener())
+        src = IndividualAddress("1.1.1")
+        self.agds.groupDataInd(src, GroupAddress("1/1/1"), Priority("low"), bytearray(b"\x00\x81"))
+        self.assertEqual(received, [("write", src, b"\x01")])
+        del received[:]
+        self.agds.subscribe("0/0/0", MonitorListener())
+        self.agds.groupDataInd(src, GroupAddress("1/1/2"), Priority("low"), bytearray(b"\x00\x80\x12"))
+        self.assertEqual(received, [("monitor write", src, GroupAddress("1/1/2"), b"\x12")])
+
+    def test_monitorFilter(self):
+        received = []
+
+        class MonitorListener(GroupMonitorListener):
+            def onWrite(self, src, gad, priority, data):
+                received.append(gad.address)
+
+        with self.assertRaises(A_GDSValueError):
+            self.agds.subscribe("1/1/1", GroupListener(), GroupMonitorFilter(main=1))
+        self.agds.subscribe("0/0/0", MonitorListener(), GroupMonitorFilter(main=1, middle=2))
+        src = IndividualAddress("1.1.1")
+        for gad in ("1/1/255", "1/2/0", "1/2/255", "1/3/0"):
+            self.agds.groupDataInd(src, GroupAddress(gad), Priority("low"), bytearray(b"\x00\x81"))
+        self.assertEqual(received, ["1/2/0", "1/2/255"])
+
+    def test_wildcard(self):
+        received = []
+
+        class Listener(GroupListener):
+            def __init__(self, name):
+                super(Listener, self).__init__()
+                self.name = name
+
+            def onWrite(self, src, data, gad=None):
+                received.append((self.name, None if gad is None else gad.address))
+
+        group = self.agds.subscribe("4/1/*", Listener("4/1/*"))
+        self.assertIs(self.agds.subscribe("4/1/0-255", Listener("4/1/0-255")), group)
+        self.agds.subscribe("4/*/*", Listener("4/*/*"))
+        self.agds.subscribe("4/1/7", Listener("4/1/7"))
+        self.assertEqual(sorted(self.agds.wildcardGroups), ["4/*/*", "4/1/*"])
+        self.assertEqual(len(self.tgds.gads), 256 + 2048 + 1)
+        self.assertEqual(list(self.agds.groups), ["4/1/7"])
+
+        src = IndividualAddress("1.1.1")
+        for gad in ("4/1/7", "4/2/7", "5/1/7", "4/1/7"):
+            del received[:]
+            self.agds.groupDataInd(src, GroupAddress(gad), Priority("low"), bytearray(b"\x00\x81"))
+            if gad == "4/1/7":
+                self.assertEqual(sorted(received), [("4/*/*", "4/1/7"), ("4/1/*", "4/1/7"), ("4/1/0-255", "4/1/7"),
+                                                    ("4/1/7", None)])
+            elif gad == "4/2/7":
+                self.assertEqual(received, [("4/*/*", "4/2/7")])
+            else:
+                self.assertEqual(received, [])
+
+        self.agds.subscribe("*/*/*", Listener("all"))
+        self.assertEqual(self.tgds.gads[-1], GroupAddress("0/0/0"))
+        del received[:]
+        self.agds.groupDataInd(src, GroupAddress("5/1/7"), Priority("low"), bytearray(b"\x00\x81"))
+        self.assertEqual(received, [("all", "5/1/7")])
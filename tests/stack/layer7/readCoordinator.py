@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+
+from pyknyx.stack.layer7.readCoordinator import *
+from pyknyx.core.ets import ETS
+from pyknyx.core.groupListener import GroupListener
+from pyknyx.core.groupMonitorFilter import GroupMonitorFilter
+from pyknyx.core.groupMonitorListener import GroupMonitorListener
+from pyknyx.stack.groupAddress import GroupAddress
+from pyknyx.stack.priority import Priority
+from pyknyx.stack.stack import Stack
+from fakes import FakeClock, groupFrame
+import unittest
+
+# Mute logger
+from pyknyx.services.logger import logging
+logger = logging.getLogger(__name__)
+logging.getLogger("pyknyx").setLevel(logging.ERROR)
+
+
+class ReadCoordinatorTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.hits = []
+        self.coordinator = ReadCoordinator(window=0.5, maxAge=1., onCacheHit=self.hits.append,
+                                           clock=self.clock)
+        self.raw = GroupAddress("1/1/1").raw
+
+    def tearDown(self):
+        pass
+
+    def test_constructor(self):
+        with self.assertRaises(ReadCoordinatorValueError):
+            ReadCoordinator(window=-1)
+        with self.assertRaises(ReadCoordinatorValueError):
+            ReadCoordinator(maxAge=-1)
+
+    def test_coalesce(self):
+        self.assertEqual(self.coordinator.request(self.raw), (ReadCoordinator.SEND, None, None))
+        self.clock.now += 0.4
+        self.assertEqual(self.coordinator.request(self.raw), (ReadCoordinator.COALESCED, None, None))
+        self.assertEqual(self.coordinator.request(GroupAddress("1/1/2").raw), (ReadCoordinator.SEND, None, None))
+        self.clock.now += 0.1
+        self.assertEqual(self.coordinator.request(self.raw), (ReadCoordinator.SEND, None, None))
+
+        # Reads seen on the bus are merged too
+        self.coordinator.frameInd(groupFrame("1/1/3", 0x00))
+        self.assertEqual(self.coordinator.request(GroupAddress("1/1/3").raw), (ReadCoordinator.COALESCED, None, None))
+        self.assertEqual(self.coordinator.stats, dict(sent=3, coalesced=2, cached=0))
+
+    def test_cache(self):
+        self.assertEqual(self.coordinator.request(self.raw)[0], ReadCoordinator.SEND)
+        self.coordinator.frameInd(groupFrame("1/1/1", 0x40, b"\x12\x34"))  # response
+        self.assertEqual(self.coordinator.request(self.raw), (ReadCoordinator.CACHED, 0x110e, b"\x12\x34"))
+        self.clock.now += 1.
+        self.coordinator.frameInd(groupFrame("1/1/1", 0x81))  # write
+        self.clock.now += 1.
+        self.assertEqual(self.coordinator.request(self.raw), (ReadCoordinator.CACHED, 0x110e, b"\x01"))
+        self.assertEqual(self.hits, [self.raw, self.raw])
+        self.clock.now += 0.1
+        self.assertEqual(self.coordinator.request(self.raw)[0], ReadCoordinator.SEND)  # expired
+
+        coordinator = ReadCoordinator(maxAge=0)
+        coordinator.frameInd(groupFrame("1/1/1", 0x81))
+        self.assertEqual(coordinator.request(self.raw)[0], ReadCoordinator.SEND)
+
+    def test_stacks(self):
+        received = []
+
+        class Listener(GroupListener):
+            def __init__(self, name):
+                super(Listener, self).__init__()
+                self.name = name
+
+            def onResponse(self, src, data, gad=None):
+                received.append((self.name, src.address, bytes(data)))
+
+        class Source(object):
+            hop = False
+
+        ets = ETS("1.2.0", transCls=None)
+        stacks = [Stack(ets, "1.2.%d" % i) for i in range(3, 5)]
+        groups = [stack.agds.subscribe("1/1/1", Listener(i)) for i, stack in enumerate(stacks)]
+        groups[0].read(Priority("low"))
+        groups[1].read(Priority("low"))
+        self.assertEqual(len(ets._queue), 1)
+
+        ets.processFrame(Source(), groupFrame("1/1/1", 0x40, b"\x12"))  # response from 1.1.14
+        self.assertEqual(sorted(received), [(0, "1.1.14", b"\x12"), (1, "1.1.14", b"\x12")])
+        del received[:]
+        groups[1].read(Priority("low"))
+        self.assertEqual(received, [(1, "1.1.14", b"\x12")])
+        self.assertEqual(len(ets._queue), 1)
+        self.assertEqual(ets.readCoordinator.stats, dict(sent=1, coalesced=1, cached=1))
+
+    def test_cacheFanOut(self):
+        received = []
+
+        class Listener(GroupListener):
+            def onResponse(self, src, data, gad=None):
+                received.append(("group" if gad is None else "wildcard", bytes(data)))
+
+        class MonitorListener(GroupMonitorListener):
+            def onResponse(self, src, gad, priority, data):
+                received.append(("monitor", bytes(data)))
+
+        class Source(object):
+            hop = False
+
+        ets = ETS("1.2.0", transCls=None)
+        stack = Stack(ets, "1.2.3")
+        group = stack.agds.subscribe("1/1/1", Listener())
+        stack.agds.subscribe("1/1/*", Listener())
+        stack.agds.subscribe("0/0/0", MonitorListener(), GroupMonitorFilter(main=1))
+        ets.processFrame(Source(), groupFrame("1/1/1", 0x40, b"\x12"))  # response from 1.1.14
+        del received[:]
+
+        group.read(Priority("low"))
+        self.assertEqual(len(ets._queue), 0)
+        self.assertEqual(sorted(received), [("group", b"\x12"), ("monitor", b"\x12"), ("wildcard", b"\x12")])
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 
 from pyknyx.stack.multicastSocket import *
+import os
+import socket
 import unittest
 
 # Mute logger
@@ -20,3 +22,22 @@ class MulticastSocketTestCase(unittest.TestCase):
     def test_constructor(self):
         pass
 
+    def test_receiveBatch(self):
+        port = 20000 + os.getpid() % 20000
+        sock = MulticastSocketReceive("127.0.0.1", port, "224.55.36.71", port, timeout=0.1, rcvBuf=65536, batch=True)
+        tx = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            self.assertGreaterEqual(sock.rcvBuf, 65536)
+            self.assertEqual(sock.receiveBatch(), [])
+            for i in range(10):
+                tx.sendto(bytearray((i,)), ("127.0.0.1", port))
+            frames = sock.receiveBatch(4)
+            self.assertEqual([data for data, addr in frames], [b"\x00", b"\x01", b"\x02", b"\x03"])
+            frames = sock.receiveBatch()
+            self.assertEqual(len(frames), 6)
+            self.assertEqual(sock.receiveBatch(), [])
+            self.assertEqual(sock.dropped, 0)
+        finally:
+            tx.close()
+            sock.close()
+
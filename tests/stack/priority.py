@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 from pyknyx.stack.priority import *
+import pickle
 import unittest
 
 # Mute logger
@@ -47,3 +48,24 @@ class PriorityTestCase(unittest.TestCase):
         self.assertEqual(self.priority6.name, 'normal')
         self.assertEqual(self.priority7.name, 'urgent')
         self.assertEqual(self.priority8.name, 'low')
+
+    def test_singleton(self):
+        self.assertIs(self.priority1, self.priority5)
+        self.assertEqual(Priority(), self.priority4)
+        self.assertIs(Priority(self.priority2), self.priority2)
+        self.assertIs(pickle.loads(pickle.dumps(self.priority3)), self.priority3)
+        self.assertEqual(self.priority4, self.priority8)
+        self.assertNotEqual(self.priority1, self.priority2)
+        with self.assertRaises(AttributeError):
+            self.priority1.foo = 1
+
+    def test_oldPickle(self):
+        for data in (b'\x80\x02cpyknyx.stack.priority\nPriority\nq\x00)\x81q\x01}q\x02'
+                     b'X\x06\x00\x00\x00_levelq\x03K\x01sb.',
+                     b'ccopy_reg\n_reconstructor\np0\n(cpyknyx.stack.priority\nPriority\np1\n'
+                     b'c__builtin__\nobject\np2\nNtp3\nRp4\n(dp5\nV_level\np6\nI1\nsb.'):
+            priority = pickle.loads(data)
+            self.assertEqual(priority, self.priority2)
+            self.assertEqual(priority.name, 'normal')
+        self.assertEqual(self.priority4.level, 0x03)
+        self.assertEqual(Priority('low').level, 0x03)
@@ -1,6 +1,9 @@
 # -*- coding: utf-8 -*-
 
 from pyknyx.stack.priorityQueue import *
+from pyknyx.stack.priority import Priority
+import threading
+import time
 import unittest
 
 # Mute logger
@@ -20,3 +23,105 @@ class PriorityQueueTestCase(unittest.TestCase):
     def test_constructor(self):
         pass
 
+    def test_addBatch(self):
+        queue = PriorityQueue((-1, 3, 2, 1))
+        queue.addBatch([(1, Priority('low')), (2, Priority('low')), (3, Priority('low'))])
+        queue.addBatch([])
+        self.assertEqual([queue.remove() for i in range(3)], [1, 2, 3])
+
+
+    def test_distribution(self):
+        queue = PriorityQueue((-1, 3, 2, 1))
+        for i in range(5):
+            queue.add(("normal", i), Priority('normal'))
+        for i in range(2):
+            queue.add(("low", i), Priority('low'))
+        for i in range(3):
+            queue.add(("system", i), Priority('system'))
+        self.assertEqual(len(queue), 10)
+        self.assertEqual([queue.remove() for i in range(10)],
+                         [("system", 0), ("system", 1), ("system", 2),
+                          ("normal", 0), ("normal", 1), ("normal", 2), ("low", 0),
+                          ("normal", 3), ("normal", 4), ("low", 1)])
+        self.assertEqual(len(queue), 0)
+
+    def test_removeBatch(self):
+        queue = PriorityQueue((-1, 3, 2, 1))
+        self.assertEqual(queue.removeBatch(10, timeout=0.01), [])
+        for i in range(5):
+            queue.add(i, Priority('low'))
+        queue.add("s", Priority('system'))
+        self.assertEqual(queue.removeBatch(4), ["s", 0, 1, 2])
+        self.assertEqual(queue.removeBatch(4), [3, 4])
+        threading.Timer(0.05, queue.add, (5, Priority('low'))).start()
+        self.assertEqual(queue.removeBatch(4, timeout=2), [5])
+
+    def test_capacity(self):
+        self.assertRaises(PriorityQueueValueError, PriorityQueue, (-1, 3, 2, 1), 0)
+        self.assertRaises(PriorityQueueValueError, PriorityQueue, (-1, 3, 2, 1), (1, 2))
+        self.assertRaises(PriorityQueueValueError, PriorityQueue, (-1, 3, 2, 1), 1, "drop-all")
+
+    def test_dropOldest(self):
+        dropped = []
+        queue = PriorityQueue((-1, 3, 2, 1), 2, onDrop=dropped.append)
+        for i in range(4):
+            self.assertTrue(queue.add(i, Priority('low')))
+        queue.add("s", Priority('system'))
+        self.assertEqual(dropped, [0, 1])
+        self.assertEqual(queue.stats, dict(depth=[1, 0, 0, 2], highWater=[1, 0, 0, 2], dropped=[0, 0, 0, 2]))
+        self.assertEqual(queue.removeBatch(4), ["s", 2, 3])
+
+    def test_dropNewest(self):
+        dropped = []
+        queue = PriorityQueue((-1, 3, 2, 1), (None, None, None, 2), "drop-newest", onDrop=dropped.append)
+        self.assertEqual([queue.add(i, Priority('low')) for i in range(4)], [True, True, False, False])
+        self.assertTrue(queue.add(4, Priority('low'), force=True))
+        queue.addBatch([(5, Priority('low')), (6, Priority('normal'))])
+        self.assertEqual(dropped, [2, 3, 5])
+        self.assertEqual(queue.removeBatch(5), [6, 0, 1, 4])
+        self.assertEqual(queue.stats["highWater"], [0, 1, 0, 3])
+
+    def test_block(self):
+        queue = PriorityQueue((-1, 3, 2, 1), 1, "block", timeout=0.05)
+        queue.add(0, Priority('low'))
+        self.assertFalse(queue.add(1, Priority('low')))
+        threading.Timer(0.05, queue.remove).start()
+        queue._timeout = 2
+        self.assertTrue(queue.add(2, Priority('low')))
+        self.assertEqual(queue.removeBatch(4), [2])
+        self.assertEqual(queue.stats["dropped"], [0, 0, 0, 1])
+
+        # The consumer thread doesn't wait for itself
+        queue.add(3, Priority('low'))
+        self.assertEqual(queue.removeBatch(1), [3])
+        queue.add(4, Priority('low'))
+        start = time.time()
+        self.assertFalse(queue.add(5, Priority('low')))
+        self.assertLess(time.time() - start, 1)
+        self.assertEqual(queue.stats["dropped"], [0, 0, 0, 2])
+
+    def test_blockLevels(self):
+        queue = PriorityQueue((-1, 3, 2, 1), 1, "block", timeout=2)
+        queue.add(0, Priority('normal'))
+        queue.add(1, Priority('low'))
+        done = {}
+
+        def produce(obj, priority):
+            start = time.time()
+            queue.add(obj, Priority(priority))
+            done[priority] = time.time() - start
+
+        producers = [threading.Thread(target=produce, args=(2, 'low')),
+                     threading.Thread(target=produce, args=(3, 'normal'))]
+        for producer in producers:
+            producer.start()
+        time.sleep(0.1)  # both producers are blocked
+        self.assertEqual(queue.remove(), 0)
+        producers[1].join(1)
+        self.assertLess(done.get('normal', 2), 1)
+        self.assertNotIn('low', done)
+        self.assertEqual(queue.remove(), 3)
+        self.assertEqual(queue.remove(), 1)
+        producers[0].join(1)
+        self.assertLess(done['low'], 1)
+        self.assertEqual(queue.remove(), 2)
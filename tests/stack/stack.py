@@ -1,6 +1,12 @@
 # -*- coding: utf-8 -*-
 
 from pyknyx.stack.stack import *
+from pyknyx.core.ets import ETS
+from pyknyx.core.groupListener import GroupListener
+from pyknyx.core.groupMonitorListener import GroupMonitorListener
+from pyknyx.stack.cemi.cemi import CEMIValueError
+from pyknyx.stack.cemi.cemiLData import CEMILData
+import random
 import unittest
 
 # Mute logger
@@ -20,3 +26,69 @@ class StackTestCase(unittest.TestCase):
     def test_constructor(self):
         pass
 
+    def test_groupTelegram(self):
+        """ The fused group telegram decoder must behave as the layered path, for any frame
+        """
+        received = []
+
+        class Listener(GroupListener):
+            def onWrite(self, src, data):
+                received.append(("write", src.address, bytes(data)))
+
+            def onRead(self, src):
+                received.append(("read", src.address))
+
+            def onResponse(self, src, data):
+                received.append(("response", src.address, bytes(data)))
+
+        class MonitorListener(GroupMonitorListener):
+            def onWrite(self, src, gad, priority, data):
+                received.append(("monitor write", src.address, gad.address, priority.level, bytes(data)))
+
+            def onRead(self, src, gad, priority):
+                received.append(("monitor read", src.address, gad.address, priority.level))
+
+            def onResponse(self, src, gad, priority, data):
+                received.append(("monitor response", src.address, gad.address, priority.level, bytes(data)))
+
+        ets = ETS("1.2.0", transCls=None)
+        stack = Stack(ets, "1.2.3")
+        stack.agds.subscribe("1/1/1", Listener())
+        stack.agds.subscribe("0/0/0", MonitorListener())
+
+        def randomFrame(rand):
+            addIL = rand.choice((0, 0, 0, 2))
+            frame = bytearray((rand.choice((0x29, 0x29, 0x29, 0x11, 0x2e)), addIL))
+            frame += bytearray(rand.randrange(256) for i in range(addIL))
+            frame.append(rand.randrange(256) | rand.choice((0x80, 0x80, 0x80, 0x00)))  # ctrl1; mostly std frames
+            frame.append(rand.randrange(256))  # ctrl2
+            frame += bytearray(divmod(rand.choice((0x1203, 0x1101, rand.randrange(0x10000))), 256))  # sa
+            frame += bytearray(divmod(rand.choice((0x0901, 0x0000, rand.randrange(0x10000))), 256))  # da
+            tpci = rand.choice((0x00, 0x00, 0x00, rand.randrange(256)))
+            apci = rand.choice((0x000, 0x040, 0x080, rand.randrange(0x400)))
+            npdu = bytearray((tpci | apci >> 8, apci & 0xff))[:rand.choice((0, 1, 2, 2, 2))]
+            npdu += bytearray(rand.randrange(256) for i in range(rand.choice((0, 0, 1, 2, 4))))
+            frame.append(len(npdu))
+            frame += npdu
+            return frame
+
+        rand = random.Random(20)
+        for i in range(20000):
+            frame = randomFrame(rand)
+            results = []
+            for gtl in (None, stack.agds):
+                stack._lds.setGroupTelegramListener(gtl)
+                try:
+                    cEMI = CEMILData(memoryview(bytearray(frame)))
+                except CEMIValueError:
+                    break
+                del received[:]
+                try:
+                    stack._lds.dataInd(cEMI)
+                except Exception as e:
+                    received.append(type(e))
+                results.append(list(received))
+            else:
+                self.assertEqual(results[1], results[0], repr(frame))
+        stack._lds.setGroupTelegramListener(stack.agds)
+
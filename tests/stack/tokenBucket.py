@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+
+from pyknyx.stack.tokenBucket import *
+from fakes import FakeClock
+import unittest
+
+# Mute logger
+from pyknyx.services.logger import logging
+logger = logging.getLogger(__name__)
+logging.getLogger("pyknyx").setLevel(logging.ERROR)
+
+
+class TokenBucketTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.bucket = TokenBucket(50, burst=2, clock=self.clock)
+
+    def tearDown(self):
+        pass
+
+    def test_constructor(self):
+        with self.assertRaises(TokenBucketValueError):
+            TokenBucket(0)
+        with self.assertRaises(TokenBucketValueError):
+            TokenBucket(50, burst=0)
+
+    def test_take(self):
+        self.assertEqual(self.bucket.take(), 0.)
+        self.assertEqual(self.bucket.take(), 0.)
+        self.assertAlmostEqual(self.bucket.take(), 0.02)
+        self.clock.now += 0.01
+        self.assertAlmostEqual(self.bucket.take(), 0.01)
+        self.clock.now += 0.01
+        self.assertEqual(self.bucket.take(), 0.)
+        self.clock.now += 10.
+        self.assertEqual(self.bucket.take(), 0.)
+        self.assertEqual(self.bucket.take(), 0.)
+        self.assertNotEqual(self.bucket.take(), 0.)
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+
+from pyknyx.stack.transceiver.asyncUdpTransceiver import *
+from pyknyx.core.asyncEts import AsyncETS
+import asyncio
+import os
+import socket
+import unittest
+
+# Mute logger
+from pyknyx.services.logger import logging
+logger = logging.getLogger(__name__)
+logging.getLogger("pyknyx").setLevel(logging.ERROR)
+
+
+class AsyncUDPTransceiverTestCase(unittest.TestCase):
+
+    def setUp(self):
+        pass
+
+    def tearDown(self):
+        pass
+
+    def test_receive(self):
+        port = 20000 + (os.getpid() + 2) % 20000
+
+        async def main():
+            ets = AsyncETS("1.2.0", transCls=None)
+            frames = []
+            ets.putFrame = lambda l2, cEMI: frames.append(cEMI)
+            tc = AsyncUDPTransceiver(ets, mcastAddr="224.55.36.71", mcastPort=port)
+            tx = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            tc.start()
+            try:
+                await asyncio.sleep(0.05)
+                for i in range(3):
+                    tx.sendto(b"\x06\x10\x05\x30\x00\x11\x29\x00\xbc\xd0\x11\x0e\x19\x02\x01\x00\x80", ("127.0.0.1", port))
+                tx.sendto(b"garbage", ("127.0.0.1", port))
+                await asyncio.sleep(0.2)
+            finally:
+                tc.stop()
+                tx.close()
+            return frames, tc.stats
+
+        frames, stats = asyncio.run(main())
+        self.assertEqual(len(frames), 3)
+        self.assertEqual(frames[0].destinationAddress.address, "3/1/2")
+        self.assertEqual(stats['frames'], 3)
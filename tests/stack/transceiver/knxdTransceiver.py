@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+
+from pyknyx.stack.transceiver.knxdTransceiver import *
+from pyknyx.core.ets import ETS
+import socket
+import struct
+import threading
+import time
+import unittest
+
+# Mute logger
+from pyknyx.services.logger import logging
+logger = logging.getLogger(__name__)
+logging.getLogger("pyknyx").setLevel(logging.ERROR)
+
+CEMI_IND = b"\x29\x00\xbc\xd0\x11\x0e\x19\x02\x01\x00\x80"
+
+
+class FakeKnxd(threading.Thread):
+    """ Minimal knxd, accepting one group socket client
+    """
+    def __init__(self):
+        super(FakeKnxd, self).__init__()
+        self.daemon = True
+        self.server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.server.bind(("127.0.0.1", 0))
+        self.server.listen(1)
+        self.port = self.server.getsockname()[1]
+        self.conn = None
+        self.received = []
+        self.opened = threading.Event()
+
+    def run(self):
+        self.conn, _ = self.server.accept()
+        data = b""
+        while True:
+            chunk = self.conn.recv(4096)
+            if not chunk:
+                return
+            data += chunk
+            while len(data) >= 2:
+                length, = struct.unpack(">H", data[:2])
+                if len(data) < 2 + length:
+                    break
+                msg, data = data[2:2+length], data[2+length:]
+                if struct.unpack(">H", msg[:2])[0] == 0x26:
+                    self.conn.send(b"\x00\x02\x00\x26")
+                    self.opened.set()
+                else:
+                    self.received.append(msg)
+
+    def stop(self):
+        if self.conn is not None:
+            self.conn.close()
+        self.server.close()
+
+
+class KnxdTransceiverTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.knxd = FakeKnxd()
+        self.knxd.start()
+        self.ets = ETS("1.2.0", transCls=None)
+        self.frames = []
+        self.ets.putFrames = lambda l2, cEMIs: self.frames.extend(cEMIs)
+        self.tc = KnxdTransceiver(self.ets, url="ip:127.0.0.1:%d" % self.knxd.port)
+        self.tc.start()
+        self.assertTrue(self.knxd.opened.wait(2))
+
+    def tearDown(self):
+        self.tc.stop()
+        self.knxd.stop()
+
+    def _wait(self, cond, timeout=2.):
+        end = time.time() + timeout
+        while not cond() and time.time() < end:
+            time.sleep(0.01)
+
+    def test_constructor(self):
+        with self.assertRaises(KnxdTransceiverValueError):
+            KnxdTransceiver(ETS("1.2.0", transCls=None), url="knxd")
+        self._wait(lambda: self.tc.connected)
+        self.assertTrue(self.tc.connected)
+
+    def test_send(self):
+        for i in range(5):
+            self.tc.dataInd(CEMILData(CEMI_IND))
+        self._wait(lambda: len(self.knxd.received) == 5)
+        self.assertEqual(self.knxd.received, 5 * [b"\x00\x27\x19\x02\x00\x80"])
+
+    def test_receive(self):
+        packet = b"\x00\x08\x00\x27\x11\x0e\x19\x02\x00\x81"
+        self.knxd.conn.send(packet + packet[:5])  # second packet split
+        time.sleep(0.05)
+        self.knxd.conn.send(packet[5:])
+        self._wait(lambda: len(self.frames) == 2)
+        self.assertEqual(len(self.frames), 2)
+        cEMI = self.frames[0]
+        self.assertEqual(cEMI.messageCode, CEMILData.MC_LDATA_IND)
+        self.assertEqual(cEMI.sourceAddress.address, "1.1.14")
+        self.assertEqual(cEMI.destinationAddress.address, "3/1/2")
+        self.assertEqual(cEMI.npdu, b"\x01\x00\x81")
+        self.assertEqual(self.tc.stats['received'], 2)
@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+
+from pyknyx.stack.transceiver.tunnelTransceiver import *
+from pyknyx.core.ets import ETS
+import select
+import socket
+import struct
+import threading
+import time
+import unittest
+
+# Mute logger
+from pyknyx.services.logger import logging
+logger = logging.getLogger(__name__)
+logging.getLogger("pyknyx").setLevel(logging.ERROR)
+
+CEMI_IND = b"\x29\x00\xbc\xd0\x11\x0e\x19\x02\x01\x00\x80"
+
+
+class FakeGateway(threading.Thread):
+    """ Minimal KNXnet/IP tunnelling server
+
+    Tunnelling frames use a separate data endpoint, unless nat is set (then the CONNECT_RES gives 0.0.0.0:0).
+    """
+    def __init__(self, dropAcks=0, ackDelay=0., nat=False):
+        super(FakeGateway, self).__init__()
+        self.daemon = True
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind(("127.0.0.1", 0))
+        self.port = self.sock.getsockname()[1]
+        if nat:
+            self.dataSock = self.sock
+            self.hpai = struct.pack(">BB4sH", 8, 1, socket.inet_aton("0.0.0.0"), 0)
+        else:
+            self.dataSock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            self.dataSock.bind(("127.0.0.1", 0))
+            self.hpai = struct.pack(">BB4sH", 8, 1, socket.inet_aton("127.0.0.1"), self.dataSock.getsockname()[1])
+        self.misrouted = 0
+        self.dropAcks = dropAcks
+        self.ackDelay = ackDelay
+        self.requests = []
+        self.maxInFlight = 0
+        self.heartbeats = 0
+        self.client = None
+        self.seq = 0
+        self.running = True
+        self._pending = []
+
+    def send(self, service, body, sock=None):
+        (sock or self.sock).sendto(struct.pack(">2B2H", 6, 0x10, service, 6 + len(body)) + body, self.client)
+
+    def sendInd(self, cEMI):
+        self.send(0x0420, struct.pack(">4B", 4, 7, self.seq, 0) + cEMI, self.dataSock)
+        self.seq = (self.seq + 1) & 0xff
+
+    def run(self):
+        while self.running:
+            now = time.time()
+            for item in [item for item in self._pending if item[0] <= now]:
+                self._pending.remove(item)
+                self.send(0x0421, struct.pack(">4B", 4, 7, item[1], 0), self.dataSock)
+            ready = select.select([self.sock, self.dataSock], [], [], 0.05)[0]
+            if not ready:
+                continue
+            data, self.client = ready[0].recvfrom(1024)
+            service, = struct.unpack(">H", data[2:4])
+            body = data[6:]
+            if self.dataSock is not self.sock and (ready[0] is self.dataSock) != (service in (0x0420, 0x0421)):
+                self.misrouted += 1
+            if service == 0x0205:  # connect.req
+                self.send(0x0206, b"\x07\x00" + self.hpai + b"\x04\x04\x12\x05")
+            elif service == 0x0207:  # connectionstate.req
+                self.heartbeats += 1
+                self.send(0x0208, b"\x07\x00")
+            elif service == 0x0209:  # disconnect.req
+                self.send(0x020a, b"\x07\x00")
+            elif service == 0x0420:  # tunneling.req
+                seq = body[2]
+                self.requests.append((seq, bytes(body[4:])))
+                self.maxInFlight = max(self.maxInFlight, len(self._pending) + 1)
+                if self.dropAcks:
+                    self.dropAcks -= 1
+                    continue
+                self._pending.append((time.time() + self.ackDelay, seq))
+            elif service == 0x0421:  # tunneling.ack
+                pass
+
+    def stop(self):
+        self.running = False
+        if self.is_alive():
+            self.join()
+        self.sock.close()
+        self.dataSock.close()
+
+
+class TunnelTransceiverTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.gateway = FakeGateway()
+        self.ets = ETS("1.2.0", transCls=None)
+        self.frames = []
+        self.ets.putFrame = lambda l2, cEMI: self.frames.append(cEMI)
+        self.tc = None
+
+    def tearDown(self):
+        if self.tc is not None:
+            self.tc.stop()
+        self.gateway.stop()
+
+    def _start(self, **kwargs):
+        self.gateway.start()
+        self.tc = TunnelTransceiver(self.ets, "127.0.0.1", self.gateway.port, **kwargs)
+        self.tc.start()
+        for i in range(50):
+            if self.tc.connected:
+                break
+            time.sleep(0.01)
+        self.assertTrue(self.tc.connected)
+
+    def _sendFrames(self, n):
+        for i in range(n):
+            self.tc.dataInd(CEMILData(CEMI_IND))
+
+    def _wait(self, cond, timeout=2.):
+        end = time.time() + timeout
+        while not cond() and time.time() < end:
+            time.sleep(0.01)
+
+    def test_constructor(self):
+        with self.assertRaises(TunnelTransceiverValueError):
+            TunnelTransceiver(self.ets, "127.0.0.1", window=0)
+
+    def test_connect(self):
+        self._start()
+        self.assertEqual(self.tc.tunnelAddr.address, "1.2.5")
+        self.assertEqual(self.tc.stats['connects'], 1)
+
+    def test_send(self):
+        self._start()
+        self._sendFrames(3)
+        self._wait(lambda: self.tc.stats['acked'] == 3)
+        self.assertEqual([seq for seq, cEMI in self.gateway.requests], [0, 1, 2])
+        self.assertEqual(self.gateway.requests[0][1][0], CEMILData.MC_LDATA_REQ)
+        self.assertEqual(self.gateway.maxInFlight, 1)
+        self.assertEqual(self.gateway.misrouted, 0)
+
+    def test_window(self):
+        self.gateway.ackDelay = 0.2
+        self._start(window=4)
+        self._sendFrames(8)
+        self._wait(lambda: self.tc.stats['acked'] == 8)
+        self.assertEqual(self.tc.stats['acked'], 8)
+        self.assertEqual(self.gateway.maxInFlight, 4)
+
+    def test_resend(self):
+        self.gateway.dropAcks = 1
+        TunnelTransceiver.TUNNELING_REQUEST_TIMEOUT, timeout = 0.2, TunnelTransceiver.TUNNELING_REQUEST_TIMEOUT
+        try:
+            self._start()
+            self._sendFrames(1)
+            self._wait(lambda: self.tc.stats['acked'] == 1)
+        finally:
+            TunnelTransceiver.TUNNELING_REQUEST_TIMEOUT = timeout
+        self.assertEqual(self.tc.stats['resent'], 1)
+        self.assertEqual([seq for seq, cEMI in self.gateway.requests], [0, 0])
+
+    def test_heartbeat(self):
+        self._start()
+        self.tc.HEARTBEAT_INTERVAL = 0.05
+        self.tc._nextHeartbeat = 0
+        self._wait(lambda: self.gateway.heartbeats >= 2)
+        self.assertGreaterEqual(self.gateway.heartbeats, 2)
+        self.assertTrue(self.tc.connected)
+
+    def test_receive(self):
+        self._start()
+        self.gateway.sendInd(CEMI_IND)
+        self.gateway.seq = 0
+        self.gateway.sendInd(CEMI_IND)  # repeated
+        self.gateway.sendInd(CEMI_IND)
+        self._wait(lambda: len(self.frames) == 2)
+        time.sleep(0.1)
+        self.assertEqual(len(self.frames), 2)
+        self.assertEqual(self.frames[0].destinationAddress.address, "3/1/2")
+        self.assertEqual(self.gateway.misrouted, 0)
+        self.assertEqual(self.tc.dataEndpoint, self.gateway.dataSock.getsockname())
+
+    def test_nat(self):
+        self.gateway.stop()
+        self.gateway = FakeGateway(nat=True)
+        self._start()
+        self.assertEqual(self.tc.dataEndpoint, ("127.0.0.1", self.gateway.port))
+        self._sendFrames(2)
+        self._wait(lambda: self.tc.stats['acked'] == 2)
+        self.gateway.sendInd(CEMI_IND)
+        self._wait(lambda: len(self.frames) == 1)
+        self.assertEqual(len(self.frames), 1)
+        self.assertEqual(self.gateway.misrouted, 0)
+
+    def test_shortFrames(self):
+        self.tc = tc = TunnelTransceiver(self.ets, "127.0.0.1", self.gateway.port)
+        with self.assertLogs("pyknyx.stack.transceiver.tunnelTransceiver", logging.WARNING) as logs:
+            for service, body in ((0x0421, b"\x04\x07\x00"), (0x0420, b"\x04\x07\x00"), (0x0206, b"\x07")):
+                tc._handleFrame(bytearray(struct.pack(">2B2H", 6, 0x10, service, 6 + len(body)) + body), time.time())
+        self.assertEqual(len(logs.output), 3)
+        self.assertTrue(all("too short" in output for output in logs.output))
@@ -1,6 +1,9 @@
 # -*- coding: utf-8 -*-
 
 from pyknyx.stack.transceiver.udpTransceiver import *
+from pyknyx.core.ets import ETS
+import os
+import time
 import unittest
 
 # Mute logger
@@ -20,3 +23,68 @@ class UDPTransceiverTestCase(unittest.TestCase):
     def test_constructor(self):
         pass
 
+    def test_batchReceive(self):
+        port = 20000 + os.getpid() % 20000
+        ets = ETS("1.2.0", transCls=None)
+        frames = []
+        ets.putFrames = lambda l2, cEMIs: frames.extend(cEMIs)
+        tc = UDPTransceiver(ets, mcastAddr="224.55.36.71", mcastPort=port, batchSize=16, rcvBuf=65536)
+        tx = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        tc.start()
+        try:
+            for i in range(5):
+                tx.sendto(b"\x06\x10\x05\x30\x00\x11\x29\x00\xbc\xd0\x11\x0e\x19\x02\x01\x00\x80", ("127.0.0.1", port))
+            tx.sendto(b"garbage", ("127.0.0.1", port))
+            time.sleep(0.5)
+        finally:
+            tc.stop()
+            tx.close()
+        self.assertEqual(len(frames), 5)
+        self.assertEqual(frames[0].destinationAddress.address, "3/1/2")
+        stats = tc.stats
+        self.assertEqual(stats['frames'], 5)
+        self.assertEqual(sum(n * count for n, count in stats['batchSizes'].items()), 6)
+        self.assertLessEqual(stats['maxBatch'], 16)
+
+
+    def test_ringReceive(self):
+        port = 20000 + (os.getpid() + 1) % 20000
+        ets = ETS("1.2.0", transCls=None)
+        frames = []
+        ets.putFrames = lambda l2, cEMIs: frames.extend(cEMIs)
+        tc = UDPTransceiver(ets, mcastAddr="224.55.36.71", mcastPort=port, batchSize=16, ringSize=8)
+        tx = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        tc.start()
+        try:
+            for i in range(3):
+                tx.sendto(b"\x06\x10\x05\x30\x00\x11\x29\x00\xbc\xd0\x11\x0e\x19\x02\x01\x00\x80", ("127.0.0.1", port))
+            tx.sendto(b"garbage", ("127.0.0.1", port))
+            time.sleep(0.5)
+        finally:
+            tc.stop()
+            tx.close()
+        self.assertEqual(len(frames), 3)
+        self.assertTrue(frames[0].frame.isView)
+        self.assertEqual(frames[0].destinationAddress.address, "3/1/2")
+        frames[0].keep()
+        self.assertFalse(frames[0].frame.isView)
+        self.assertEqual(frames[0].destinationAddress.address, "3/1/2")
+        for cEMI in frames[1:]:
+            cEMI.release()
+        self.assertEqual(tc.stats['ringOverflows'], 0)
+
+    def test_flowControl(self):
+        ets = ETS("1.2.0", transCls=None)
+        tc = UDPTransceiver(ets, mcastAddr="224.55.36.71", mcastPort=20000 + (os.getpid() + 3) % 20000, rate=50)
+        try:
+            self.assertIsNone(tc._decodeFrame(b"\x06\x10\x05\x31\x00\x0a\x04\x00\x00\x03", "10.0.0.1", 3671))
+            self.assertEqual(tc.stats['lost'], 3)
+            self.assertEqual(tc._transmitDelay(), 0.)
+            self.assertGreater(tc._transmitDelay(), 0.)
+            self.assertIsNone(tc._decodeFrame(b"\x06\x10\x05\x32\x00\x0c\x06\x00\x00\x64\x00\x00", "10.0.0.1", 3671))
+            self.assertEqual(tc.stats['busy'], 1)
+            self.assertGreater(tc._transmitDelay(), 0.09)
+        finally:
+            tc.stop()
+        with self.assertRaises(UDPTransceiverValueError):
+            UDPTransceiver(ETS("1.2.0", transCls=None), mcastAddr="224.55.36.71", mcastPort=3671, rate=-1)